@@ -113,3 +113,44 @@ def test_cat_out():
         dtypes=consts.FLOAT_DTYPES + consts.INT_DTYPES,
     )
     bench.run()
+
+
+class MultiInputCatBenchmark(base.GenericBenchmark):
+    """Concatenations of many inputs, the first dim of a shape is their number."""
+
+    DEFAULT_SHAPE_DESC = "num_inputs, M, N"
+
+    def set_more_shapes(self):
+        return [(n, 64, 128) for n in (2, 8, 64, 256)]
+
+    def set_more_metrics(self):
+        return ["gbps"]
+
+    def get_gbps(self, args, latency):
+        io_amount = 2 * sum(t.numel() * t.element_size() for t in args[0])
+        return io_amount * 1e-9 / (latency * 1e-3)
+
+
+def multi_input_fn(shape, dtype, device):
+    num_inputs, *inp_shape = shape
+    inp = [
+        utils.generate_tensor_input(inp_shape, dtype, device) for _ in range(num_inputs)
+    ]
+    yield inp, {"dim": 0},
+
+    if base.Config.bench_level == consts.BenchLevel.COMPREHENSIVE:
+        yield inp, {"dim": -1},
+
+
+@pytest.mark.cat_many
+@pytest.mark.skipif(
+    flag_gems.vendor_name == "tsingmicro", reason="Issue #4131: not working"
+)
+def test_cat_many():
+    bench = MultiInputCatBenchmark(
+        op_name="cat_many",
+        input_fn=multi_input_fn,
+        torch_op=torch.cat,
+        dtypes=consts.FLOAT_DTYPES,
+    )
+    bench.run()
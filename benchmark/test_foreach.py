@@ -0,0 +1,116 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+from . import base, consts, utils
+
+
+class ForeachBenchmark(base.GenericBenchmark):
+    """Ops over lists of tensors, the first dim of a shape is their number."""
+
+    DEFAULT_SHAPE_DESC = "num_tensors, M, N"
+
+    def set_more_shapes(self):
+        return [(n, 256, 256) for n in (16, 256, 1024)]
+
+    def set_more_metrics(self):
+        return ["gbps"]
+
+    def get_gbps(self, args, latency):
+        io_amount = sum(
+            t.numel() * t.element_size()
+            for arg in args
+            if isinstance(arg, (list, tuple))
+            for t in arg
+        )
+        # the first list is also written
+        io_amount += sum(t.numel() * t.element_size() for t in args[0])
+        return io_amount * 1e-9 / (latency * 1e-3)
+
+
+def _tensor_lists(num_lists):
+    def input_fn(shape, dtype, device):
+        num_tensors, *tensor_shape = shape
+        lists = [
+            [
+                utils.generate_tensor_input(tensor_shape, dtype, device)
+                for _ in range(num_tensors)
+            ]
+            for _ in range(num_lists)
+        ]
+        yield (*lists,)
+
+    return input_fn
+
+
+def _with_scalar(input_fn, scalar):
+    def fn(shape, dtype, device):
+        for args in input_fn(shape, dtype, device):
+            yield (*args, scalar)
+
+    return fn
+
+
+@pytest.mark.foreach
+@pytest.mark.parametrize(
+    "op_name, torch_op, input_fn",
+    [
+        pytest.param(
+            "foreach_add_",
+            torch._foreach_add_,
+            _tensor_lists(2),
+            marks=pytest.mark.foreach_add_,
+        ),
+        pytest.param(
+            "foreach_mul_",
+            torch._foreach_mul_,
+            _with_scalar(_tensor_lists(1), 0.5),
+            marks=pytest.mark.foreach_mul_,
+        ),
+        pytest.param(
+            "foreach_lerp_",
+            torch._foreach_lerp_,
+            _with_scalar(_tensor_lists(2), 0.1),
+            marks=pytest.mark.foreach_lerp_,
+        ),
+        pytest.param(
+            "foreach_addcmul_",
+            torch._foreach_addcmul_,
+            _with_scalar(_tensor_lists(3), 0.9),
+            marks=pytest.mark.foreach_addcmul_,
+        ),
+        pytest.param(
+            "foreach_sqrt",
+            torch._foreach_sqrt,
+            _tensor_lists(1),
+            marks=pytest.mark.foreach_sqrt,
+        ),
+        pytest.param(
+            "foreach_norm",
+            torch._foreach_norm,
+            _tensor_lists(1),
+            marks=pytest.mark.foreach_norm,
+        ),
+    ],
+)
+def test_foreach(op_name, torch_op, input_fn):
+    bench = ForeachBenchmark(
+        op_name=op_name,
+        input_fn=input_fn,
+        torch_op=torch_op,
+        dtypes=consts.FLOAT_DTYPES,
+    )
+    bench.run()
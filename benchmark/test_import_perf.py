@@ -0,0 +1,67 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from .conftest import emit_record_logger
+
+IMPORT_REPEATS = 3
+
+_IMPORT_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import flag_gems
+imported = time.perf_counter()
+flag_gems.only_enable(include=["add", "mul", "silu"])
+enabled = time.perf_counter()
+print(imported - start, enabled - start, sum(m.startswith("flag_gems.ops.") for m in sys.modules))
+"""
+
+
+def _measure(lazy):
+    env = dict(os.environ, FLAGGEMS_LAZY_IMPORT="1" if lazy else "0")
+    samples = []
+    for _ in range(IMPORT_REPEATS):
+        out = subprocess.run(
+            [sys.executable, "-c", _IMPORT_SCRIPT],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()[-3:]
+        samples.append((float(out[0]), float(out[1]), int(out[2])))
+    # the fastest run is the least disturbed by the file system cache
+    return min(samples)
+
+
+@pytest.mark.lazy_import
+def test_perf_import_time():
+    """Measure `import flag_gems` & `only_enable` in fresh interpreters.
+
+    Both are measured with the operator modules imported eagerly and lazily
+    (FLAGGEMS_LAZY_IMPORT=1), with the number of imported operator modules.
+    """
+    print(f"\n{'mode':<8}{'import s':>12}{'only_enable s':>16}{'op modules':>12}")
+    for lazy in (False, True):
+        mode = "lazy" if lazy else "eager"
+        import_s, enable_s, num_modules = _measure(lazy)
+        print(f"{mode:<8}{import_s:>12.3f}{enable_s:>16.3f}{num_modules:>12}")
+        emit_record_logger(
+            f"import_time {mode} import={import_s:.3f}s only_enable={enable_s:.3f}s "
+            f"op_modules={num_modules}"
+        )
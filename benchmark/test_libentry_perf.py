@@ -0,0 +1,109 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import pytest
+import torch
+import triton
+import triton.language as tl
+
+import flag_gems
+from flag_gems.runtime import torch_device_fn
+from flag_gems.utils import libentry
+
+from .conftest import emit_record_logger
+
+HOST_OVERHEAD_WARMUP = 100
+HOST_OVERHEAD_ITERS = 2000
+
+
+@triton.jit
+def _tiny_copy_kernel(
+    out_ptr,
+    in_ptr,
+    n_elements,
+    stride,
+    BLOCK_SIZE: tl.constexpr,
+):
+    pid = tl.program_id(0)
+    offsets = pid * BLOCK_SIZE + tl.arange(0, BLOCK_SIZE)
+    mask = offsets < n_elements
+    x = tl.load(in_ptr + offsets * stride, mask=mask)
+    tl.store(out_ptr + offsets * stride, x, mask=mask)
+
+
+_tiny_copy_libentry = libentry()(_tiny_copy_kernel)
+
+
+@libentry()
+@triton.heuristics(values={"BLOCK_SIZE": lambda args: 128})
+@triton.jit(do_not_specialize=["n_elements"])
+def _tiny_copy_heuristic_kernel(
+    out_ptr,
+    in_ptr,
+    n_elements,
+    stride,
+    BLOCK_SIZE: tl.constexpr,
+):
+    pid = tl.program_id(0)
+    offsets = pid * BLOCK_SIZE + tl.arange(0, BLOCK_SIZE)
+    mask = offsets < n_elements
+    x = tl.load(in_ptr + offsets * stride, mask=mask)
+    tl.store(out_ptr + offsets * stride, x, mask=mask)
+
+
+def _host_us_per_launch(launch):
+    for _ in range(HOST_OVERHEAD_WARMUP):
+        launch()
+    torch_device_fn.synchronize()
+    start = time.perf_counter()
+    for _ in range(HOST_OVERHEAD_ITERS):
+        launch()
+    end = time.perf_counter()
+    torch_device_fn.synchronize()
+    return (end - start) / HOST_OVERHEAD_ITERS * 1e6
+
+
+@pytest.mark.libentry
+def test_perf_libentry_host_overhead():
+    """Measure host-side launch overhead of tiny kernels dispatched by LibEntry.
+
+    The device work is negligible, so the time spent before the launch returns
+    is dominated by argument binding, cache-key construction and grid
+    evaluation. Raw Triton dispatch of the same kernel is reported as the
+    reference; run the benchmark on two revisions to compare LibEntry changes.
+    """
+    x = torch.randn(128, device=flag_gems.device)
+    out = torch.empty_like(x)
+    n = x.numel()
+
+    cases = {
+        "triton_jit": lambda: _tiny_copy_kernel[(1,)](out, x, n, 1, BLOCK_SIZE=128),
+        "libentry_tuple_grid": lambda: _tiny_copy_libentry[(1,)](
+            out, x, n, 1, BLOCK_SIZE=128
+        ),
+        "libentry_callable_grid": lambda: _tiny_copy_libentry[
+            lambda meta: (triton.cdiv(meta["n_elements"], meta["BLOCK_SIZE"]),)
+        ](out, x, n, 1, BLOCK_SIZE=128),
+        "libentry_heuristics_kwargs": lambda: _tiny_copy_heuristic_kernel[
+            lambda meta: (triton.cdiv(meta["n_elements"], meta["BLOCK_SIZE"]),)
+        ](out, x, n_elements=n, stride=1),
+    }
+
+    print(f"\n{'case':<32}{'host us/launch':>16}")
+    for name, launch in cases.items():
+        latency = _host_us_per_launch(launch)
+        print(f"{name:<32}{latency:>16.2f}")
+        emit_record_logger(f"libentry_host_overhead {name} {latency:.2f}us")
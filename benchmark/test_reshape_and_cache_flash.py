@@ -34,13 +34,10 @@ def torch_reshape_and_cache_flash_ref(
     v_scale: Any = None,
 ):
     block_size = key_cache.size(1)
-    num_tokens = slot_mapping.numel()
-    for i in range(num_tokens):
-        slot = slot_mapping[i].item()
-        block_idx = slot // block_size
-        block_offset = slot % block_size
-        key_cache[block_idx, block_offset] = key[i]
-        value_cache[block_idx, block_offset] = value[i]
+    block_idx = slot_mapping // block_size
+    block_offset = slot_mapping % block_size
+    key_cache[block_idx, block_offset] = key
+    value_cache[block_idx, block_offset] = value
 
 
 class ReshapeAndCacheFlashBenchmark(base.GenericBenchmark):
@@ -21,6 +21,7 @@ import torch
 import flag_gems
 
 from . import base, consts, utils
+from .test_cat import MultiInputCatBenchmark, multi_input_fn
 
 
 class StackBenchmark(base.Benchmark):
@@ -67,3 +68,17 @@ def test_stack():
         dtypes=consts.FLOAT_DTYPES,
     )
     bench.run()
+
+
+@pytest.mark.stack_many
+@pytest.mark.skipif(
+    flag_gems.vendor_name == "tsingmicro", reason="Issue #4131: not working"
+)
+def test_stack_many():
+    bench = MultiInputCatBenchmark(
+        op_name="stack_many",
+        input_fn=multi_input_fn,
+        torch_op=torch.stack,
+        dtypes=consts.FLOAT_DTYPES,
+    )
+    bench.run()
@@ -59,3 +59,119 @@ def test_sum_out():
         dtypes=consts.FLOAT_DTYPES,
     )
     bench.run()
+
+
+class ReductionDimsBenchmark(base.GenericBenchmark):
+    """Reductions over leading, middle & trailing dims of 3D inputs.
+
+    GB/s counts the input read once & the output written once, so a reduction
+    which copies its input before reducing it shows a lower bandwidth.
+    """
+
+    DEFAULT_SHAPE_DESC = "B, M, N"
+
+    def set_more_shapes(self):
+        return [(4096, 2**i, 64) for i in range(0, 13, 4)]
+
+    def set_more_metrics(self):
+        return ["gbps"]
+
+    def get_gbps(self, args, latency):
+        inp, dim = args[:2]
+        out_numel = inp.numel()
+        for d in dim:
+            out_numel //= inp.shape[d]
+        io_amount = (inp.numel() + out_numel) * inp.element_size()
+        return io_amount * 1e-9 / (latency * 1e-3)
+
+
+def reduction_dims_input_fn(shape, dtype, device):
+    inp = utils.generate_tensor_input(shape, dtype, device)
+    for dim in [(0,), (1,), (0, 1), (1, 2), (0, 2)]:
+        yield inp, dim
+
+
+@pytest.mark.sum_dims
+def test_sum_dims():
+    bench = ReductionDimsBenchmark(
+        op_name="sum_dims",
+        torch_op=torch.sum,
+        input_fn=reduction_dims_input_fn,
+        dtypes=consts.FLOAT_DTYPES,
+    )
+    bench.run()
+
+
+@pytest.mark.mean_dims
+def test_mean_dims():
+    bench = ReductionDimsBenchmark(
+        op_name="mean_dims",
+        torch_op=torch.mean,
+        input_fn=reduction_dims_input_fn,
+        dtypes=consts.FLOAT_DTYPES,
+    )
+    bench.run()
+
+
+@pytest.mark.amax_dims
+def test_amax_dims():
+    bench = ReductionDimsBenchmark(
+        op_name="amax_dims",
+        torch_op=torch.amax,
+        input_fn=reduction_dims_input_fn,
+        dtypes=consts.FLOAT_DTYPES,
+    )
+    bench.run()
+
+
+class FullReductionBenchmark(base.GenericBenchmark):
+    """Reductions of all the elements, from launch-bound to bandwidth-bound."""
+
+    DEFAULT_SHAPE_DESC = "numel"
+
+    def set_more_shapes(self):
+        return [(4**i,) for i in range(0, 15, 2)]
+
+    def set_more_metrics(self):
+        return ["gbps"]
+
+    def get_gbps(self, args, latency):
+        io_amount = args[0].numel() * args[0].element_size()
+        return io_amount * 1e-9 / (latency * 1e-3)
+
+
+def full_reduction_input_fn(shape, dtype, device):
+    yield utils.generate_tensor_input(shape, dtype, device),
+
+
+@pytest.mark.sum_full
+def test_sum_full():
+    bench = FullReductionBenchmark(
+        op_name="sum_full",
+        torch_op=torch.sum,
+        input_fn=full_reduction_input_fn,
+        dtypes=consts.FLOAT_DTYPES,
+    )
+    bench.run()
+
+
+@pytest.mark.mean_full
+def test_mean_full():
+    bench = FullReductionBenchmark(
+        op_name="mean_full",
+        torch_op=torch.mean,
+        input_fn=full_reduction_input_fn,
+        dtypes=consts.FLOAT_DTYPES,
+    )
+    bench.run()
+
+
+@pytest.mark.amax_full
+def test_amax_full():
+    bench = FullReductionBenchmark(
+        op_name="amax_full",
+        torch_op=torch.amax,
+        input_fn=full_reduction_input_fn,
+        dtypes=consts.FLOAT_DTYPES,
+    )
+    bench.run()
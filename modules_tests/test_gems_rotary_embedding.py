@@ -203,3 +203,61 @@ def test_gems_deepseek_rope(
         pytest.skip(
             "Skipping vLLM DeepseekScalingRotaryEmbedding comparison: vLLM not installed"
         )
+
+
+def test_gems_rope_shares_growing_cos_sin_cache():
+    kwargs = dict(
+        rotary_dim=64,
+        base=10000,
+        rotary_interleaved=False,
+        dtype=torch.float32,
+        device=device,
+    )
+    layers = [GemsRope(max_position_embeddings=2048, **kwargs) for _ in range(4)]
+    assert all(
+        layer.cos_cached.data_ptr() == layers[0].cos_cached.data_ptr()
+        for layer in layers
+    )
+    other_base = GemsRope(max_position_embeddings=2048, **dict(kwargs, base=500000))
+    assert other_base.cos_cached.data_ptr() != layers[0].cos_cached.data_ptr()
+
+    # a sequence longer than max_position_embeddings grows the shared cache
+    seq_len = 3000
+    query = torch.randn((1, seq_len, 8, 64), device=device)
+    key = torch.randn((1, seq_len, 8, 64), device=device)
+    layers[0](query, key)
+    assert layers[0].cos_cached.shape == (seq_len, 32)
+    assert layers[1].cos_cached.shape == (2048, 32)
+    layers[1].extend_cos_sin_cache(seq_len)
+    assert layers[1].sin_cached.data_ptr() == layers[0].sin_cached.data_ptr()
+
+    # the grown cache matches cos/sin computed at once
+    cos, sin = layers[0]._compute_cos_sin(0, seq_len)
+    assert_close(layers[0].cos_cached, cos, torch.float32)
+    assert_close(layers[0].sin_cached, sin, torch.float32)
+
+
+def test_gems_rope_cos_sin_cache_follows_module_casts():
+    rope = GemsRope(
+        rotary_dim=64,
+        max_position_embeddings=2048,
+        base=10000,
+        rotary_interleaved=False,
+        dtype=torch.float32,
+        device=device,
+    )
+    assert "cos_cached" in dict(rope.named_buffers())
+    assert "cos_cached" not in rope.state_dict()
+
+    rope.to(torch.float16)
+    assert rope.cos_cached.dtype == torch.float16
+    assert rope.sin_cached.dtype == torch.float16
+    assert rope.dtype == torch.float16
+    cos, sin = rope._compute_cos_sin(0, 2048)
+    assert_close(rope.cos_cached, cos, torch.float16)
+    assert_close(rope.sin_cached, sin, torch.float16)
+
+    # the cache of the new dtype is shared & extended as before
+    rope.extend_cos_sin_cache(4096)
+    assert rope.cos_cached.shape == (4096, 32)
+    assert rope.cos_cached.dtype == torch.float16
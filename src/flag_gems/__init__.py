@@ -13,6 +13,7 @@
 # limitations under the License.
 
 # ruff: noqa: F405
+import threading
 import warnings
 
 import torch
@@ -22,16 +23,35 @@ from flag_gems import testing  # noqa: F401
 from flag_gems import runtime
 from flag_gems.config import aten_patch_list, resolve_user_setting
 from flag_gems.experimental_ops import *  # noqa: F403
-from flag_gems.fused import *  # noqa: F403
 from flag_gems.logging_utils import setup_flaggems_logging, teardown_flaggems_logging
 from flag_gems.modules import *  # noqa: F403
-from flag_gems.ops import *  # noqa: F403
-from flag_gems.ops import range as range_op
 from flag_gems.patches import *  # noqa: F403
 from flag_gems.patches import patch_empty_vllm  # noqa: F401
 from flag_gems.runtime import flagtune
 from flag_gems.runtime.backend import SpecOpRegistrar
-from flag_gems.runtime.op_registrar import GeneralOpRegistrar
+from flag_gems.runtime.op_registrar import GeneralOpRegistrar, OpSwitch
+from flag_gems.utils.lazy_import import FLAGGEMS_LAZY_IMPORT, lazy_functions
+from flag_gems.utils.warmup import warmup
+
+if FLAGGEMS_LAZY_IMPORT:
+    # operators are registered as trampolines importing them on their first call
+    from flag_gems import fused, ops
+
+    globals().update(lazy_functions(fused))
+    globals().update(lazy_functions(ops))
+    range_op = globals()["range"]
+
+    def __getattr__(name):
+        # classes & constants exported by the operator packages
+        for package in (ops, fused):
+            if name in package._lazy_exports:
+                return getattr(package, name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+else:
+    from flag_gems.fused import *  # noqa: F403
+    from flag_gems.ops import *  # noqa: F403
+    from flag_gems.ops import range as range_op
 
 try:
     from flag_gems._version import commit_id as _commit_id
@@ -134,6 +154,40 @@ _FULL_CONFIG = (
     ("_euclidean_dist", _euclidean_dist),
     ("_flash_attention_backward", flash_attention_backward),
     ("_flash_attention_forward", _flash_attention_forward),
+    ("_foreach_add.List", _foreach_add_list),
+    ("_foreach_add.Scalar", _foreach_add_scalar),
+    ("_foreach_add_.List", _foreach_add_list_),
+    ("_foreach_add_.Scalar", _foreach_add_scalar_),
+    ("_foreach_addcdiv.Scalar", _foreach_addcdiv_scalar),
+    ("_foreach_addcdiv_.Scalar", _foreach_addcdiv_scalar_),
+    ("_foreach_addcmul.Scalar", _foreach_addcmul_scalar),
+    ("_foreach_addcmul_.Scalar", _foreach_addcmul_scalar_),
+    ("_foreach_div.List", _foreach_div_list),
+    ("_foreach_div.Scalar", _foreach_div_scalar),
+    ("_foreach_div_.List", _foreach_div_list_),
+    ("_foreach_div_.Scalar", _foreach_div_scalar_),
+    ("_foreach_exp", _foreach_exp),
+    ("_foreach_exp_", _foreach_exp_),
+    ("_foreach_lerp.Scalar", _foreach_lerp_scalar),
+    ("_foreach_lerp_.Scalar", _foreach_lerp_scalar_),
+    ("_foreach_mul.List", _foreach_mul_list),
+    ("_foreach_mul.Scalar", _foreach_mul_scalar),
+    ("_foreach_mul.Tensor", _foreach_mul_tensor),
+    ("_foreach_mul_.List", _foreach_mul_list_),
+    ("_foreach_mul_.Scalar", _foreach_mul_scalar_),
+    ("_foreach_mul_.Tensor", _foreach_mul_tensor_),
+    ("_foreach_neg", _foreach_neg),
+    ("_foreach_neg_", _foreach_neg_),
+    ("_foreach_norm.Scalar", _foreach_norm),
+    ("_foreach_reciprocal", _foreach_reciprocal),
+    ("_foreach_reciprocal_", _foreach_reciprocal_),
+    ("_foreach_sqrt", _foreach_sqrt),
+    ("_foreach_sqrt_", _foreach_sqrt_),
+    ("_foreach_sub.List", _foreach_sub_list),
+    ("_foreach_sub.Scalar", _foreach_sub_scalar),
+    ("_foreach_sub_.List", _foreach_sub_list_),
+    ("_foreach_sub_.Scalar", _foreach_sub_scalar_),
+    ("_foreach_zero_", _foreach_zero_),
     (
         "_functional_sym_constrain_range",
         _functional_sym_constrain_range,
@@ -1187,6 +1241,8 @@ def enable(
     record=False,
     once=False,
     path=None,
+    switch=None,
+    profile=False,
 ):
     """Register all FlagGems ops except those explicitly excluded.
 
@@ -1203,6 +1259,10 @@ def enable(
         record: Whether to enable FlagGems logging.
         once: When True, log only once.
         path: Optional log output path when recording.
+        switch: Optional OpSwitch. When given, the registered ops only run the
+            FlagGems implementations in the threads where it is on.
+        profile: Whether to record the calls of the registered ops, see
+            `flag_gems.runtime.op_profiler`.
 
     Notes:
         - If the exclude list/YAML resolves to empty, all ops are registered.
@@ -1215,6 +1275,8 @@ def enable(
         user_exclude_ops=exclude_ops,
         cpp_patched_ops=list(set(aten_patch_list)),
         lib=lib,
+        **({} if switch is None else {"switch": switch}),
+        **({"profile": True} if profile else {}),
     )
     setup_flaggems_logging(path=path, record=record, once=once)
 
@@ -1226,6 +1288,8 @@ def only_enable(
     record=False,
     once=False,
     path=None,
+    switch=None,
+    profile=False,
 ):
     """Register only the specified FlagGems ops and skip the rest.
 
@@ -1242,6 +1306,10 @@ def only_enable(
         record: Whether to enable FlagGems logging.
         once: When True, log only once.
         path: Optional log output path when recording.
+        switch: Optional OpSwitch. When given, the registered ops only run the
+            FlagGems implementations in the threads where it is on.
+        profile: Whether to record the calls of the registered ops, see
+            `flag_gems.runtime.op_profiler`.
 
     Classic usage:
         - Only register a few ops:
@@ -1270,47 +1338,117 @@ def only_enable(
         cpp_patched_ops=list(set(aten_patch_list)),
         full_config_by_func=FULL_CONFIG_BY_FUNC,
         lib=lib,
+        **({} if switch is None else {"switch": switch}),
+        **({"profile": True} if profile else {}),
     )
     setup_flaggems_logging(path=path, record=record, once=once)
 
 
+# persistent registrations of use_gems(persistent=True), keyed by include & exclude
+_PERSISTENT_REGISTRATIONS = {}
+_PERSISTENT_REGISTRATIONS_LOCK = threading.Lock()
+
+
+def _setting_key(setting):
+    return setting if isinstance(setting, str) else tuple(sorted(setting))
+
+
 class use_gems:
     """
     The 'include' parameter has higher priority than 'exclude'.
     When 'include' is not None, use_gems will not process 'exclude'.
+
+    By default, the ops are registered when entering the context and
+    deregistered when exiting it. With `persistent=True`, the ops are registered
+    once for each include/exclude setting and are toggled by a thread-local
+    OpSwitch, so that entering & exiting the context is cheap and only affects
+    the current thread. This requires `torch.library.get_kernel` to capture the
+    kernels replaced by FlagGems, ops whose kernels cannot be captured are
+    skipped with a warning. Note that autograd may run the backward pass in
+    other threads, where the switch is off, and that outside of the context the
+    persistently registered ops reach the native kernels through a thin wrapper.
+    With `profile=True`, the calls of the ops are recorded by
+    `flag_gems.runtime.op_profiler.profiler`.
     """
 
-    def __init__(self, exclude=None, include=None, record=False, once=False, path=None):
-        self.lib = torch.library.Library("aten", "IMPL")
+    def __init__(
+        self,
+        exclude=None,
+        include=None,
+        record=False,
+        once=False,
+        path=None,
+        persistent=False,
+        profile=False,
+    ):
+        # falls back to registering on entering without torch.library.get_kernel
+        self.persistent = persistent and hasattr(torch.library, "get_kernel")
+        self.lib = None if self.persistent else torch.library.Library("aten", "IMPL")
         self.exclude = exclude if isinstance(exclude, (list, tuple, set, str)) else []
         self.include = include if isinstance(include, (list, tuple, set, str)) else []
         self.registrar = GeneralOpRegistrar
         self.record = record
         self.once = once
         self.path = path
+        self.profile = profile
 
-    def __enter__(self):
+    def _register(self, lib, switch=None, record=False):
         if self.include:
             only_enable(
-                lib=self.lib,
+                lib=lib,
                 include=self.include,
                 registrar=self.registrar,
-                record=self.record,
+                record=record,
                 once=self.once,
                 path=self.path,
+                switch=switch,
+                profile=self.profile,
             )
         else:
             enable(
-                lib=self.lib,
+                lib=lib,
                 unused=self.exclude,
                 registrar=self.registrar,
-                record=self.record,
+                record=record,
                 once=self.once,
                 path=self.path,
+                switch=switch,
+                profile=self.profile,
             )
 
+    def __enter__(self):
+        global current_work_registrar
+        if not self.persistent:
+            self._register(self.lib, record=self.record)
+            return
+
+        key = (
+            _setting_key(self.include),
+            _setting_key(self.exclude),
+            self.profile,
+        )
+        self.previous_registrar = globals().get("current_work_registrar")
+        # threads entering with the same setting must register it only once
+        with _PERSISTENT_REGISTRATIONS_LOCK:
+            if key not in _PERSISTENT_REGISTRATIONS:
+                lib = torch.library.Library("aten", "IMPL")
+                switch = OpSwitch()
+                self._register(lib, switch=switch)
+                _PERSISTENT_REGISTRATIONS[key] = (lib, switch, current_work_registrar)
+            _, self.switch, current_work_registrar = _PERSISTENT_REGISTRATIONS[key]
+        if self.record:
+            setup_flaggems_logging(path=self.path, record=True, once=self.once)
+        self.switch.__enter__()
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         global current_work_registrar
+        if self.persistent:
+            self.switch.__exit__(exc_type, exc_val, exc_tb)
+            current_work_registrar = self.previous_registrar
+            if self.record:
+                teardown_flaggems_logging()
+            return
+
         if torch.__version__ >= "2.5":
             self.lib._destroy()
         del self.lib
@@ -1343,4 +1481,5 @@ __all__ = [
     "flagtune",
     "only_enable",
     "use_gems",
+    "warmup",
 ]
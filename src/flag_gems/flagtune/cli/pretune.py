@@ -10,7 +10,8 @@ CLI arguments:
   * ``--shape-config``, ``--flagtune-config``, and ``--op`` select workload
     rows, the safe operator contract, and ``operator[/variant]``.
   * ``--database``, ``--parallel``, and ``--dtypes`` control latency storage,
-    workers, and runtime dtypes. ``--warmup``/``--iter`` control candidate
+    workers, and runtime dtypes. ``--dispatch`` and ``--time-budget`` choose
+    how shapes are handed to workers and when to stop starting new ones. ``--warmup``/``--iter`` control candidate
     config search; the ``--latency-*`` options control the independent fresh
     measurement of the selected config.
   * ``--sort`` and ``--max-shapes`` select records after variant filtering;
@@ -69,6 +70,7 @@ from flag_gems.flagtune.collection.scheduler import (  # noqa: E402
     DEFAULT_LATENCY_ITERATIONS_MS,
     DEFAULT_LATENCY_TRIALS,
     DEFAULT_LATENCY_WARMUP_MS,
+    DISPATCH_MODES,
     BenchmarkError,
     parse_sqlite_url,
     run_shape_config_benchmarks,
@@ -161,6 +163,21 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="GPU worker count; defaults to all visible GPUs.",
     )
+    parser.add_argument(
+        "--dispatch",
+        choices=DISPATCH_MODES,
+        default="dynamic",
+        help=(
+            "dynamic hands the largest pending shape to whichever worker is idle; "
+            "static assigns shapes round robin before launch."
+        ),
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="Seconds after which dynamic dispatch starts no new shape.",
+    )
     parser.add_argument(
         "--dtypes",
         default="bfloat16",
@@ -241,6 +258,11 @@ def validate_args(args: argparse.Namespace) -> None:
     """Reject invalid numeric CLI options before runtime initialization."""
     if args.parallel is not None and args.parallel <= 0:
         raise PretuneError("--parallel must be a positive integer")
+    if args.time_budget is not None:
+        if args.time_budget <= 0:
+            raise PretuneError("--time-budget must be positive")
+        if args.dispatch != "dynamic":
+            raise PretuneError("--time-budget requires --dispatch dynamic")
     if args.warmup < 0:
         raise PretuneError("--warmup must be a non-negative integer")
     if args.iterations <= 0:
@@ -518,13 +540,21 @@ def dry_run_summary(
         "latency_iter": args.latency_iterations,
         "latency_trials": args.latency_trials,
         "parallel": workers,
+        "dispatch": args.dispatch,
+        "time_budget": args.time_budget,
         "backend": context.backend_name,
         "gpu_tokens": list(gpu_tokens[:workers]),
         "device_names": list(context.device_names),
         "device_architectures": list(context.device_architectures),
-        "worker_shape_counts": [
-            len(range(worker_id, len(records), workers)) for worker_id in range(workers)
-        ],
+        # dynamic dispatch only assigns shapes while running
+        "worker_shape_counts": (
+            [
+                len(range(worker_id, len(records), workers))
+                for worker_id in range(workers)
+            ]
+            if args.dispatch == "static"
+            else None
+        ),
         "database": sanitize_db_url(database.url),
         "database_source": database.source,
         "output_root": str(Path(args.output).expanduser().resolve()),
@@ -625,6 +655,8 @@ def run_main(args: argparse.Namespace) -> int:
             database_url=database.url,
             work_dir=run_dir,
             fail_fast=args.fail_fast,
+            dispatch=args.dispatch,
+            time_budget=args.time_budget,
         )
     except BenchmarkError as exc:
         raise PretuneError(str(exc)) from exc
@@ -725,6 +757,8 @@ def run_main(args: argparse.Namespace) -> int:
             "measured_count": measured_count,
             "resolved_protocols": list(benchmark_protocols.values()),
             "parallel": workers,
+            "dispatch": args.dispatch,
+            "time_budget": args.time_budget,
             "backend": context.backend_name,
             "visible_device_count": context.visible_device_count,
             "gpu_tokens": tokens[:workers],
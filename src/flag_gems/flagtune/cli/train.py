@@ -65,6 +65,7 @@ from flag_gems.flagtune.collection.scheduler import (  # noqa: E402
     DEFAULT_BENCHMARK_MODE,
     DEFAULT_BENCHMARK_RETRIES,
     DEFAULT_BENCHMARK_WARMUP_MS,
+    DISPATCH_MODES,
     BenchmarkError,
     run_shape_config_benchmarks,
 )
@@ -151,6 +152,15 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="GPU worker count; defaults to all visible GPUs.",
     )
+    parser.add_argument(
+        "--dispatch",
+        choices=DISPATCH_MODES,
+        default="dynamic",
+        help=(
+            "dynamic hands the largest pending shape to whichever worker is idle; "
+            "static assigns shapes round robin before launch."
+        ),
+    )
     parser.add_argument(
         "--dtypes",
         default="bfloat16",
@@ -635,6 +645,7 @@ def run_main(args: argparse.Namespace) -> int:
         * 4,
         "max_configs_per_shape": args.max_configs_per_shape,
         "parallel": workers,
+        "dispatch": args.dispatch,
         "gpu_tokens": gpu_tokens,
         "backend": context.backend_name,
         "device_names": list(context.device_names),
@@ -714,6 +725,7 @@ def run_main(args: argparse.Namespace) -> int:
                     work_dir=batch_dir,
                     fail_fast=args.fail_fast,
                     stream_worker_logs=not args.no_progress,
+                    dispatch=args.dispatch,
                 )
             except BenchmarkError as exc:
                 raise TrainError(str(exc)) from exc
@@ -10,6 +10,7 @@ from .scheduler import (
     BenchmarkError,
     BenchmarkTask,
     benchmark_shape_configs,
+    estimate_task_cost,
     run_shape_config_benchmarks,
 )
 
@@ -19,5 +20,6 @@ __all__ = [
     "BenchmarkError",
     "BenchmarkTask",
     "benchmark_shape_configs",
+    "estimate_task_cost",
     "run_shape_config_benchmarks",
 ]
@@ -11,9 +11,12 @@ Outputs:
     and any recoverable SQLite shards.
 
 Implementation:
-    The parent converts cases through the generic executor, distributes tasks
-    round robin, and starts one long-lived subprocess per device. Each worker
-    exposes exactly one adapter-selected device, reuses one executor, and streams JSONL
+    The parent converts cases through the generic executor and starts one
+    long-lived subprocess per device. Static dispatch distributes tasks round
+    robin through task files; dynamic dispatch keeps the tasks in the parent,
+    ordered by estimated cost, and writes the next one to the stdin pipe of
+    whichever worker has finished its previous task. Each worker exposes
+    exactly one adapter-selected device, reuses one executor, and streams JSONL
     results.  File-backed SQLite uses one snapshot shard per concurrent worker;
     shards are merged in worker order with ``INSERT OR IGNORE`` so existing
     target rows win. Callers select an explicit LibTuner config-selection mode
@@ -40,6 +43,7 @@ Environment variables:
 from __future__ import annotations
 
 import argparse
+import collections
 import json
 import os
 import re
@@ -52,7 +56,7 @@ import time
 import traceback
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Mapping, Optional, Sequence
+from typing import Any, Callable, Mapping, Optional, Sequence
 
 MODULE_PATH = Path(__file__).resolve()
 PROJECT_ROOT = MODULE_PATH.parents[4]
@@ -77,6 +81,10 @@ DEFAULT_BENCHMARK_RETRIES = 10
 DEFAULT_LATENCY_WARMUP_MS = 25
 DEFAULT_LATENCY_ITERATIONS_MS = 100
 DEFAULT_LATENCY_TRIALS = 3
+DISPATCH_MODES = (
+    "static",
+    "dynamic",
+)
 
 
 @dataclass(frozen=True)
@@ -277,6 +285,75 @@ def _split_tasks(
     return [chunk for chunk in chunks if chunk]
 
 
+def estimate_task_cost(payload: Any) -> float:
+    """Return a coarse relative cost of one executor payload.
+
+    The product of the numeric shape values is multiplied by the number of
+    explicit configs. Payloads without such fields cost 1, so they keep their
+    input order under dynamic dispatch.
+    """
+    if not isinstance(payload, Mapping):
+        return 1.0
+    cost = 1.0
+    values = payload.get("values")
+    if isinstance(values, Mapping):
+        for value in values.values():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                cost *= max(float(value), 1.0)
+    configs = payload.get("configs")
+    if isinstance(configs, Sequence):
+        cost *= max(len(configs), 1)
+    return cost
+
+
+def _order_tasks(
+    tasks: Sequence[BenchmarkTask], task_cost: Callable[[Any], float]
+) -> list[BenchmarkTask]:
+    """Order tasks from the largest estimated cost, ties in input order."""
+    costs = [task_cost(task.payload) for task in tasks]
+    order = sorted(range(len(tasks)), key=lambda index: -costs[index])
+    return [tasks[index] for index in order]
+
+
+def _count_result_lines(path: Path) -> int:
+    """Return the number of complete JSONL rows a worker has flushed."""
+    if not path.exists():
+        return 0
+    return path.read_bytes().count(b"\n")
+
+
+def _feed_dynamic_worker(
+    process: subprocess.Popen,
+    result_path: Path,
+    pending: collections.deque,
+    dispatched: int,
+    accept_new: bool,
+) -> int:
+    """Keep one task in flight on a dynamic worker and return its dispatch count.
+
+    The worker's stdin is closed once no more tasks will be dispatched, which
+    lets the worker exit after its last task. A task that cannot be written
+    because the worker exited is returned to the front of the queue.
+    """
+    if process.stdin is None or process.stdin.closed:
+        return dispatched
+    if dispatched > _count_result_lines(result_path):
+        return dispatched
+    if pending and accept_new:
+        task = pending.popleft()
+        try:
+            process.stdin.write(json.dumps(task.to_json()) + "\n")
+            process.stdin.flush()
+            return dispatched + 1
+        except (BrokenPipeError, OSError):
+            pending.appendleft(task)
+    try:
+        process.stdin.close()
+    except (BrokenPipeError, OSError):
+        pass
+    return dispatched
+
+
 def _prepare_worker_databases(
     database_url: str, work_dir: Path, workers: int
 ) -> tuple[list[str], list[Path], Optional[Path]]:
@@ -327,8 +404,16 @@ def _run_worker(args: argparse.Namespace) -> int:
     )
 
     worker = BenchmarkWorker(args.operator_config, environment.runtime)
-    payload = json.loads(Path(args.task_file).read_text(encoding="utf-8"))
-    tasks = [BenchmarkTask.from_json(item) for item in payload]
+    if args.task_file == "-":
+        # dynamic dispatch: one task per line until the parent closes stdin
+        tasks = (
+            BenchmarkTask.from_json(json.loads(line))
+            for line in iter(sys.stdin.readline, "")
+            if line.strip()
+        )
+    else:
+        payload = json.loads(Path(args.task_file).read_text(encoding="utf-8"))
+        tasks = [BenchmarkTask.from_json(item) for item in payload]
     had_failure = False
     result_path = Path(args.result_file)
     with result_path.open("w", encoding="utf-8") as output:
@@ -498,6 +583,9 @@ def _launch_workers(
     fail_fast: bool,
     stream_worker_logs: bool,
     device_runtime: Any,
+    dispatch: str = "static",
+    time_budget: Optional[float] = None,
+    task_cost: Optional[Callable[[Any], float]] = None,
 ) -> tuple[list[dict[str, Any]], list[int], bool, list[Path]]:
     """Launch GPU subprocesses, monitor fail-fast, and collect ordered rows.
 
@@ -518,6 +606,12 @@ def _launch_workers(
         latency_trials: Number of independent fresh selected-config trials.
         fail_fast: Terminate peers after the first nonzero worker exit.
         stream_worker_logs: Mirror appended worker log lines to parent stdout.
+        dispatch: ``static`` round-robin task files or ``dynamic`` on-demand
+            dispatch over worker stdin pipes.
+        time_budget: Seconds after which dynamic dispatch stops handing out
+            new tasks; running tasks are completed.
+        task_cost: Relative cost of a payload for dynamic ordering, defaulting
+            to :func:`estimate_task_cost`.
     Returns:
         Ordered result rows, worker return codes, the fail-fast trigger state,
         and persistent worker log paths.
@@ -525,13 +619,23 @@ def _launch_workers(
     Implementation:
         Worker stdout and stderr are always combined into per-worker files. When
         streaming is enabled, the parent polling loop tails those same files,
-        preserving logs while providing immediate console feedback.
+        preserving logs while providing immediate console feedback. Under
+        dynamic dispatch the same loop counts each worker's flushed result rows
+        and writes the next pending task once the previous one has finished, so
+        no worker idles while another still holds a queue of tasks.
 
     Limitations:
         Subprocesses receive termination rather than cooperative cancellation on
         fail-fast. A currently executing GPU kernel cannot be retracted.
     """
-    chunks = _split_tasks(tasks, len(gpu_tokens))
+    dynamic = dispatch == "dynamic"
+    if dynamic:
+        pending = collections.deque(
+            _order_tasks(tasks, task_cost or estimate_task_cost)
+        )
+        chunks = [None] * min(len(gpu_tokens), len(tasks))
+    else:
+        chunks = _split_tasks(tasks, len(gpu_tokens))
     worker_dir = work_dir / "benchmark-workers"
     worker_dir.mkdir(parents=True, exist_ok=True)
     processes = []
@@ -543,9 +647,11 @@ def _launch_workers(
         task_path = worker_dir / f"worker_{worker_id}_tasks.json"
         result_path = worker_dir / f"worker_{worker_id}_results.jsonl"
         log_path = worker_dir / f"worker_{worker_id}.log"
-        task_path.write_text(
-            json.dumps([task.to_json() for task in chunk], indent=2), encoding="utf-8"
-        )
+        if not dynamic:
+            task_path.write_text(
+                json.dumps([task.to_json() for task in chunk], indent=2),
+                encoding="utf-8",
+            )
         log_handle = log_path.open("w", encoding="utf-8")
         log_handles.append(log_handle)
         log_paths.append(log_path)
@@ -556,7 +662,7 @@ def _launch_workers(
             "--operator-config",
             str(operator_config),
             "--task-file",
-            str(task_path),
+            "-" if dynamic else str(task_path),
             "--result-file",
             str(result_path),
             "--gpu-token",
@@ -593,6 +699,7 @@ def _launch_workers(
             command,
             cwd=PROJECT_ROOT,
             env=env,
+            stdin=subprocess.PIPE if dynamic else None,
             stdout=log_handle,
             stderr=subprocess.STDOUT,
             text=True,
@@ -606,8 +713,24 @@ def _launch_workers(
     returncodes: dict[int, int] = {}
     fail_fast_triggered = False
     log_states = [(0, "") for _ in log_paths]
+    dispatched = [0] * len(processes)
+    deadline = None
+    if dynamic and time_budget is not None:
+        deadline = time.monotonic() + time_budget
     try:
         while active:
+            if dynamic:
+                accept_new = not fail_fast_triggered and (
+                    deadline is None or time.monotonic() < deadline
+                )
+                for worker_id, (process, result_path) in active.items():
+                    dispatched[worker_id] = _feed_dynamic_worker(
+                        process,
+                        result_path,
+                        pending,
+                        dispatched[worker_id],
+                        accept_new,
+                    )
             for worker_id, (process, _result_path) in list(active.items()):
                 returncode = process.poll()
                 if returncode is None:
@@ -632,6 +755,12 @@ def _launch_workers(
             if active:
                 time.sleep(0.05)
     finally:
+        for _worker_id, process, _result_path in processes:
+            if process.stdin is not None and not process.stdin.closed:
+                try:
+                    process.stdin.close()
+                except (BrokenPipeError, OSError):
+                    pass
         for log_handle in log_handles:
             log_handle.close()
         if stream_worker_logs:
@@ -667,6 +796,9 @@ def run_shape_config_benchmarks(
     work_dir: Path | str,
     fail_fast: bool = False,
     stream_worker_logs: bool = False,
+    dispatch: str = "static",
+    time_budget: Optional[float] = None,
+    task_cost: Optional[Callable[[Any], float]] = None,
 ) -> BenchmarkBatchResult:
     """Run opaque shape/config cases with one long-lived worker per GPU.
 
@@ -698,6 +830,14 @@ def run_shape_config_benchmarks(
         fail_fast: Stop peer workers after the first nonzero worker exit.
         stream_worker_logs: Mirror worker stdout/stderr to parent stdout while
             retaining the complete per-worker log files.
+        dispatch: ``static`` assigns tasks round robin before launch;
+            ``dynamic`` hands the largest pending task to whichever worker is
+            idle, which balances skewed shape sweeps across devices.
+        time_budget: Optional positive number of seconds after which dynamic
+            dispatch starts no new task. Tasks that never started have no row.
+        task_cost: Optional callable returning the relative cost of a prepared
+            payload for dynamic ordering; defaults to
+            :func:`estimate_task_cost`.
     Returns:
         A :class:`BenchmarkBatchResult` whose rows are sorted by input index.
 
@@ -742,6 +882,13 @@ def run_shape_config_benchmarks(
         raise BenchmarkError("latency_iterations must be positive")
     if latency_trials <= 0:
         raise BenchmarkError("latency_trials must be positive")
+    if dispatch not in DISPATCH_MODES:
+        raise BenchmarkError("dispatch must be 'static' or 'dynamic'")
+    if time_budget is not None:
+        if dispatch != "dynamic":
+            raise BenchmarkError("time_budget requires dynamic dispatch")
+        if time_budget <= 0:
+            raise BenchmarkError("time_budget must be positive")
     config_path = Path(operator_config).expanduser().resolve()
     from flag_gems.flagtune.contracts.operator import load_operator_benchmark_spec
 
@@ -799,6 +946,9 @@ def run_shape_config_benchmarks(
         fail_fast=fail_fast,
         stream_worker_logs=stream_worker_logs,
         device_runtime=environment.runtime,
+        dispatch=dispatch,
+        time_budget=time_budget,
+        task_cost=task_cost,
     )
 
     merge_summary: dict[str, Any] = {"status": "not_needed"}
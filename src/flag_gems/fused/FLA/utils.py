@@ -60,14 +60,20 @@ def tensor_cache(fn: Callable[..., torch.Tensor]) -> Callable[..., torch.Tensor]
             A wrapped version of the input function with single-entry caching.
     """
 
-    cache_entries: tuple[tuple | None, dict | None, Any] = []
+    cache_entries: tuple[tuple | None, dict | None, tuple, Any] = []
     cache_size = 8
 
+    def _versions(args, kwargs):
+        # in-place updates of the inputs bump their version & miss the cache
+        return tuple(
+            a._version for a in (*args, *kwargs.values()) if isinstance(a, torch.Tensor)
+        )
+
     @functools.wraps(fn)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         nonlocal cache_entries
         for i, entry in enumerate(cache_entries):
-            last_args, last_kwargs, last_result = entry
+            last_args, last_kwargs, last_versions, last_result = entry
             if (
                 len(args) == len(last_args)
                 and len(kwargs) == len(last_kwargs)
@@ -75,11 +81,12 @@ def tensor_cache(fn: Callable[..., torch.Tensor]) -> Callable[..., torch.Tensor]
                 and all(
                     k in last_kwargs and v is last_kwargs[k] for k, v in kwargs.items()
                 )
+                and _versions(args, kwargs) == last_versions
             ):
                 cache_entries = (
                     cache_entries[:i]
                     + cache_entries[i + 1 :]
-                    + [(args, kwargs, last_result)]
+                    + [(args, kwargs, last_versions, last_result)]
                 )
                 return last_result
 
@@ -87,7 +94,7 @@ def tensor_cache(fn: Callable[..., torch.Tensor]) -> Callable[..., torch.Tensor]
 
         if len(cache_entries) >= cache_size:
             cache_entries = cache_entries[1:]
-        cache_entries.append((args, kwargs, result))
+        cache_entries.append((args, kwargs, _versions(args, kwargs), result))
         return result
 
     return wrapper
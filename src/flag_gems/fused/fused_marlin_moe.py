@@ -43,7 +43,6 @@ from typing import Any, Callable, NamedTuple, Optional, Tuple
 import torch
 import triton
 import triton.language as tl
-from torch.utils.weak import WeakTensorKeyDictionary
 
 from flag_gems import runtime
 from flag_gems.fused.fused_moe import (
@@ -63,6 +62,7 @@ from flag_gems.fused.moe_align_block_size import (
 from flag_gems.fused.moe_sum import moe_sum
 from flag_gems.fused.silu_and_mul import silu_and_mul_out
 from flag_gems.utils import libentry, libtuner
+from flag_gems.utils.prepack_cache import prepack
 
 # ----------------------------------------------------------------------------
 # quant_type_id constants — mirror a subset of vLLM scalar_types ids.
@@ -278,11 +278,8 @@ def _align_mxfp4_tokens(
 # fed to a magic-number SIMD INT4->bf16/fp16 dequant + tl.dot kernel. This is
 # the Hopper-gated short path taken by fused_marlin_moe for plain GPTQ uint4b8.
 # ============================================================================
-_W_PACK_CACHE: WeakTensorKeyDictionary = WeakTensorKeyDictionary()
-_SCALE_PACK_CACHE: WeakTensorKeyDictionary = WeakTensorKeyDictionary()
-_SCALE_PACK_CACHE_E8M0: WeakTensorKeyDictionary = WeakTensorKeyDictionary()
-# Separate cache for the folded (int32) scale, keyed like the plain E8M0 cache.
-_SCALE_PACK_CACHE_E8M0_FOLD: WeakTensorKeyDictionary = WeakTensorKeyDictionary()
+# The packed weights & scales are kept in the prepack cache, which repacks them
+# after in-place updates of the originals.
 
 
 def _pack_w_interleave(w: torch.Tensor, block_size_k: int) -> torch.Tensor:
@@ -324,25 +321,17 @@ def _pack_scale_transpose(s: torch.Tensor) -> torch.Tensor:
 def _cached_pack_w(w: torch.Tensor, block_size_k: int, cached: bool) -> torch.Tensor:
     if not cached:
         return _pack_w_interleave(w, block_size_k)
-    per_w = _W_PACK_CACHE.get(w)
-    if per_w is None:
-        per_w = {}
-        _W_PACK_CACHE[w] = per_w
-    packed = per_w.get(block_size_k)
-    if packed is None:
-        packed = _pack_w_interleave(w, block_size_k)
-        per_w[block_size_k] = packed
-    return packed
+    return prepack(
+        w,
+        ("marlin_w_interleave", block_size_k),
+        lambda t: _pack_w_interleave(t, block_size_k),
+    )
 
 
 def _cached_pack_scale(s: torch.Tensor, cached: bool) -> torch.Tensor:
     if not cached:
         return _pack_scale_transpose(s)
-    packed = _SCALE_PACK_CACHE.get(s)
-    if packed is None:
-        packed = _pack_scale_transpose(s)
-        _SCALE_PACK_CACHE[s] = packed
-    return packed
+    return prepack(s, ("marlin_scale_transpose",), _pack_scale_transpose)
 
 
 def w4a16_int4_pack(
@@ -380,11 +369,11 @@ def _pack_scale_e8m0(s: torch.Tensor, compute_dtype: torch.dtype) -> torch.Tenso
 def _cached_pack_scale_e8m0(s, compute_dtype, cached: bool) -> torch.Tensor:
     if not cached:
         return _pack_scale_e8m0(s, compute_dtype)
-    packed = _SCALE_PACK_CACHE_E8M0.get(s)
-    if packed is None:
-        packed = _pack_scale_e8m0(s, compute_dtype)
-        _SCALE_PACK_CACHE_E8M0[s] = packed
-    return packed
+    return prepack(
+        s,
+        ("marlin_scale_e8m0", compute_dtype),
+        lambda t: _pack_scale_e8m0(t, compute_dtype),
+    )
 
 
 # FP4 dequant bias applied before the scale (bf16 2^126, fp16 2^14; see _dequant_fp4_*).
@@ -413,28 +402,25 @@ def _e8m0_fold_max_byte(compute_dtype: torch.dtype) -> int:
     return _COMPUTE_DTYPE_MAX_EXP[compute_dtype] + 127 - _FP4_BIAS_EXP[compute_dtype]
 
 
-_E8M0_FOLD_SAFE_CACHE: WeakTensorKeyDictionary = WeakTensorKeyDictionary()
+def _e8m0_max_byte(s: torch.Tensor) -> int:
+    s_u8 = s.view(torch.uint8) if s.dtype != torch.uint8 else s
+    return int(s_u8.max().item())
 
 
 def _e8m0_fold_safe(s: torch.Tensor, compute_dtype: torch.dtype) -> bool:
     # True iff every E8M0 byte folds without overflowing compute_dtype (NaN byte 255 fails).
-    verdict = _E8M0_FOLD_SAFE_CACHE.get(s)
-    if verdict is None:
-        s_u8 = s.view(torch.uint8) if s.dtype != torch.uint8 else s
-        max_byte = int(s_u8.max().item())
-        verdict = max_byte <= _e8m0_fold_max_byte(compute_dtype)
-        _E8M0_FOLD_SAFE_CACHE[s] = verdict
-    return verdict
+    max_byte = prepack(s, ("marlin_e8m0_max_byte",), _e8m0_max_byte)
+    return max_byte <= _e8m0_fold_max_byte(compute_dtype)
 
 
 def _cached_pack_scale_e8m0_fold(s, compute_dtype, cached: bool) -> torch.Tensor:
     if not cached:
         return _pack_scale_e8m0_fold(s, compute_dtype)
-    packed = _SCALE_PACK_CACHE_E8M0_FOLD.get(s)
-    if packed is None:
-        packed = _pack_scale_e8m0_fold(s, compute_dtype)
-        _SCALE_PACK_CACHE_E8M0_FOLD[s] = packed
-    return packed
+    return prepack(
+        s,
+        ("marlin_scale_e8m0_fold", compute_dtype),
+        lambda t: _pack_scale_e8m0_fold(t, compute_dtype),
+    )
 
 
 def w4a16_mxfp4_pack(
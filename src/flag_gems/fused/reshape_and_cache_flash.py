@@ -26,52 +26,95 @@ logger = logging.getLogger(__name__)
 
 vendor_name = device.vendor_name
 
+# enum Fp8KVCacheDataType
+FP8_KV_CACHE_DATA_TYPE_AUTO = tl.constexpr(0)
+FP8_KV_CACHE_DATA_TYPE_FP8E4M3 = tl.constexpr(1)
+FP8_KV_CACHE_DATA_TYPE_FP8E5M2 = tl.constexpr(2)
+
+KV_DTYPE_MAP = {
+    "auto": FP8_KV_CACHE_DATA_TYPE_AUTO,
+    "fp8": FP8_KV_CACHE_DATA_TYPE_FP8E4M3,
+    "fp8_e4m3": FP8_KV_CACHE_DATA_TYPE_FP8E4M3,
+    "fp8e4m3": FP8_KV_CACHE_DATA_TYPE_FP8E4M3,
+    "fp8_e5m2": FP8_KV_CACHE_DATA_TYPE_FP8E5M2,
+    "fp8e5m2": FP8_KV_CACHE_DATA_TYPE_FP8E5M2,
+}
+
+# elements of key (and of value) moved by a program
+TILE_NUMEL = 4096
+
 
-@libentry()
 @triton.jit
+def quant_to_cache(val, scale, kv_dtype: tl.constexpr):
+    # saturating conversion, as the fp8 kv cache of vllm
+    if kv_dtype == FP8_KV_CACHE_DATA_TYPE_FP8E4M3:
+        val = tl.clamp(val.to(tl.float32) / scale, -448.0, 448.0)
+        val = val.to(tl.float8e4nv).to(tl.uint8, bitcast=True)
+    elif kv_dtype == FP8_KV_CACHE_DATA_TYPE_FP8E5M2:
+        val = tl.clamp(val.to(tl.float32) / scale, -57344.0, 57344.0)
+        val = val.to(tl.float8e5).to(tl.uint8, bitcast=True)
+    return val
+
+
+@libentry()
+@triton.jit(do_not_specialize=["num_tokens"])
 def reshape_and_cache_flash_kernel(
-    key,
-    value,
-    key_cache,
-    value_cache,
-    slot_mapping,
-    block_stride,
+    key,  # [num_tokens, num_heads, head_size]
+    value,  # [num_tokens, num_heads, head_size]
+    key_cache,  # [num_blocks, block_size, num_heads, head_size]
+    value_cache,  # [num_blocks, block_size, num_heads, head_size]
+    slot_mapping,  # [num_tokens]
+    k_scale,
+    v_scale,
+    num_tokens,
     key_stride,
+    key_head_stride,
     value_stride,
-    num_heads,
+    value_head_stride,
+    block_stride,
+    page_stride,
+    head_stride,
     head_size,
     block_size,
-    k_scale,
-    v_scale,
-    n: tl.constexpr,
+    kv_dtype: tl.constexpr,  # one of Fp8KVCacheDataType
+    BLOCK_T: tl.constexpr,
+    BLOCK_D: tl.constexpr,
 ):
-    token_idx = tl.program_id(0)
-    slot_idx = tl.load(slot_mapping + token_idx)
-    if slot_idx < 0:
+    # a program copies one head of BLOCK_T tokens
+    pid_t = tl.program_id(0)
+    head_idx = tl.program_id(1)
+
+    token_idx = pid_t * BLOCK_T + tl.arange(0, BLOCK_T)
+    slot_idx = tl.load(slot_mapping + token_idx, mask=token_idx < num_tokens, other=-1)
+    token_mask = slot_idx >= 0
+    # skip the tiles of padded tokens at once
+    if tl.max(slot_idx, axis=0) < 0:
         return
 
     block_idx = slot_idx // block_size
     block_offset = slot_idx % block_size
-    i = tl.arange(0, triton.next_power_of_2(n))
-    mask = i < n
+    tgt_idx = block_idx * block_stride + block_offset * page_stride
+    tgt_idx += head_idx * head_stride
+    src_key_idx = token_idx * key_stride + head_idx * key_head_stride
+    src_value_idx = token_idx * value_stride + head_idx * value_head_stride
 
-    src_key_idx = token_idx * key_stride + i
-    src_value_idx = token_idx * value_stride + i
-    head_idx = i // head_size
-    head_offset = i % head_size
-    tgt_key_value_idx = (
-        block_idx * block_stride
-        + block_offset * num_heads * head_size
-        + head_idx * head_size
-        + head_offset
-    )
+    if kv_dtype != FP8_KV_CACHE_DATA_TYPE_AUTO:
+        k_scale_val = tl.load(k_scale)
+        v_scale_val = tl.load(v_scale)
 
-    tgt_key = tl.load(key + src_key_idx, mask=mask)
-    tgt_value = tl.load(value + src_value_idx, mask=mask)
+    for d in range(0, head_size, BLOCK_D):
+        offs_d = d + tl.arange(0, BLOCK_D)
+        mask = token_mask[:, None] & (offs_d < head_size)[None, :]
 
-    # TODO: support fp8 dtype
-    tl.store(key_cache + tgt_key_value_idx, tgt_key, mask=mask)
-    tl.store(value_cache + tgt_key_value_idx, tgt_value, mask=mask)
+        tgt_key = tl.load(key + src_key_idx[:, None] + offs_d[None, :], mask=mask)
+        tgt_value = tl.load(value + src_value_idx[:, None] + offs_d[None, :], mask=mask)
+        if kv_dtype != FP8_KV_CACHE_DATA_TYPE_AUTO:
+            tgt_key = quant_to_cache(tgt_key, k_scale_val, kv_dtype)
+            tgt_value = quant_to_cache(tgt_value, v_scale_val, kv_dtype)
+
+        tgt_ptr_idx = tgt_idx[:, None] + offs_d[None, :]
+        tl.store(key_cache + tgt_ptr_idx, tgt_key, mask=mask)
+        tl.store(value_cache + tgt_ptr_idx, tgt_value, mask=mask)
 
 
 def reshape_and_cache_flash(
@@ -104,17 +147,33 @@ def reshape_and_cache_flash(
         # guarded so no other backend is affected.
         if vendor_name == "enflame" and slot_mapping.dtype == torch.int64:
             slot_mapping = slot_mapping.to(torch.int32)
+        kv_dtype = KV_DTYPE_MAP.get(kv_cache_dtype)
+        if kv_dtype is None:
+            raise ValueError(f"Unsupported kv_cache_dtype: {kv_cache_dtype}")
+        kv_dtype = int(kv_dtype)  # tl.constexpr->int
+        if kv_dtype != FP8_KV_CACHE_DATA_TYPE_AUTO:
+            if key_cache.element_size() != 1 or value_cache.element_size() != 1:
+                raise ValueError("For FP8 kv_cache must be uint8 or fp8 dtype")
+            # the kernel stores the bits of the fp8 values
+            key_cache = key_cache.view(torch.uint8)
+            value_cache = value_cache.view(torch.uint8)
+
         num_tokens = slot_mapping.size(0)
         num_heads = key.size(1)
         head_size = key.size(2)
         block_size = key_cache.size(1)
+        if num_tokens == 0:
+            return
 
-        key_stride = key.stride(0)
-        value_stride = value.stride(0)
-        block_stride = key_cache.stride(0)
-        assert key_cache.stride(0) == value_cache.stride(0)
+        assert key.stride(2) == 1 and value.stride(2) == 1
+        assert key_cache.stride() == value_cache.stride()
+        assert key_cache.stride(3) == 1
 
-        grid = (num_tokens,)
+        # several tokens per program, so that prefill chunks take few
+        # programs, and one head per program, so that stores are contiguous
+        BLOCK_D = min(triton.next_power_of_2(head_size), 256)
+        BLOCK_T = min(triton.next_power_of_2(num_tokens), TILE_NUMEL // BLOCK_D)
+        grid = (triton.cdiv(num_tokens, BLOCK_T), num_heads)
         with torch_device_fn.device(key.device):
             reshape_and_cache_flash_kernel[grid](
                 key,
@@ -122,13 +181,19 @@ def reshape_and_cache_flash(
                 key_cache,
                 value_cache,
                 slot_mapping,
-                block_stride,
-                key_stride,
-                value_stride,
-                num_heads,
-                head_size,
-                block_size,
                 k_scale,
                 v_scale,
-                num_heads * head_size,
+                num_tokens,
+                key.stride(0),
+                key.stride(1),
+                value.stride(0),
+                value.stride(1),
+                key_cache.stride(0),
+                key_cache.stride(1),
+                key_cache.stride(2),
+                head_size,
+                block_size,
+                kv_dtype=kv_dtype,
+                BLOCK_T=BLOCK_T,
+                BLOCK_D=BLOCK_D,
             )
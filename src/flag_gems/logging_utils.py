@@ -25,6 +25,7 @@ Notes
 """
 
 import logging
+import sys
 import traceback
 from pathlib import Path
 
@@ -215,8 +216,23 @@ def compare_outputs(fg_out, pt_out, rtol, atol):
 
 
 def enable_precision_check(
-    rtol=1e-4, atol=1e-5, log_once=True, max_checks=10, path=None
+    rtol=1e-4,
+    atol=1e-5,
+    log_once=True,
+    max_checks=10,
+    path=None,
+    mode="sync",
+    sample_rate=1.0,
+    max_pending=16,
 ):
+    """Configure the precision checks of ``PrecisionCheckRegister``.
+
+    ``mode="async"`` snapshots the sampled calls on the device & checks them on
+    a background thread; at most ``max_pending`` checks are queued, the others
+    are dropped.
+    """
+    if mode not in ("sync", "async"):
+        raise ValueError(f"precision check mode must be sync or async, got {mode}")
     setup_precision_logging(path)
     precision_config.update(
         {
@@ -226,11 +242,18 @@ def enable_precision_check(
             "log_once": log_once,
             "max_checks": max_checks,
             "logged_ops": set(),
+            "mode": mode,
+            "sample_rate": sample_rate,
+            "max_pending": max_pending,
         }
     )
 
 
 def disable_precision_check():
     """Close precision data file and disable precision check."""
+    # let the queued asynchronous checks log their results first
+    register = sys.modules.get("flag_gems.runtime.precision_register")
+    if register is not None:
+        register.wait_precision_checks()
     _close_precision_file()
     precision_config["enabled"] = False
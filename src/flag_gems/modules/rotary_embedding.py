@@ -9,13 +9,14 @@
 # - yarn_find_correction_range
 # - yarn_get_mscale
 # - yarn_linear_ramp_mask
-# - _set_cos_sin_cache method in `GemsDeepseekYarnRoPE`
+# - _compute_cos_sin method in `GemsDeepseekYarnRoPE`
 #
 # Source: https://huggingface.co/deepseek-ai/DeepSeek-R1/blob/main/modeling_deepseek.py
 # License: Apache License 2.0 (https://www.apache.org/licenses/LICENSE-2.0)
 
 import logging
 import math
+import threading
 from typing import Optional, Tuple, Union
 
 import torch
@@ -32,6 +33,55 @@ __all__ = [
     "GemsRope",
 ]
 
+# positions of the shared cos/sin caches are allocated in multiples of a chunk
+COS_SIN_CACHE_CHUNK = 1024
+
+_cos_sin_caches = {}
+_cos_sin_caches_lock = threading.Lock()
+
+
+class _CosSinCache:
+    """
+    cos/sin of the positions [0, capacity), shared by the RoPE modules with the
+    same rotary_dim, base, scaling, dtype & device.
+    """
+
+    __slots__ = ("cos", "sin", "capacity", "version")
+
+    def __init__(self):
+        self.cos = None
+        self.sin = None
+        self.capacity = 0
+        # bumped each time the cache grows into new tensors
+        self.version = 0
+
+    def reserve(self, num_positions, compute_cos_sin):
+        """
+        Grow to hold `num_positions` positions, at least doubling the capacity.
+        """
+        if num_positions <= self.capacity:
+            return
+        with _cos_sin_caches_lock:
+            if num_positions <= self.capacity:
+                return
+            capacity = max(num_positions, 2 * self.capacity)
+            capacity = -(-capacity // COS_SIN_CACHE_CHUNK) * COS_SIN_CACHE_CHUNK
+            # only the new positions are computed
+            cos, sin = compute_cos_sin(self.capacity, capacity)
+            if self.capacity > 0:
+                cos = torch.cat([self.cos, cos])
+                sin = torch.cat([self.sin, sin])
+            self.cos, self.sin, self.capacity = cos, sin, capacity
+            self.version += 1
+
+
+def _get_cos_sin_cache(key):
+    cache = _cos_sin_caches.get(key)
+    if cache is None:
+        with _cos_sin_caches_lock:
+            cache = _cos_sin_caches.setdefault(key, _CosSinCache())
+    return cache
+
 
 def gems_rope_forward(
     query: torch.Tensor,
@@ -69,6 +119,8 @@ class GemsRope(nn.Module):
     Args:
         rotary_dim (int): The rotary embedding dimension (typically equal to head_dim).
         max_position_embeddings (int): Initial maximum position length to precompute cache.
+            The cos/sin cache is shared by all the modules with the same rotary_dim, base,
+            scaling, dtype & device, and grows when longer sequences are seen.
         base (float): Frequency base used to compute inverse frequencies (default 10000).
         device (torch.device or None): Device to place initial buffers on.
         dtype (torch.dtype): Data type for the cos/sin cache buffers.
@@ -116,23 +168,67 @@ class GemsRope(nn.Module):
             )
         )
 
-    def _set_cos_sin_cache(self):
+    def _rope_scaling(self) -> tuple:
+        """
+        Parameters, besides rotary_dim & base, that the cos/sin values depend on.
+        """
+        return ()
+
+    def _compute_cos_sin(self, start, end) -> Tuple[torch.Tensor, torch.Tensor]:
         """
-        Default implementation of rotary embeddings (vanilla RoPE).
+        Default implementation of rotary embeddings (vanilla RoPE): cos/sin of the
+        positions [start, end), shape [end - start, rotary_dim // 2] each.
         Can be overridden in subclasses for NTK, YaRN, etc.
         """
         inv_freq = self._compute_inv_freq()
-        t = torch.arange(
-            self.max_position_embeddings, device=self.device, dtype=torch.float32
-        )
-        freqs = torch.outer(t, inv_freq)  # [max_position_embeddings, rotary_dim // 2]
+        t = torch.arange(start, end, device=self.device, dtype=torch.float32)
+        freqs = torch.outer(t, inv_freq)
+        return freqs.cos().to(self.dtype), freqs.sin().to(self.dtype)
 
+    def _set_cos_sin_cache(self):
+        key = (
+            self.rotary_dim,
+            self.base,
+            self._rope_scaling(),
+            self.dtype,
+            str(torch.device(self.device or "cpu")),
+        )
+        self._cos_sin_cache = _get_cos_sin_cache(key)
+        self._cos_sin_cache.reserve(self.max_position_embeddings, self._compute_cos_sin)
+        self._register_cos_sin_buffers()
+
+    def _register_cos_sin_buffers(self):
+        # Views of the shared cache, [max_position_embeddings, rotary_dim // 2].
+        # As buffers, they are moved & cast by .to(), .cuda(), .half(), etc.
+        cache = self._cos_sin_cache
         self.register_buffer(
-            "cos_cached", freqs.cos().to(self.dtype), persistent=False
-        )  # [max_position_embeddings, rotary_dim // 2]
+            "cos_cached", cache.cos[: self.max_position_embeddings], persistent=False
+        )
         self.register_buffer(
-            "sin_cached", freqs.sin().to(self.dtype), persistent=False
-        )  # [max_position_embeddings, rotary_dim // 2]
+            "sin_cached", cache.sin[: self.max_position_embeddings], persistent=False
+        )
+        self._cos_sin_version = cache.version
+
+    def _apply(self, fn, *args, **kwargs):
+        super()._apply(fn, *args, **kwargs)
+        cos = self.cos_cached
+        if cos is None:
+            return self
+        if cos.device != torch.device(self.device or "cpu") or cos.dtype != self.dtype:
+            # share the cache of the new device & dtype instead of the moved copy
+            self.device, self.dtype = cos.device, cos.dtype
+            self._set_cos_sin_cache()
+        return self
+
+    def extend_cos_sin_cache(self, num_positions: int):
+        """
+        Make the positions [0, num_positions) available, e.g. before a request whose
+        position_ids exceed max_position_embeddings.
+        """
+        if num_positions > self.max_position_embeddings:
+            self._cos_sin_cache.reserve(num_positions, self._compute_cos_sin)
+            self.max_position_embeddings = num_positions
+            self._register_cos_sin_buffers()
 
     def forward(
         self,
@@ -141,8 +237,11 @@ class GemsRope(nn.Module):
         position_ids: Optional[torch.IntTensor] = None,
         inplace: bool = False,
     ) -> Tuple[torch.Tensor, torch.Tensor]:
-        if not hasattr(self, "cos_cached") or not hasattr(self, "sin_cached"):
-            self._set_cos_sin_cache()
+        if position_ids is None and query.dim() == 4:
+            self.extend_cos_sin_cache(query.shape[-3])
+        if self._cos_sin_version != self._cos_sin_cache.version:
+            # the shared cache grew for another module, drop the old tensors
+            self._register_cos_sin_buffers()
 
         return gems_rope_forward(
             query,
@@ -269,23 +368,27 @@ class GemsDeepseekYarnRoPE(GemsRope):
         inv_freq = freq_inter * (1 - inv_freq_mask) + freq_extra * inv_freq_mask
         return inv_freq
 
-    def _set_cos_sin_cache(self):
+    def _rope_scaling(self) -> tuple:
+        return (
+            self.scaling_factor,
+            self.original_max_position_embeddings,
+            self.beta_fast,
+            self.beta_slow,
+            self.mscale,
+            self.mscale_all_dim,
+        )
+
+    def _compute_cos_sin(self, start, end) -> Tuple[torch.Tensor, torch.Tensor]:
         inv_freq = self._compute_inv_freq()
-        # self.register_buffer("inv_freq", inv_freq, persistent=False)
 
-        t = torch.arange(
-            self.max_position_embeddings, device=self.device, dtype=torch.float32
-        )
-        freqs = torch.outer(t, inv_freq)  # [max_position_embeddings, rotary_dim // 2]
+        t = torch.arange(start, end, device=self.device, dtype=torch.float32)
+        freqs = torch.outer(t, inv_freq)  # [end - start, rotary_dim // 2]
 
         _mscale = float(
             yarn_get_mscale(self.scaling_factor, self.mscale)
             / yarn_get_mscale(self.scaling_factor, self.mscale_all_dim)
         )
 
-        self.register_buffer(
-            "cos_cached", (freqs.cos() * _mscale).to(self.dtype), persistent=False
-        )
-        self.register_buffer(
-            "sin_cached", (freqs.sin() * _mscale).to(self.dtype), persistent=False
+        return (freqs.cos() * _mscale).to(self.dtype), (freqs.sin() * _mscale).to(
+            self.dtype
         )
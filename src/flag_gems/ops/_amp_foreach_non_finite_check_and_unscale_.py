@@ -21,6 +21,10 @@ import triton
 import triton.language as tl
 
 from flag_gems.utils import tl_extra_shim
+from flag_gems.utils.multi_tensor_apply import (
+    can_use_multi_tensor_apply,
+    multi_tensor_apply,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +93,18 @@ def _amp_foreach_non_finite_check_and_unscale_(
     # Ensure inv_scale is a float32 tensor as PyTorch expects
     inv_scale = inv_scale.to(dtype=torch.float32)
 
+    # Unscale & check all the tensors with a launch per dtype when possible
+    if (
+        can_use_multi_tensor_apply(tensors)
+        and found_inf.dtype == torch.float32
+        and found_inf.device == tensors[0].device
+        and inv_scale.device == tensors[0].device
+    ):
+        multi_tensor_apply(
+            "unscale", list(tensors), tensors, scalar=inv_scale, found_inf=found_inf
+        )
+        return
+
     # Process each tensor in the list
     for tensor in tensors:
         if not tensor.is_floating_point():
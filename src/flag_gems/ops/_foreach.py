@@ -0,0 +1,287 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+import torch
+
+from flag_gems.utils.multi_tensor_apply import (
+    MTA_NORMS,
+    can_use_multi_tensor_apply,
+    multi_tensor_apply,
+    multi_tensor_norm,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _foreach_apply(op, inputs, fallback, scalar=1.0, inplace=False):
+    """Apply `op` to the lists `inputs` with `multi_tensor_apply`.
+
+    Lists it does not support are computed tensor by tensor with `fallback`,
+    which takes the tensors at an index of the lists.
+    """
+    self = inputs[0]
+    if isinstance(scalar, complex) or not can_use_multi_tensor_apply(*inputs):
+        results = [fallback(*tensors) for tensors in zip(*inputs)]
+        if not inplace:
+            return results
+        for tensor, result in zip(self, results):
+            tensor.copy_(result)
+        return None
+    if inplace:
+        out = list(self)
+    else:
+        # the kernel writes row-major results, whatever the strides of the inputs
+        out = [torch.empty_like(t, memory_format=torch.contiguous_format) for t in self]
+    multi_tensor_apply(op, out, *inputs, scalar=scalar)
+    return None if inplace else out
+
+
+def _foreach_add_list(self, other, *, alpha=1):
+    logger.debug("GEMS _FOREACH_ADD.LIST")
+    return _foreach_apply(
+        "add", [self, other], lambda x, y: torch.add(x, y, alpha=alpha), alpha
+    )
+
+
+def _foreach_add_list_(self, other, *, alpha=1):
+    logger.debug("GEMS _FOREACH_ADD_.LIST")
+    return _foreach_apply(
+        "add",
+        [self, other],
+        lambda x, y: torch.add(x, y, alpha=alpha),
+        alpha,
+        inplace=True,
+    )
+
+
+def _foreach_add_scalar(self, scalar):
+    logger.debug("GEMS _FOREACH_ADD.SCALAR")
+    return _foreach_apply("add_scalar", [self], lambda x: x + scalar, scalar)
+
+
+def _foreach_add_scalar_(self, scalar):
+    logger.debug("GEMS _FOREACH_ADD_.SCALAR")
+    return _foreach_apply(
+        "add_scalar", [self], lambda x: x + scalar, scalar, inplace=True
+    )
+
+
+def _foreach_sub_list(self, other, *, alpha=1):
+    logger.debug("GEMS _FOREACH_SUB.LIST")
+    return _foreach_apply(
+        "sub", [self, other], lambda x, y: torch.sub(x, y, alpha=alpha), alpha
+    )
+
+
+def _foreach_sub_list_(self, other, *, alpha=1):
+    logger.debug("GEMS _FOREACH_SUB_.LIST")
+    return _foreach_apply(
+        "sub",
+        [self, other],
+        lambda x, y: torch.sub(x, y, alpha=alpha),
+        alpha,
+        inplace=True,
+    )
+
+
+def _foreach_sub_scalar(self, scalar):
+    logger.debug("GEMS _FOREACH_SUB.SCALAR")
+    return _foreach_apply("sub_scalar", [self], lambda x: x - scalar, scalar)
+
+
+def _foreach_sub_scalar_(self, scalar):
+    logger.debug("GEMS _FOREACH_SUB_.SCALAR")
+    return _foreach_apply(
+        "sub_scalar", [self], lambda x: x - scalar, scalar, inplace=True
+    )
+
+
+def _foreach_mul_list(self, other):
+    logger.debug("GEMS _FOREACH_MUL.LIST")
+    return _foreach_apply("mul", [self, other], torch.mul)
+
+
+def _foreach_mul_list_(self, other):
+    logger.debug("GEMS _FOREACH_MUL_.LIST")
+    return _foreach_apply("mul", [self, other], torch.mul, inplace=True)
+
+
+def _foreach_mul_scalar(self, scalar):
+    logger.debug("GEMS _FOREACH_MUL.SCALAR")
+    return _foreach_apply("mul_scalar", [self], lambda x: x * scalar, scalar)
+
+
+def _foreach_mul_scalar_(self, scalar):
+    logger.debug("GEMS _FOREACH_MUL_.SCALAR")
+    return _foreach_apply(
+        "mul_scalar", [self], lambda x: x * scalar, scalar, inplace=True
+    )
+
+
+def _foreach_mul_tensor(self, other):
+    logger.debug("GEMS _FOREACH_MUL.TENSOR")
+    if other.numel() != 1 or len(self) == 0 or other.device != self[0].device:
+        return [torch.mul(x, other) for x in self]
+    return _foreach_apply("mul_scalar", [self], lambda x: x * other, other)
+
+
+def _foreach_mul_tensor_(self, other):
+    logger.debug("GEMS _FOREACH_MUL_.TENSOR")
+    if other.numel() != 1 or len(self) == 0 or other.device != self[0].device:
+        for x in self:
+            x.mul_(other)
+        return None
+    return _foreach_apply(
+        "mul_scalar", [self], lambda x: x * other, other, inplace=True
+    )
+
+
+def _foreach_div_list(self, other):
+    logger.debug("GEMS _FOREACH_DIV.LIST")
+    return _foreach_apply("div", [self, other], torch.div)
+
+
+def _foreach_div_list_(self, other):
+    logger.debug("GEMS _FOREACH_DIV_.LIST")
+    return _foreach_apply("div", [self, other], torch.div, inplace=True)
+
+
+def _foreach_div_scalar(self, scalar):
+    logger.debug("GEMS _FOREACH_DIV.SCALAR")
+    return _foreach_apply("div_scalar", [self], lambda x: x / scalar, scalar)
+
+
+def _foreach_div_scalar_(self, scalar):
+    logger.debug("GEMS _FOREACH_DIV_.SCALAR")
+    return _foreach_apply(
+        "div_scalar", [self], lambda x: x / scalar, scalar, inplace=True
+    )
+
+
+def _foreach_lerp_scalar(self, tensors1, weight):
+    logger.debug("GEMS _FOREACH_LERP.SCALAR")
+    return _foreach_apply(
+        "lerp", [self, tensors1], lambda x, y: torch.lerp(x, y, weight), weight
+    )
+
+
+def _foreach_lerp_scalar_(self, tensors1, weight):
+    logger.debug("GEMS _FOREACH_LERP_.SCALAR")
+    return _foreach_apply(
+        "lerp",
+        [self, tensors1],
+        lambda x, y: torch.lerp(x, y, weight),
+        weight,
+        inplace=True,
+    )
+
+
+def _foreach_addcmul_scalar(self, tensor1, tensor2, value=1):
+    logger.debug("GEMS _FOREACH_ADDCMUL.SCALAR")
+    return _foreach_apply(
+        "addcmul",
+        [self, tensor1, tensor2],
+        lambda x, y, z: torch.addcmul(x, y, z, value=value),
+        value,
+    )
+
+
+def _foreach_addcmul_scalar_(self, tensor1, tensor2, value=1):
+    logger.debug("GEMS _FOREACH_ADDCMUL_.SCALAR")
+    return _foreach_apply(
+        "addcmul",
+        [self, tensor1, tensor2],
+        lambda x, y, z: torch.addcmul(x, y, z, value=value),
+        value,
+        inplace=True,
+    )
+
+
+def _foreach_addcdiv_scalar(self, tensor1, tensor2, value=1):
+    logger.debug("GEMS _FOREACH_ADDCDIV.SCALAR")
+    return _foreach_apply(
+        "addcdiv",
+        [self, tensor1, tensor2],
+        lambda x, y, z: torch.addcdiv(x, y, z, value=value),
+        value,
+    )
+
+
+def _foreach_addcdiv_scalar_(self, tensor1, tensor2, value=1):
+    logger.debug("GEMS _FOREACH_ADDCDIV_.SCALAR")
+    return _foreach_apply(
+        "addcdiv",
+        [self, tensor1, tensor2],
+        lambda x, y, z: torch.addcdiv(x, y, z, value=value),
+        value,
+        inplace=True,
+    )
+
+
+def _foreach_sqrt(self):
+    logger.debug("GEMS _FOREACH_SQRT")
+    return _foreach_apply("sqrt", [self], torch.sqrt)
+
+
+def _foreach_sqrt_(self):
+    logger.debug("GEMS _FOREACH_SQRT_")
+    return _foreach_apply("sqrt", [self], torch.sqrt, inplace=True)
+
+
+def _foreach_neg(self):
+    logger.debug("GEMS _FOREACH_NEG")
+    return _foreach_apply("neg", [self], torch.neg)
+
+
+def _foreach_neg_(self):
+    logger.debug("GEMS _FOREACH_NEG_")
+    return _foreach_apply("neg", [self], torch.neg, inplace=True)
+
+
+def _foreach_reciprocal(self):
+    logger.debug("GEMS _FOREACH_RECIPROCAL")
+    return _foreach_apply("reciprocal", [self], torch.reciprocal)
+
+
+def _foreach_reciprocal_(self):
+    logger.debug("GEMS _FOREACH_RECIPROCAL_")
+    return _foreach_apply("reciprocal", [self], torch.reciprocal, inplace=True)
+
+
+def _foreach_exp(self):
+    logger.debug("GEMS _FOREACH_EXP")
+    return _foreach_apply("exp", [self], torch.exp)
+
+
+def _foreach_exp_(self):
+    logger.debug("GEMS _FOREACH_EXP_")
+    return _foreach_apply("exp", [self], torch.exp, inplace=True)
+
+
+def _foreach_zero_(self):
+    logger.debug("GEMS _FOREACH_ZERO_")
+    return _foreach_apply("zero", [self], torch.zeros_like, inplace=True)
+
+
+def _foreach_norm(self, ord=2, dtype=None):
+    logger.debug("GEMS _FOREACH_NORM")
+    if (
+        dtype is not None
+        or ord not in MTA_NORMS
+        or not can_use_multi_tensor_apply(self)
+    ):
+        return [torch.linalg.vector_norm(x, ord, dtype=dtype) for x in self]
+    return multi_tensor_norm(self, ord)
@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import logging
-import math
 
 import torch
 import triton
@@ -23,6 +22,7 @@ from flag_gems import runtime
 from flag_gems.runtime import torch_device_fn
 from flag_gems.utils import dim_compress, libentry, libtuner
 from flag_gems.utils import triton_lang_extension as ext
+from flag_gems.utils.reduction_utils import full_reduce
 
 logger = logging.getLogger(__name__)
 
@@ -69,51 +69,12 @@ def all_kernel_dim(
     tl.store(out, all[:, None], row_mask)
 
 
-@libentry()
-@triton.jit
-def all_kernel_1(
-    inp,
-    mid,
-    n_elements,
-    mid_size,
-    BLOCK_SIZE: tl.constexpr,
-):
-    pid = ext.program_id(0)
-    offset = pid * BLOCK_SIZE + tl.arange(0, BLOCK_SIZE)
-    inp_ptrs = inp + offset
-    mask = offset < n_elements
-    inp_val = tl.load(inp_ptrs, mask=mask, other=1.0)
-    all_val = tl.reduce(inp_val != 0, axis=0, combine_fn=reduce_all)
-    mid_ptr = mid + pid
-    tl.store(mid_ptr, all_val)
-
-
-@libentry()
-@triton.jit
-def all_kernel_2(mid, out, MID_SIZE, BLOCK_MID: tl.constexpr):
-    offset = tl.arange(0, BLOCK_MID)
-    mid_ptrs = mid + offset
-    mask = offset < MID_SIZE
-    mid_val = tl.load(mid_ptrs, mask=mask, other=1).to(tl.int1)
-    all_val = tl.reduce(mid_val, axis=0, combine_fn=reduce_all)
-    tl.store(out, all_val)
-
-
 def all(inp):
     logger.debug("GEMS ALL")
-    n_elements = inp.numel()
-    block_size = triton.next_power_of_2(math.ceil(math.sqrt(n_elements)))
-    mid_size = triton.cdiv(n_elements, block_size)
-    block_mid = triton.next_power_of_2(mid_size)
-
-    mid = torch.empty((mid_size,), dtype=torch.bool, device=inp.device)
+    if inp.numel() == 0:
+        return torch.full([], True, dtype=torch.bool, device=inp.device)
     out = torch.empty([], dtype=torch.bool, device=inp.device)
-
-    with torch_device_fn.device(inp.device):
-        all_kernel_1[(mid_size, 1)](inp, mid, n_elements, mid_size, block_size)
-        all_kernel_2[(1, 1)](mid, out, mid_size, block_mid)
-
-    return out
+    return full_reduce(inp.contiguous(), out, "all")
 
 
 def all_dim(inp, dim=None, keepdim=False):
@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import logging
-import math
 
 import torch
 import triton
@@ -21,49 +20,19 @@ import triton.language as tl
 
 from flag_gems import runtime
 from flag_gems.runtime import torch_device_fn
-from flag_gems.utils import dim_compress, libentry, libtuner
+from flag_gems.utils import libentry, libtuner, reduction_view
 from flag_gems.utils import triton_lang_extension as ext
 from flag_gems.utils.limits import get_dtype_min
+from flag_gems.utils.reduction_utils import full_reduce
 
 logger = logging.getLogger(__name__)
 
 
-@libentry()
-@triton.jit
-def amax_kernel_1(
-    inp,
-    mid,
-    M,
-    BLOCK_SIZE: tl.constexpr,
-):
-    pid = ext.program_id(0)
-
-    offset = pid * BLOCK_SIZE + tl.arange(0, BLOCK_SIZE)
-    inp_ptrs = inp + offset
-    mask = offset < M
-    min_value = get_dtype_min(inp.type.element_ty)
-    inp_val = tl.load(inp_ptrs, mask=mask, other=min_value)
-    amax_val = tl.max(inp_val)
-    mid_ptr = mid + pid
-    tl.store(mid_ptr, amax_val)
-
-
-@libentry()
-@triton.jit
-def amax_kernel_2(mid, out, mid_size, BLOCK_MID: tl.constexpr):
-    offset = tl.arange(0, BLOCK_MID)
-    mid_ptrs = mid + offset
-    mask = offset < mid_size
-    min_value = get_dtype_min(mid.type.element_ty)
-    mid_val = tl.load(mid_ptrs, mask=mask, other=min_value)
-    amax_val = tl.max(mid_val)
-    tl.store(out, amax_val)
-
-
 @libentry()
 @libtuner(
     configs=runtime.get_tuned_config("naive_reduction"),
-    key=["M", "N"],
+    # rows read in place may be strided, which changes the best config
+    key=["M", "N", "stride_n"],
 )
 @triton.jit
 def amax_kernel(
@@ -71,6 +40,8 @@ def amax_kernel(
     out,
     M,
     N,
+    stride_m,
+    stride_n,
     BLOCK_M: tl.constexpr,
     BLOCK_N: tl.constexpr,
 ):
@@ -80,7 +51,7 @@ def amax_kernel(
     # Map the program id to the row of inp it should compute.
     pid = ext.program_id(0)
     rows = pid * BLOCK_M + tl.arange(0, BLOCK_M)[:, None]
-    inp = inp + rows * N
+    inp = inp + rows * stride_m
     out = out + rows
     row_mask = rows < M
 
@@ -90,7 +61,7 @@ def amax_kernel(
         cols = off + tl.arange(0, BLOCK_N)[None, :]
         col_mask = cols < N
         mask = row_mask and col_mask
-        a = tl.load(inp + cols, mask, other=min_value)
+        a = tl.load(inp + cols * stride_n, mask, other=min_value)
         _all = tl.maximum(_all, a)
     all = tl.max(_all, axis=1)[:, None]
     tl.store(out, all, row_mask)
@@ -99,12 +70,7 @@ def amax_kernel(
 def amax(inp, dim=None, keepdim=False):
     logger.debug("GEMS AMAX")
     if dim is None or len(dim) == 0:
-        M = inp.numel()
-        block_size = triton.next_power_of_2(math.ceil(math.sqrt(M)))
-        mid_size = triton.cdiv(M, block_size)
-        block_mid = triton.next_power_of_2(mid_size)
         dtype = inp.dtype
-        mid = torch.empty((mid_size,), dtype=dtype, device=inp.device)
         if not keepdim:
             out = torch.empty([], dtype=dtype, device=inp.device)
         else:
@@ -112,17 +78,7 @@ def amax(inp, dim=None, keepdim=False):
             for i in range(0, inp.dim()):
                 shape[i] = 1
             out = torch.empty(shape, dtype=dtype, device=inp.device)
-        with torch_device_fn.device(inp.device):
-            amax_kernel_1[(mid_size, 1)](
-                inp,
-                mid,
-                M,
-                block_size,
-            )
-            amax_kernel_2[(1, 1)](
-                mid, out, mid_size, block_mid
-            )  # max block size is 128k, so mid does not requires int64 index
-        return out
+        return full_reduce(inp.contiguous(), out, "max")
     else:
         if isinstance(dim, int):
             dim = [dim]
@@ -131,18 +87,15 @@ def amax(inp, dim=None, keepdim=False):
 
         shape = list(inp.shape)
         dim = [d % inp.ndim for d in dim]
-        inp = dim_compress(inp, dim)
-        N = 1
+        inp, M, N, stride_m, stride_n = reduction_view(inp, dim)
         for i in dim:
-            N *= shape[i]
             shape[i] = 1
-        M = inp.numel() // N
 
         out = torch.empty(shape, dtype=dtype, device=inp.device)
 
         grid = lambda meta: (triton.cdiv(M, meta["BLOCK_M"]),)
         with torch_device_fn.device(inp.device):
-            amax_kernel[grid](inp, out, M, N)
+            amax_kernel[grid](inp, out, M, N, stride_m, stride_n)
         if not keepdim:
             out = out.squeeze(dim=dim)
         return out
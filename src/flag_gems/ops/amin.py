@@ -15,7 +15,6 @@
 # Generated by KernelGen: https://github.com/flagos-ai/KernelGen
 
 import logging
-import math
 
 import torch
 import triton
@@ -23,49 +22,19 @@ import triton.language as tl
 
 from flag_gems import runtime
 from flag_gems.runtime import torch_device_fn
-from flag_gems.utils import dim_compress, libentry, libtuner
+from flag_gems.utils import libentry, libtuner, reduction_view
 from flag_gems.utils import triton_lang_extension as tle
 from flag_gems.utils.limits import get_dtype_max
+from flag_gems.utils.reduction_utils import full_reduce
 
 logger = logging.getLogger(__name__)
 
 
-@libentry()
-@triton.jit
-def amin_kernel_1(
-    inp,
-    mid,
-    M,
-    BLOCK_SIZE: tl.constexpr,
-):
-    pid = tle.program_id(0)
-
-    offset = pid * BLOCK_SIZE + tl.arange(0, BLOCK_SIZE)
-    inp_ptrs = inp + offset
-    mask = offset < M
-    max_value = get_dtype_max(inp.type.element_ty)
-    inp_val = tl.load(inp_ptrs, mask=mask, other=max_value)
-    amin_val = tl.min(inp_val)
-    mid_ptr = mid + pid
-    tl.store(mid_ptr, amin_val)
-
-
-@libentry()
-@triton.jit
-def amin_kernel_2(mid, out, mid_size, BLOCK_MID: tl.constexpr):
-    offset = tl.arange(0, BLOCK_MID)
-    mid_ptrs = mid + offset
-    mask = offset < mid_size
-    max_value = get_dtype_max(mid.type.element_ty)
-    mid_val = tl.load(mid_ptrs, mask=mask, other=max_value)
-    amin_val = tl.min(mid_val)
-    tl.store(out, amin_val)
-
-
 @libentry()
 @libtuner(
     configs=runtime.get_tuned_config("naive_reduction"),
-    key=["M", "N"],
+    # rows read in place may be strided, which changes the best config
+    key=["M", "N", "stride_n"],
 )
 @triton.jit
 def amin_kernel(
@@ -73,6 +42,8 @@ def amin_kernel(
     out,
     M,
     N,
+    stride_m,
+    stride_n,
     BLOCK_M: tl.constexpr,
     BLOCK_N: tl.constexpr,
 ):
@@ -82,7 +53,7 @@ def amin_kernel(
     # Map the program id to the row of inp it should compute.
     pid = tle.program_id(0)
     rows = pid * BLOCK_M + tl.arange(0, BLOCK_M)[:, None]
-    inp = inp + rows * N
+    inp = inp + rows * stride_m
     out = out + rows
     row_mask = rows < M
 
@@ -92,7 +63,7 @@ def amin_kernel(
         cols = off + tl.arange(0, BLOCK_N)[None, :]
         col_mask = cols < N
         mask = row_mask and col_mask
-        a = tl.load(inp + cols, mask, other=max_value)
+        a = tl.load(inp + cols * stride_n, mask, other=max_value)
         _all = tl.minimum(_all, a)
     all = tl.min(_all, axis=1)[:, None]
     tl.store(out, all, row_mask)
@@ -106,12 +77,7 @@ def amin(inp, dim=None, keepdim=False):
         torch.bfloat16,
     ), "amin only supports float dtypes"
     if dim is None or len(dim) == 0:
-        M = inp.numel()
-        block_size = triton.next_power_of_2(math.ceil(math.sqrt(M)))
-        mid_size = triton.cdiv(M, block_size)
-        block_mid = triton.next_power_of_2(mid_size)
         dtype = inp.dtype
-        mid = torch.empty((mid_size,), dtype=dtype, device=inp.device)
         if not keepdim:
             out = torch.empty([], dtype=dtype, device=inp.device)
         else:
@@ -119,17 +85,7 @@ def amin(inp, dim=None, keepdim=False):
             for i in range(0, inp.dim()):
                 shape[i] = 1
             out = torch.empty(shape, dtype=dtype, device=inp.device)
-        with torch_device_fn.device(inp.device):
-            amin_kernel_1[(mid_size, 1)](
-                inp,
-                mid,
-                M,
-                block_size,
-            )
-            amin_kernel_2[(1, 1)](
-                mid, out, mid_size, block_mid
-            )  # max block size is 128k, so mid does not requires int64 index
-        return out
+        return full_reduce(inp.contiguous(), out, "min")
     else:
         if isinstance(dim, int):
             dim = [dim]
@@ -138,18 +94,15 @@ def amin(inp, dim=None, keepdim=False):
 
         shape = list(inp.shape)
         dim = [d % inp.ndim for d in dim]
-        inp = dim_compress(inp, dim)
-        N = 1
+        inp, M, N, stride_m, stride_n = reduction_view(inp, dim)
         for i in dim:
-            N *= shape[i]
             shape[i] = 1
-        M = inp.numel() // N
 
         out = torch.empty(shape, dtype=dtype, device=inp.device)
 
         grid = lambda meta: (triton.cdiv(M, meta["BLOCK_M"]),)
         with torch_device_fn.device(inp.device):
-            amin_kernel[grid](inp, out, M, N)
+            amin_kernel[grid](inp, out, M, N, stride_m, stride_n)
         if not keepdim:
             out = out.squeeze(dim=dim)
         return out
@@ -165,12 +118,7 @@ def amin_(inp, dim=None, keepdim=False):
     if isinstance(dim, int):
         dim = [dim]
     if dim is None or len(dim) == 0:
-        M = inp.numel()
-        block_size = triton.next_power_of_2(math.ceil(math.sqrt(M)))
-        mid_size = triton.cdiv(M, block_size)
-        block_mid = triton.next_power_of_2(mid_size)
         dtype = inp.dtype
-        mid = torch.empty((mid_size,), dtype=dtype, device=inp.device)
         if not keepdim:
             out = torch.empty([], dtype=dtype, device=inp.device)
         else:
@@ -178,14 +126,7 @@ def amin_(inp, dim=None, keepdim=False):
             for i in range(0, inp.dim()):
                 shape[i] = 1
             out = torch.empty(shape, dtype=dtype, device=inp.device)
-        with torch_device_fn.device(inp.device):
-            amin_kernel_1[(mid_size, 1)](
-                inp,
-                mid,
-                M,
-                block_size,
-            )
-            amin_kernel_2[(1, 1)](mid, out, mid_size, block_mid)
+        full_reduce(inp.contiguous(), out, "min")
         inp.copy_(out.reshape(inp.shape) if keepdim else out)
         return inp
     else:
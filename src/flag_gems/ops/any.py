@@ -27,6 +27,7 @@ from flag_gems.utils import dim_compress, libentry, libtuner
 from flag_gems.utils import triton_lang_extension as ext
 from flag_gems.utils.code_cache import code_cache_dir
 from flag_gems.utils.code_utils import IndentedBuffer, write_atomic
+from flag_gems.utils.reduction_utils import full_reduce
 
 logger = logging.getLogger(__name__)
 
@@ -73,51 +74,12 @@ def any_kernel_dim(
     tl.store(out, any[:, None], row_mask)
 
 
-@libentry()
-@triton.jit
-def any_kernel_1(
-    inp,
-    mid,
-    n_elements,
-    mid_size,
-    BLOCK_SIZE: tl.constexpr,
-):
-    pid = ext.program_id(0)
-    offset = pid * BLOCK_SIZE + tl.arange(0, BLOCK_SIZE)
-    inp_ptrs = inp + offset
-    mask = offset < n_elements
-    inp_val = tl.load(inp_ptrs, mask=mask, other=0.0)
-    any_val = tl.reduce(inp_val != 0, axis=0, combine_fn=reduce_any)
-    mid_ptr = mid + pid
-    tl.store(mid_ptr, any_val)
-
-
-@libentry()
-@triton.jit
-def any_kernel_2(mid, out, MID_SIZE, BLOCK_MID: tl.constexpr):
-    offset = tl.arange(0, BLOCK_MID)
-    mid_ptrs = mid + offset
-    mask = offset < MID_SIZE
-    mid_val = tl.load(mid_ptrs, mask=mask, other=0).to(tl.int1)
-    any_val = tl.reduce(mid_val, axis=0, combine_fn=reduce_any)
-    tl.store(out, any_val)
-
-
 def any(inp):
     logger.debug("GEMS ANY")
-    n_elements = inp.numel()
-    block_size = triton.next_power_of_2(math.ceil(math.sqrt(n_elements)))
-    mid_size = triton.cdiv(n_elements, block_size)
-    block_mid = triton.next_power_of_2(mid_size)
-
-    mid = torch.empty((mid_size,), dtype=torch.bool, device=inp.device)
+    if inp.numel() == 0:
+        return torch.full([], False, dtype=torch.bool, device=inp.device)
     out = torch.empty([], dtype=torch.bool, device=inp.device)
-
-    with torch_device_fn.device(inp.device):
-        any_kernel_1[(mid_size, 1)](inp, mid, n_elements, mid_size, block_size)
-        any_kernel_2[(1, 1)](mid, out, mid_size, block_mid)
-
-    return out
+    return full_reduce(inp.contiguous(), out, "any")
 
 
 def any_dim(inp, dim=None, keepdim=False):
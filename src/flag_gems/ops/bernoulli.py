@@ -22,6 +22,7 @@ import triton.language as tl
 from flag_gems.runtime import torch_device_fn
 from flag_gems.utils import libentry
 from flag_gems.utils.random_utils import (
+    load_philox_seed_offset,
     philox_backend_seed_offset,
     uint_to_uniform_float,
 )
@@ -50,8 +51,7 @@ def bernoulli_kernel(
     BLOCK: tl.constexpr,
 ):
     UNROLL: tl.constexpr = 4  # philox generate 128 random bits at a time
-    philox_seed = philox_seed.to(tl.int64)
-    philox_offset = philox_offset.to(tl.int64)
+    philox_seed, philox_offset = load_philox_seed_offset(philox_seed, philox_offset)
     c0 = (philox_offset & 0xFFFFFFFF).to(tl.uint32)
     c1 = ((philox_offset >> 32) & 0xFFFFFFFF).to(tl.uint32)
     i4 = tl.program_id(0) * BLOCK + tl.arange(0, BLOCK)
@@ -98,9 +98,9 @@ def bernoulli(self, *, generator=None):
     UNROLL = 4
     grid_fn = lambda meta: (triton.cdiv(N, meta["BLOCK"] * UNROLL),)
     increment = triton.cdiv(N, UNROLL)
-    philox_seed, philox_offset = philox_backend_seed_offset(
-        increment, generator=generator
-    )
     with torch_device_fn.device(device):
+        philox_seed, philox_offset = philox_backend_seed_offset(
+            increment, generator=generator, capturable=True
+        )
         bernoulli_kernel[grid_fn](out, self, N, philox_seed, philox_offset)
     return out
@@ -21,6 +21,7 @@ import triton.language as tl
 from flag_gems import runtime
 from flag_gems.runtime import torch_device_fn
 from flag_gems.utils.random_utils import (
+    load_philox_seed_offset,
     philox_backend_seed_offset,
     uint_to_uniform_float,
 )
@@ -39,8 +40,7 @@ def bernoulli_kernel(
     philox_offset,
     BLOCK: tl.constexpr,
 ):
-    philox_seed = philox_seed.to(tl.int64)
-    philox_offset = philox_offset.to(tl.int64)
+    philox_seed, philox_offset = load_philox_seed_offset(philox_seed, philox_offset)
     c0 = (philox_offset & 0xFFFFFFFF).to(tl.uint32)
     c1 = ((philox_offset >> 32) & 0xFFFFFFFF).to(tl.uint32)
     i4 = tl.program_id(0) * BLOCK + tl.arange(0, BLOCK)
@@ -80,9 +80,9 @@ def bernoulli_(self, p=0.5, *, generator=None):
     grid_fn = lambda meta: (triton.cdiv(N, meta["BLOCK"] * UNROLL),)
 
     increment = triton.cdiv(N, UNROLL)
-    philox_seed, philox_offset = philox_backend_seed_offset(
-        increment, generator=generator
-    )
     with torch_device_fn.device(self.device):
+        philox_seed, philox_offset = philox_backend_seed_offset(
+            increment, generator=generator, capturable=True
+        )
         bernoulli_kernel[grid_fn](self, N, p, philox_seed, philox_offset)
     return self
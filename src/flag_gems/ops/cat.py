@@ -13,14 +13,21 @@
 # limitations under the License.
 
 import logging
+import math
 from typing import List, Tuple, Union
 
 import torch
 import triton
 import triton.language as tl
 
+from flag_gems.utils.table_utils import upload_table
+
 logger = logging.getLogger(__name__)
 
+# inputs copied by a launch of cat_copy_func_kernel_4
+CAT_GROUP_SIZE = 4
+CAT_BLOCK_SIZE = 1024
+
 
 def _is_float8_e8m0fnu(dtype: torch.dtype) -> bool:
     return str(dtype) == "torch.float8_e8m0fnu"
@@ -119,13 +126,110 @@ def cat_copy_func_kernel_4(
     tl.store(out_ptr + out_idx, data, mask=mask)
 
 
+@triton.jit
+def cat_copy_table_kernel(
+    out_ptr,
+    in_ref,
+    table,
+    num_inputs,
+    outer,
+    dim_size_out,
+    inner,
+    BLOCK_X: tl.constexpr,
+    SEARCH_STEPS: tl.constexpr,
+):
+    # table holds a row of (data pointer, size along dim, offset along dim,
+    # first program) for each input, all of them of the dtype of in_ref
+    pid = tl.program_id(0).to(tl.int64)
+
+    # binary search of the last input whose first program is not after pid,
+    # inputs without elements share their first program with the next one
+    lo = pid * 0
+    hi = lo + num_inputs - 1
+    for _ in tl.static_range(SEARCH_STEPS):
+        mid = (lo + hi + 1) // 2
+        found = tl.load(table + mid * 4 + 3) <= pid
+        lo = tl.where(found, mid, lo)
+        hi = tl.where(found, hi, mid - 1)
+
+    row = table + lo * 4
+    in_ptr = tl.load(row).to(tl.pointer_type(in_ref.dtype.element_ty))
+    dim_size_in = tl.load(row + 1)
+    dim_offset = tl.load(row + 2)
+    first_pid = tl.load(row + 3)
+
+    chunk = dim_size_in * inner
+    idx = (pid - first_pid) * BLOCK_X + tl.arange(0, BLOCK_X)
+    mask = idx < outer * chunk
+    pre_idx = idx // chunk
+    out_idx = pre_idx * dim_size_out * inner + dim_offset * inner + idx % chunk
+
+    data = tl.load(in_ptr + idx, mask=mask)
+    tl.store(out_ptr + out_idx, data.to(out_ptr.dtype.element_ty), mask=mask)
+
+
+def _cat_run_table_kernel(
+    A: List[torch.Tensor],
+    dim_sizes: List[int],
+    out: torch.Tensor,
+    outer: int,
+    dim_size_out: int,
+    inner: int,
+):
+    """Copy the inputs into `out` with one launch per input dtype.
+
+    The inputs are described by a table uploaded to the device, without
+    blocking, so the number of launches does not depend on the number of
+    inputs, and cast to the dtype of `out` in the copy.
+    """
+    groups = {}
+    dim_offset = 0
+    for tensor, dim_size in zip(A, dim_sizes):
+        groups.setdefault(tensor.dtype, []).append(
+            (tensor.contiguous(), dim_size, dim_offset)
+        )
+        dim_offset += dim_size
+
+    for inputs in groups.values():
+        rows = []
+        num_programs = 0
+        for tensor, dim_size, dim_offset in inputs:
+            rows.append((tensor.data_ptr(), dim_size, dim_offset, num_programs))
+            num_programs += triton.cdiv(outer * dim_size * inner, CAT_BLOCK_SIZE)
+        if num_programs == 0:
+            continue
+        table = upload_table(rows, out.device)
+        cat_copy_table_kernel[(num_programs,)](
+            out,
+            inputs[0][0],
+            table,
+            len(rows),
+            outer,
+            dim_size_out,
+            inner,
+            BLOCK_X=CAT_BLOCK_SIZE,
+            SEARCH_STEPS=max(len(rows) - 1, 0).bit_length(),
+        )
+
+
 def _cat_run_kernel(
     A: List[torch.Tensor],
     dim: int,
     out_shape: List[int],
     out: torch.Tensor,
 ):
-    BLOCK = 1024
+    if len(A) > CAT_GROUP_SIZE or any(t.dtype != out.dtype for t in A):
+        _cat_run_table_kernel(
+            A,
+            [t.shape[dim] for t in A],
+            out,
+            math.prod(out_shape[:dim]),
+            out_shape[dim],
+            math.prod(out_shape[dim + 1 :]),
+        )
+        return
+
+    BLOCK = CAT_BLOCK_SIZE
     dim_offset = 0
     i = 0
     while i < len(A):
@@ -244,11 +348,11 @@ def _cat_build_working_list(
                     f"{tensor_idx} in the list"
                 )
 
+    # the inputs are cast to the promoted dtype by the copy kernel
     dtypes = [t.dtype for t in A]
     dtype = dtypes[0]
     for dt in dtypes[1:]:
         dtype = torch.promote_types(dtype, dt)
-    A = [t.to(dtype) if t.dtype != dtype else t for t in A]
 
     shapes = [t.shape for t in A]
     cat_dim_sizes = [s[dim] for s in shapes]
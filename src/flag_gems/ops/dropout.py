@@ -21,6 +21,7 @@ import triton.language as tl
 from flag_gems import runtime
 from flag_gems.runtime import torch_device_fn
 from flag_gems.utils.random_utils import (
+    load_philox_seed_offset,
     philox_backend_seed_offset,
     uint_to_uniform_float,
 )
@@ -41,8 +42,7 @@ def dropout_forward_kernel(
     BLOCK: tl.constexpr,
 ):
     UNROLL: tl.constexpr = 4  # philox generate 128 random bits at a time
-    philox_seed = philox_seed.to(tl.int64)
-    philox_offset = philox_offset.to(tl.int64)
+    philox_seed, philox_offset = load_philox_seed_offset(philox_seed, philox_offset)
     c0 = (philox_offset & 0xFFFFFFFF).to(tl.uint32)
     c1 = ((philox_offset >> 32) & 0xFFFFFFFF).to(tl.uint32)
     i4 = tl.program_id(0) * BLOCK + tl.arange(0, BLOCK)
@@ -131,7 +131,9 @@ def dropout(input, p, train=True):
     # hence we cannot obtain the per thread offset as in Pytorch.
     increment = triton.cdiv(N, UNROLL)
     with torch_device_fn.device(device):
-        philox_seed, philox_offset = philox_backend_seed_offset(increment)
+        philox_seed, philox_offset = philox_backend_seed_offset(
+            increment, capturable=True
+        )
         dropout_forward_kernel[grid_fn](
             input, out, mask, N, p, philox_seed, philox_offset
         )
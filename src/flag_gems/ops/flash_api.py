@@ -14,6 +14,7 @@
 
 import logging
 import math
+import os
 
 import torch
 import triton
@@ -34,6 +35,18 @@ from flag_gems.utils.random_utils import philox_backend_seed_offset
 logger = logging.getLogger(__name__)
 _debug = False
 
+# Schedule the varlen forward over a list of the (sequence, m block) tiles of
+# the batch instead of a dense grid of max_seqlen_q blocks per sequence
+FLAGGEMS_FLASH_VARLEN_TILE_LIST = os.getenv(
+    "FLAGGEMS_FLASH_VARLEN_TILE_LIST", "1"
+).lower() in ("1", "true", "on")
+# the tile list is used when the dense grid has more programs than this ratio
+# times the upper bound of the number of tiles
+VARLEN_TILE_LIST_MIN_RATIO = 1.5
+VARLEN_TILE_LIST_CACHE_SIZE = 8
+
+_varlen_tile_lists = []
+
 
 def CHECK_DEVICE(x):
     assert x.device.type == flag_gems.device
@@ -247,6 +260,85 @@ class fwd_params:
         return tuple(getattr(self, k) for k in self.__slots__)
 
 
+def _is_capturing():
+    is_capturing = getattr(torch_device_fn, "is_current_stream_capturing", None)
+    return is_capturing is not None and is_capturing()
+
+
+def varlen_tile_list(
+    cu_seqlens_q,
+    cu_seqlens_k,
+    seqused_k,
+    total_q,
+    block_m,
+    is_causal,
+    window_size_left,
+    window_size_right,
+):
+    """Build the (sequence, m block) tiles of a varlen batch on the device.
+
+    Returns an int32 tensor of shape (2, num_tiles), the sequences then the m
+    blocks, without synchronizing with the host: num_tiles is the upper bound
+    cdiv(total_q, block_m) + batch_size and the unused tiles have sequence -1.
+    The tiles are sorted by decreasing number of KV rows so that the longest
+    ones are scheduled first.
+
+    The result is reused while the cu_seqlens tensors are not updated, e.g. by
+    all the layers of a step.
+    """
+    # the entries hold the cu_seqlens tensors, whose addresses are then not
+    # reused, and compare their versions to catch in-place updates
+    tensors = (cu_seqlens_q, cu_seqlens_k, seqused_k)
+    versions = tuple(None if t is None else t._version for t in tensors)
+    params = (total_q, block_m, is_causal, window_size_left, window_size_right)
+    # a list built outside of a graph capture is not recomputed on replays
+    capturing = _is_capturing()
+    if not capturing:
+        for entry in _varlen_tile_lists:
+            if all(a is b for a, b in zip(tensors, entry[0])) and entry[1:3] == (
+                versions,
+                params,
+            ):
+                return entry[3]
+
+    batch_size = cu_seqlens_q.numel() - 1
+    num_tiles = triton.cdiv(total_q, block_m) + batch_size
+    q_lens = (cu_seqlens_q[1:] - cu_seqlens_q[:-1]).to(torch.int64)
+    if seqused_k is not None:
+        k_lens = seqused_k.to(torch.int64)
+    else:
+        k_lens = (cu_seqlens_k[1:] - cu_seqlens_k[:-1]).to(torch.int64)
+    num_blocks = (q_lens + block_m - 1) // block_m
+    ends = torch.cumsum(num_blocks, 0)
+
+    tiles = torch.arange(num_tiles, dtype=torch.int64, device=cu_seqlens_q.device)
+    seq = torch.searchsorted(ends, tiles, right=True)
+    valid = seq < batch_size
+    seq = seq.clamp(max=batch_size - 1)
+    m_block = tiles - ends[seq] + num_blocks[seq]
+
+    # KV rows visited by each tile, as bounded by the masks of the kernel
+    q_len, k_len = q_lens[seq], k_lens[seq]
+    kv_end = k_len
+    if (is_causal or window_size_left >= 0) and window_size_right >= 0:
+        kv_end = torch.minimum(
+            k_len, (m_block + 1) * block_m + k_len - q_len + window_size_right
+        )
+    kv_start = torch.zeros_like(k_len)
+    if window_size_left >= 0:
+        kv_start = (m_block * block_m + k_len - q_len - window_size_left).clamp(min=0)
+    cost = torch.where(valid, (kv_end - kv_start).clamp(min=0), -1)
+    order = torch.argsort(cost, descending=True, stable=True)
+
+    seq = torch.where(valid, seq, -1)
+    tile_list = torch.stack([seq[order], m_block[order]]).to(torch.int32)
+    if not capturing:
+        if len(_varlen_tile_lists) >= VARLEN_TILE_LIST_CACHE_SIZE:
+            _varlen_tile_lists.pop(0)
+        _varlen_tile_lists.append((tensors, versions, params, tile_list))
+    return tile_list
+
+
 def mha_varlan_fwd(
     q,
     k,
@@ -537,12 +629,6 @@ def mha_varlan_fwd(
             params.k_ptr = k.view(k.shape[0], k.shape[1], -1)
             params.v_ptr = v.view(v.shape[0], v.shape[1], -1)
         logger.debug("kernel: flash_varlen_fwd")
-        grid = lambda args: (
-            triton.cdiv(max_seqlen_q, args["BLOCK_M"]),
-            batch_size,
-            num_heads,
-        )
-        kernel = flash_varlen_fwd_kernel[grid]
         args = tuple(getattr(params, k) for k in params.__slots__)
 
         # We assess which phase the requests are likely to be in and set the config accordingly.
@@ -575,8 +661,43 @@ def mha_varlan_fwd(
             "num_stages": 1 if not is_paged else cfg["num_stages"](args),
         }
 
-        logger.debug("Running flash_varlen_fwd_kernel with config: %s", cfg_params)
-        kernel(*args, **cfg_params)
+        # skewed batches leave most of the dense grid idle, schedule their tiles
+        block_m = cfg_params["BLOCK_M"]
+        max_num_tiles = triton.cdiv(total_q, block_m) + batch_size
+        dense_num_tiles = triton.cdiv(max_seqlen_q, block_m) * batch_size
+        use_tile_list = (
+            FLAGGEMS_FLASH_VARLEN_TILE_LIST
+            and cu_seqlens_q is not None
+            and dense_num_tiles > VARLEN_TILE_LIST_MIN_RATIO * max_num_tiles
+        )
+        if use_tile_list:
+            tile_list = varlen_tile_list(
+                cu_seqlens_q,
+                cu_seqlens_k,
+                seqused_k,
+                total_q,
+                block_m,
+                is_causal,
+                window_size_left,
+                window_size_right,
+            )
+            grid = (max_num_tiles * num_heads,)
+        else:
+            tile_list = cu_seqlens_k
+            grid = (triton.cdiv(max_seqlen_q, block_m), batch_size, num_heads)
+
+        logger.debug(
+            "Running flash_varlen_fwd_kernel with config: %s, tile list: %s",
+            cfg_params,
+            use_tile_list,
+        )
+        flash_varlen_fwd_kernel[grid](
+            *args,
+            tile_list_ptr=tile_list,
+            num_tiles=max_num_tiles,
+            IS_TILE_LIST=use_tile_list,
+            **cfg_params,
+        )
 
         if seqlenq_ngroups_swapped:
             out = out.reshape(
@@ -926,7 +1047,13 @@ def mha_varlan_fwd_opt(
         }
 
         logger.debug("Running flash_varlen_fwd_kernel with config: %s", cfg_params)
-        kernel(*args, **cfg_params)
+        kernel(
+            *args,
+            tile_list_ptr=cu_seqlens_k,
+            num_tiles=0,
+            IS_TILE_LIST=False,
+            **cfg_params,
+        )
 
         if seqlenq_ngroups_swapped:
             out = out.reshape(
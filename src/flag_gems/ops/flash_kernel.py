@@ -1258,6 +1258,7 @@ def load_from_kvcache(
         "seqlen_q_rounded",
         "seqlen_k_rounded",
         "total_q",
+        "num_tiles",
     ]
 )
 def flash_varlen_fwd_kernel(
@@ -1326,6 +1327,10 @@ def flash_varlen_fwd_kernel(
     page_table_batch_stride: tl.constexpr,
     block_size: tl.constexpr,
     k_page_stride,
+    # tile list
+    tile_list_ptr,
+    num_tiles,
+    IS_TILE_LIST: tl.constexpr,
     # kernel params
     BLOCK_M: tl.constexpr,
     BLOCK_N: tl.constexpr,
@@ -1333,9 +1338,20 @@ def flash_varlen_fwd_kernel(
     num_warps: tl.constexpr,
     num_stages: tl.constexpr,
 ):
-    m_block = tl.program_id(0)
-    bid = tl.program_id(1)
-    hid = tl.program_id(2)
+    if IS_TILE_LIST:
+        # one program per head of the (sequence, m block) tiles of tile_list,
+        # unused tiles have sequence -1
+        pid = tl.program_id(0)
+        tile = pid // h
+        hid = pid % h
+        bid = tl.load(tile_list_ptr + tile)
+        m_block = tl.load(tile_list_ptr + num_tiles + tile)
+        if bid < 0:
+            return
+    else:
+        m_block = tl.program_id(0)
+        bid = tl.program_id(1)
+        hid = tl.program_id(2)
     # num_m_blocks = tl.cdiv(seqlen_q, BLOCK_M)
 
     if is_cu_seqlens_q:
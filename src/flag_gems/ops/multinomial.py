@@ -19,8 +19,13 @@ import triton
 import triton.language as tl
 
 from flag_gems.ops import normed_cumsum
+from flag_gems.runtime import torch_device_fn
 from flag_gems.utils import libentry
-from flag_gems.utils.random_utils import philox_backend_seed_offset, uniform
+from flag_gems.utils.random_utils import (
+    load_philox_seed_offset,
+    philox_backend_seed_offset,
+    uniform,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +43,7 @@ def multinomial_with_replacement(
     #           |   dist2.batch0 | dist2.batch1 | dist2.batch2 ...
     y_off = tl.program_id(1) * N
     n = tl.program_id(0) * NBLOCK + tl.arange(0, NBLOCK)
+    philox_seed, philox_offset = load_philox_seed_offset(philox_seed, philox_offset)
     rv, _, _, _ = uniform(philox_seed, philox_offset, y_off + n)
 
     # Do a binary search for each random number on the cumulative
@@ -108,9 +114,12 @@ def multinomial(prob, n_samples, with_replacement=False, *, gen=None):
     # The CTA level parallelism is framed in a 2d grid of blocks with grid.y
     # indexing into distributions and grid.x output sample batches
     increment = n_dist * n_samples
-    philox_seed, philox_offset = philox_backend_seed_offset(increment, generator=gen)
     grid = lambda META: (triton.cdiv(n_samples, META["NBLOCK"]), n_dist)
-    multinomial_with_replacement[grid](
-        cum_prob, out, n_categories, n_samples, philox_seed, philox_offset
-    )
+    with torch_device_fn.device(prob.device):
+        philox_seed, philox_offset = philox_backend_seed_offset(
+            increment, generator=gen, capturable=True
+        )
+        multinomial_with_replacement[grid](
+            cum_prob, out, n_categories, n_samples, philox_seed, philox_offset
+        )
     return out
@@ -22,6 +22,8 @@ from flag_gems import runtime
 from flag_gems.runtime import torch_device_fn
 from flag_gems.utils import libentry
 from flag_gems.utils import triton_lang_extension as ext
+from flag_gems.utils.compact_utils import compact_rows, compacted_size
+from flag_gems.utils.table_utils import upload_table
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +58,13 @@ def nonzero_kernel(
         tl.store(out + out_offset * ndim + dim, remainder, mask=nonzero_mask)
 
 
-def nonzero(inp, *, as_tuple=False):
+def nonzero(inp, *, as_tuple=False, size=None, fill_value=-1):
+    """Indices of the nonzero elements of `inp`.
+
+    Sizing the result reads the number of nonzeros back from the device. With
+    an upper bound `size`, the result has `size` rows, as in `nonzero_static`,
+    rows past the nonzeros hold `fill_value` & the call does not synchronize.
+    """
     logger.debug("GEMS NONZERO")
 
     inp_ndim = inp.ndim
@@ -65,7 +73,19 @@ def nonzero(inp, *, as_tuple=False):
     n_elements = inp.numel()
     inp_view = inp.view(n_elements)
 
-    shape = torch.tensor(inp.shape, dtype=torch.int32, device=inp.device)
+    if n_elements == 0:
+        # no nonzeros, the `size` rows all hold fill_value
+        rows = 0 if size is None else compacted_size(None, size)
+        out = torch.full(
+            (rows, inp_ndim), fill_value, dtype=torch.int64, device=inp.device
+        )
+        return torch.unbind(out, dim=0) if as_tuple else out
+
+    if size is None:
+        shape = torch.tensor(inp.shape, dtype=torch.int32, device=inp.device)
+    else:
+        # a copy from pageable memory would block as well
+        shape = upload_table(list(inp.shape), inp.device, dtype=torch.int32)
 
     inp_bool = inp_view
     if inp_view.dtype != torch.bool:
@@ -80,8 +100,7 @@ def nonzero(inp, *, as_tuple=False):
     with torch_device_fn.device(inp.device):
         nonzero_kernel[grid](inp_bool, prefix_sum, out, n_elements, shape, inp_ndim)
 
-    num_nonzeros = prefix_sum[n_elements - 1].item()
-    out = out[0:num_nonzeros]
+    out = compact_rows(out, prefix_sum[n_elements - 1 :], size, fill_value)
 
     if as_tuple:
         return torch.unbind(out, dim=0)
@@ -39,7 +39,9 @@ def rand_like(
     # (TODO) Using Triton autotuner makes kernel parameters opaque to the caller,
     # hence we cannot obtain the per thread offset as in Pytorch.
     increment = triton.cdiv(N, UNROLL)
-    philox_seed, philox_offset = philox_backend_seed_offset(increment)
     with torch_device_fn.device(x.device):
+        philox_seed, philox_offset = philox_backend_seed_offset(
+            increment, capturable=True
+        )
         rand_kernel[grid_fn](out, N, philox_seed, philox_offset)
     return out
@@ -20,6 +20,7 @@ import triton.language as tl
 
 from flag_gems.runtime import device, torch_device_fn
 from flag_gems.utils.random_utils import (
+    load_philox_seed_offset,
     philox_backend_seed_offset,
     uint_to_uniform_float,
 )
@@ -80,8 +81,7 @@ def randn_kernel(
     philox_offset,
     BLOCK: tl.constexpr = 512,
 ):
-    philox_seed = philox_seed.to(tl.int64)
-    philox_offset = philox_offset.to(tl.int64)
+    philox_seed, philox_offset = load_philox_seed_offset(philox_seed, philox_offset)
     c0 = (philox_offset & 0xFFFFFFFF).to(tl.uint32)
     c1 = ((philox_offset >> 32) & 0xFFFFFFFF).to(tl.uint32)
     i4 = tl.program_id(0) * BLOCK + tl.arange(0, BLOCK)
@@ -129,8 +129,10 @@ def randn(size, *, dtype=None, layout=None, device=None, pin_memory=None):
         N = volume(real_size)
         grid_fn = lambda meta: (triton.cdiv(N, meta["BLOCK"] * UNROLL),)
         increment = triton.cdiv(N, UNROLL)
-        philox_seed, philox_offset = philox_backend_seed_offset(increment)
         with torch_device_fn.device(device):
+            philox_seed, philox_offset = philox_backend_seed_offset(
+                increment, capturable=True
+            )
             randn_kernel[grid_fn](real_out, N, philox_seed, philox_offset)
         return torch.view_as_complex(real_out.contiguous())
 
@@ -140,7 +142,9 @@ def randn(size, *, dtype=None, layout=None, device=None, pin_memory=None):
     # (TODO) Using Triton autotuner makes kernel parameters opaque to the caller,
     # hence we cannot obtain the per thread offset as in Pytorch.
     increment = triton.cdiv(N, UNROLL)
-    philox_seed, philox_offset = philox_backend_seed_offset(increment)
     with torch_device_fn.device(device):
+        philox_seed, philox_offset = philox_backend_seed_offset(
+            increment, capturable=True
+        )
         randn_kernel[grid_fn](out, N, philox_seed, philox_offset)
     return out
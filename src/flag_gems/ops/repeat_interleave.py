@@ -19,6 +19,7 @@ import triton
 from triton import language as tl
 
 from flag_gems.utils import triton_lang_extension as ext
+from flag_gems.utils.compact_utils import compacted_size
 from flag_gems.utils.pointwise_dynamic import pointwise_dynamic
 from flag_gems.utils.shape_utils import c_contiguous_stride
 from flag_gems.utils.tensor_wrapper import StridedBuffer
@@ -78,7 +79,7 @@ def repeat_interleave_self_int(inp, repeats, dim=None, *, output_size=None):
 
 @triton.jit
 def repeat_interleave_tensor_kernel(
-    repeats_ptr, cumsum_ptr, out_ptr, size, BLOCK_SIZE: tl.constexpr
+    repeats_ptr, cumsum_ptr, out_ptr, size, out_size, BLOCK_SIZE: tl.constexpr
 ):
     pid = ext.program_id(0)
     mask = pid < size
@@ -91,7 +92,9 @@ def repeat_interleave_tensor_kernel(
     out_ptr += out_offset
     for start_k in range(0, repeats, BLOCK_SIZE):
         offsets_k = start_k + tl.arange(0, BLOCK_SIZE)
-        mask_k = offsets_k < repeats
+        # a caller provided output_size smaller than the sum of repeats
+        # truncates the output
+        mask_k = (offsets_k < repeats) & (out_offset + offsets_k < out_size)
         tl.store(out_ptr + offsets_k, pid, mask=mask_k)
 
 
@@ -101,7 +104,8 @@ def repeat_interleave_tensor(repeats, *, output_size=None):
     assert repeats.ndim == 1, "repeat_interleave only accept 1D vector as repeat"
     repeats = repeats.contiguous()
     cumsum = repeats.cumsum(axis=0)
-    result_size = cumsum[-1].item()
+    # output_size, the sum of repeats, spares reading it back from the device
+    result_size = compacted_size(cumsum[-1], output_size)
 
     assert result_size >= 0, "repeats can not be negative"
 
@@ -115,6 +119,7 @@ def repeat_interleave_tensor(repeats, *, output_size=None):
         cumsum,
         out,
         size,
+        result_size,
         BLOCK_SIZE=BLOCK_SIZE,
         num_warps=1,
     )
@@ -139,6 +144,11 @@ def repeat_interleave_self_tensor(inp, repeats, dim=None, *, output_size=None):
             )
 
     if repeats.ndim == 0 or (repeats.ndim == 1 and repeats.size(0) == 1):
+        if output_size is not None and inp.shape[dim] > 0:
+            # the repeats follow from output_size without reading them back
+            return repeat_interleave_self_int(
+                inp, output_size // inp.shape[dim], dim=dim, output_size=output_size
+            )
         return repeat_interleave_self_int(
             inp, repeats.item(), dim=dim, output_size=output_size
         )
@@ -157,7 +167,7 @@ def repeat_interleave_self_tensor(inp, repeats, dim=None, *, output_size=None):
             )
         )
 
-    indices = repeat_interleave_tensor(repeats)
+    indices = repeat_interleave_tensor(repeats, output_size=output_size)
     res = torch.index_select(inp, dim, indices)
 
     return res
@@ -13,12 +13,15 @@
 # limitations under the License.
 
 import logging
+import math
 from typing import List, Tuple, Union
 
 import torch
 import triton
 import triton.language as tl
 
+from flag_gems.ops.cat import CAT_GROUP_SIZE, _cat_run_table_kernel
+
 logger = logging.getLogger(__name__)
 
 
@@ -114,8 +117,6 @@ def stack(
     dtype = dtypes[0]
     for dt in dtypes[1:]:
         dtype = torch.promote_types(dtype, dt)
-    # Convert all tensors to the result dtype if needed
-    tensors = [t.to(dtype) if t.dtype != dtype else t for t in tensors]
     device = tensors[0].device
     out_shape = inp0_shape[:dim] + [len(tensors)] + inp0_shape[dim:]
     out = torch.empty(out_shape, dtype=dtype, device=device)
@@ -124,6 +125,18 @@ def stack(
     for s in inp0_shape[dim:]:
         dim_prod_post *= s
 
+    if len(tensors) > CAT_GROUP_SIZE or any(t.dtype != dtype for t in tensors):
+        # one launch per input dtype, which also casts the inputs
+        _cat_run_table_kernel(
+            list(tensors),
+            [1] * len(tensors),
+            out,
+            math.prod(inp0_shape[:dim]),
+            len(tensors),
+            dim_prod_post,
+        )
+        return out
+
     BLOCK = 1024
     i = 0
     while i < len(tensors):
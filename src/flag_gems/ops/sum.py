@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import logging
-import math
 from functools import reduce
 
 import torch
@@ -23,56 +22,13 @@ import triton.language as tl
 from flag_gems import runtime
 from flag_gems.ops.zeros import zero_
 from flag_gems.runtime import torch_device_fn
-from flag_gems.utils import dim_compress, libentry, libtuner
+from flag_gems.utils import libentry, libtuner, reduction_view
 from flag_gems.utils import triton_lang_extension as ext
+from flag_gems.utils.reduction_utils import full_reduce
 
 logger = logging.getLogger(__name__)
 
 
-@libentry()
-@triton.jit
-def sum_kernel_1(
-    inp,
-    mid,
-    M,
-    BLOCK_SIZE: tl.constexpr,
-):
-    if tl.constexpr(inp.dtype.element_ty == tl.float16) or tl.constexpr(
-        inp.dtype.element_ty == tl.bfloat16
-    ):
-        cdtype = tl.float32
-    else:
-        cdtype = inp.dtype.element_ty
-
-    pid = ext.program_id(0)
-    offset = pid * BLOCK_SIZE + tl.arange(0, BLOCK_SIZE)
-    inp_ptrs = inp + offset
-    mask = offset < M
-
-    inp_val = tl.load(inp_ptrs, mask=mask, other=0).to(cdtype)
-    sum_val = tl.sum(inp_val)
-    mid_ptr = mid + pid
-    tl.store(mid_ptr, sum_val)
-
-
-@libentry()
-@triton.jit
-def sum_kernel_2(mid, out, mid_size, BLOCK_MID: tl.constexpr):
-    if tl.constexpr(mid.dtype.element_ty == tl.float16) or tl.constexpr(
-        mid.dtype.element_ty == tl.bfloat16
-    ):
-        cdtype = tl.float32
-    else:
-        cdtype = mid.dtype.element_ty
-
-    offset = tl.arange(0, BLOCK_MID)
-    mid_ptrs = mid + offset
-    mask = offset < mid_size
-    mid_val = tl.load(mid_ptrs, mask=mask, other=0).to(cdtype)
-    sum_val = tl.sum(mid_val)
-    tl.store(out, sum_val)
-
-
 def sum(inp, *, dtype=None):
     logger.debug("GEMS SUM")
     inp = inp.contiguous()
@@ -89,36 +45,19 @@ def sum(inp, *, dtype=None):
         if dtype is torch.bool:
             inp = inp.to(torch.int64)
             dtype = torch.int64
-    block_size = triton.next_power_of_2(math.ceil(math.sqrt(M)))
-    mid_size = triton.cdiv(M, block_size)
-    block_mid = triton.next_power_of_2(mid_size)
 
-    mid = torch.empty((mid_size,), dtype=dtype, device=inp.device)
     out = torch.empty([], dtype=dtype, device=inp.device)
-
-    with torch_device_fn.device(inp.device):
-        sum_kernel_1[(mid_size, 1, 1)](inp, mid, M, block_size)
-        sum_kernel_2[(1, 1, 1)](mid, out, mid_size, block_mid)
-    return out
+    return full_reduce(inp, out, "sum")
 
 
 def sum_out(inp, *, dtype=None, out):
     logger.debug("GEMS SUM_OUT")
-    M = inp.numel()
-    if dtype is None:
-        dtype = inp.dtype
-        if dtype is torch.bool:
-            inp = inp.to(torch.int64)
-            dtype = torch.int64
-    block_size = triton.next_power_of_2(math.ceil(math.sqrt(M)))
-    mid_size = triton.cdiv(M, block_size)
-    block_mid = triton.next_power_of_2(mid_size)
-
-    mid = torch.empty((mid_size,), dtype=dtype, device=inp.device)
-    with torch_device_fn.device(inp.device):
-        sum_kernel_1[(mid_size, 1, 1)](inp, mid, M, block_size)
-        sum_kernel_2[(1, 1, 1)](mid, out, mid_size, block_mid)
-    return out
+    inp = inp.contiguous()
+    if inp.numel() == 0:
+        return zero_(out)
+    if dtype is None and inp.dtype is torch.bool:
+        inp = inp.to(torch.int64)
+    return full_reduce(inp, out, "sum")
 
 
 @libentry()
@@ -223,7 +162,8 @@ def sum_dim_kernel_inner(
 @libentry()
 @libtuner(
     configs=runtime.get_tuned_config("naive_reduction"),
-    key=["M", "N"],
+    # rows read in place may be strided, which changes the best config
+    key=["M", "N", "stride_n"],
 )
 @triton.jit
 def sum_dim_kernel(
@@ -231,6 +171,8 @@ def sum_dim_kernel(
     out,
     M,
     N,
+    stride_m,
+    stride_n,
     BLOCK_M: tl.constexpr,
     BLOCK_N: tl.constexpr,
 ):
@@ -243,7 +185,7 @@ def sum_dim_kernel(
 
     # Map the program id to the row of inp it should compute.
     pid = ext.program_id(0) * BLOCK_M + tl.arange(0, BLOCK_M)[:, None]
-    inp = inp + pid * N
+    inp = inp + pid * stride_m
     out = out + pid
     row_mask = pid < M
 
@@ -253,7 +195,7 @@ def sum_dim_kernel(
         col_mask = cols < N
         mask = row_mask and col_mask
 
-        a = tl.load(inp + cols, mask, other=0).to(cdtype)
+        a = tl.load(inp + cols * stride_n, mask, other=0).to(cdtype)
         _sum += a
     sum = tl.sum(_sum, axis=1)[:, None]
     tl.store(out, sum, row_mask)
@@ -322,12 +264,9 @@ def sum_dim_comm(inp, dim=None, keepdim=False, *, dtype=None, out=None):
             out = out.squeeze(dim=dim)
         return out
     else:
-        inp = dim_compress(inp, dim)
-        N = 1
+        inp, M, N, stride_m, stride_n = reduction_view(inp, dim)
         for i in dim:
-            N *= shape[i]
             shape[i] = 1
-        M = inp.numel() // N
         _out_provided = out is not None
         if _out_provided:
             dim_set = set(dim)
@@ -340,7 +279,7 @@ def sum_dim_comm(inp, dim=None, keepdim=False, *, dtype=None, out=None):
 
         grid = lambda meta: (triton.cdiv(M, meta["BLOCK_M"]),)
         with torch_device_fn.device(inp.device):
-            sum_dim_kernel[grid](inp, out, M, N)
+            sum_dim_kernel[grid](inp, out, M, N, stride_m, stride_n)
         if not keepdim and not _out_provided:
             for d in sorted(dim, reverse=True):
                 out = out.squeeze(dim=d)
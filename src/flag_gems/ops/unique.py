@@ -20,6 +20,7 @@ import triton.language as tl
 
 from flag_gems.runtime import torch_device_fn
 from flag_gems.utils import triton_lang_extension as ext
+from flag_gems.utils.compact_utils import compact_rows, compacted_size
 from flag_gems.utils.libentry import libentry
 
 logger = logging.getLogger(__name__)
@@ -437,7 +438,7 @@ def sorted_quick_unique_flat(sorted_data: torch.Tensor, return_counts: bool):
             return_counts=return_counts,
             num_warps=num_warps,
         )
-        out_size = tile_sum[-1].item()
+        out_size = compacted_size(tile_sum[-1])
         if return_counts:
             data_out = torch.empty(
                 (out_size,), dtype=sorted_data.dtype, device=sorted_data.device
@@ -652,7 +653,11 @@ def global_cumsum_flat_kernel(
 
 
 def sorted_indices_unique_flat(
-    sorted_data: torch.Tensor, sorted_indices: torch.Tensor, return_counts: bool
+    sorted_data: torch.Tensor,
+    sorted_indices: torch.Tensor,
+    return_counts: bool,
+    size=None,
+    fill_value=0,
 ):
     num_tasks = sorted_data.numel()
     next_power_num_tasks = triton.next_power_of_2(num_tasks)
@@ -712,7 +717,10 @@ def sorted_indices_unique_flat(
             return_counts=return_counts,
             num_warps=num_warps,
         )
-        out_size = tile_sum[-1].item() + 1
+        if size is not None:
+            data_out = compact_rows(data_out, tile_sum[-1:], size, fill_value, 1)
+            return data_out, inverse_indices, None
+        out_size = compacted_size(tile_sum[-1], count_offset=1)
         counts = None
         if return_counts:
             idx = idx[:out_size]
@@ -735,6 +743,8 @@ def simple_unique_flat(
     sorted_indices: torch.Tensor,
     return_inverse: bool,
     return_counts: bool,
+    size=None,
+    fill_value=0,
 ):
     num_tasks = sorted_data.numel()
     grid = (1, 1, 1)
@@ -766,7 +776,10 @@ def simple_unique_flat(
             tile_size=triton.next_power_of_2(num_tasks),
             num_warps=8,
         )
-    out_size = unique_size.item() + 1
+    if size is not None:
+        data_out = compact_rows(data_out, unique_size, size, fill_value, 1)
+        return data_out, inverse_indices, None
+    out_size = compacted_size(unique_size, count_offset=1)
     counts = None
     if return_counts:
         idx = idx[:out_size]
@@ -789,8 +802,20 @@ def _unique2(
     sorted: bool = True,
     return_inverse: bool = False,
     return_counts: bool = False,
+    *,
+    size=None,
+    fill_value=0,
 ):
+    """Sorted unique elements of `in0`, their inverse indices & counts.
+
+    Sizing the outputs reads the number of unique elements back from the
+    device. With an upper bound `size`, the unique elements & counts have
+    `size` entries, those past the unique elements hold `fill_value` & 0,
+    and the call does not synchronize.
+    """
     logger.debug("GEMS _UNIQUE2")
+    if size is not None:
+        return _unique2_static(in0, return_inverse, return_counts, size, fill_value)
     if in0.numel() <= 8192:
         sorted_data, sorted_indices = torch.sort(in0.ravel())
         data_out, inverse_indices, counts = simple_unique_flat(
@@ -811,3 +836,32 @@ def _unique2(
         inverse_indices if inverse_indices is None else inverse_indices.view_as(in0),
         counts,
     )
+
+
+def _unique2_static(in0, return_inverse, return_counts, size, fill_value):
+    sorted_data, sorted_indices = torch.sort(in0.ravel())
+    # the counts are gathered from the inverse indices, which do not depend on
+    # the number of unique elements
+    if in0.numel() <= 8192:
+        data_out, inverse_indices, _ = simple_unique_flat(
+            sorted_data, sorted_indices, True, False, size, fill_value
+        )
+    else:
+        data_out, inverse_indices, _ = sorted_indices_unique_flat(
+            sorted_data, sorted_indices, False, size, fill_value
+        )
+    counts = None
+    if return_counts:
+        # unique elements past `size` are counted in a dropped extra slot
+        counts = torch.zeros((size + 1,), dtype=torch.int64, device=in0.device)
+        counts.index_add_(
+            0,
+            inverse_indices.clamp(max=size),
+            torch.ones_like(inverse_indices),
+        )
+        counts = counts[:size]
+    return (
+        data_out,
+        inverse_indices.view_as(in0) if return_inverse else None,
+        counts,
+    )
@@ -20,8 +20,9 @@ import triton.language as tl
 
 from flag_gems import runtime
 from flag_gems.runtime import torch_device_fn
-from flag_gems.utils import dim_compress, libentry
+from flag_gems.utils import libentry, reduction_view
 from flag_gems.utils import triton_lang_extension as ext
+from flag_gems.utils.workspace import workspace
 
 logger = logging.getLogger(__name__)
 
@@ -45,12 +46,14 @@ def var_mean_welford_kernel(
     Mean,
     M,
     N,
+    stride_m,
+    stride_n,
     correction,
     BLOCK_N: tl.constexpr,
 ):
     # One row per program to avoid autotune correctness issues on some backends.
     pid = ext.program_id(0)
-    X = X + pid * N
+    X = X + pid * stride_m
     Var = Var + pid
     Mean = Mean + pid
 
@@ -58,7 +61,7 @@ def var_mean_welford_kernel(
     for off in range(0, N, BLOCK_N):
         cols = off + tl.arange(0, BLOCK_N)
         mask = cols < N
-        x = tl.load(X + cols, mask, other=0.0).to(tl.float32)
+        x = tl.load(X + cols * stride_n, mask, other=0.0).to(tl.float32)
         _sum += x
     mean = tl.sum(_sum) / N
 
@@ -66,7 +69,7 @@ def var_mean_welford_kernel(
     for off in range(0, N, BLOCK_N):
         cols = off + tl.arange(0, BLOCK_N)
         mask = cols < N
-        x = tl.load(X + cols, mask, other=0.0).to(tl.float32)
+        x = tl.load(X + cols * stride_n, mask, other=0.0).to(tl.float32)
         diff = tl.where(mask, x - mean, 0.0)
         _acc += diff * diff
     var = tl.sum(_acc) / (N - correction)
@@ -149,11 +152,10 @@ def var_mean(x, dim=None, *, correction=None, keepdim=False):
         mean = torch.empty(shape, dtype=x.dtype, device=x.device)
         BLOCK_N = 1024
         BLOCK_NUM = triton.cdiv(N, BLOCK_N)
-        acc = torch.empty([BLOCK_NUM], dtype=x.dtype, device=x.device)
-        average = torch.empty([BLOCK_NUM], dtype=x.dtype, device=x.device)
-        count = torch.empty([BLOCK_NUM], dtype=x.dtype, device=x.device)
-
-        with torch_device_fn.device(x.device):
+        with workspace(x.device) as ws, torch_device_fn.device(x.device):
+            acc = ws.empty([BLOCK_NUM], x.dtype)
+            average = ws.empty([BLOCK_NUM], x.dtype)
+            count = ws.empty([BLOCK_NUM], x.dtype)
             var_mean_kernel_1[(BLOCK_NUM,)](x, acc, average, count, N, BLOCK_N=BLOCK_N)
             var_mean_kernel_2[(1,)](
                 acc, average, count, var, mean, N, correction, BLOCK_NUM
@@ -161,12 +163,9 @@ def var_mean(x, dim=None, *, correction=None, keepdim=False):
     else:
         shape = list(x.shape)
         dim = [d % x.ndim for d in dim]
-        x = dim_compress(x, dim)
-        N = 1
+        x, M, N, stride_m, stride_n = reduction_view(x, dim)
         for i in dim:
-            N *= shape[i]
             shape[i] = 1
-        M = x.numel() // N
         var = torch.empty(shape, dtype=x.dtype, device=x.device)
         mean = torch.empty(shape, dtype=x.dtype, device=x.device)
 
@@ -174,7 +173,7 @@ def var_mean(x, dim=None, *, correction=None, keepdim=False):
         grid = (M,)
         with torch_device_fn.device(x.device):
             var_mean_welford_kernel[grid](
-                x, var, mean, M, N, correction, BLOCK_N=BLOCK_N
+                x, var, mean, M, N, stride_m, stride_n, correction, BLOCK_N=BLOCK_N
             )
 
     if not keepdim:
@@ -14,13 +14,13 @@
 
 import logging
 import os
-from collections import OrderedDict
 
 import torch
 import triton
 import triton.language as tl
 
 from flag_gems.utils import triton_lang_extension as tle
+from flag_gems.utils.prepack_cache import prepack
 
 logger = logging.getLogger(__name__)
 
@@ -65,11 +65,6 @@ MM_M1_TRANSPOSED_CONFIG_TABLE = (
     {"n_min": 0, "k_min": 0, "config": (4, 64)},
 )
 
-_MM_PREPACK_CACHE = OrderedDict()
-_MM_PREPACK_CACHE_BYTES = 0
-_MM_FP32_CAST_CACHE = OrderedDict()
-_MM_FP32_CAST_CACHE_BYTES = 0
-
 
 @triton.jit
 def mm_kernel(
@@ -335,56 +330,16 @@ def _is_rhs_transposed_layout(rhs):
     return rhs.stride(0) == 1 and rhs.stride(1) >= rhs.shape[0]
 
 
-def _prepack_key(rhs):
-    return (
-        int(rhs.data_ptr()),
-        tuple(rhs.shape),
-        tuple(rhs.stride()),
-        str(rhs.dtype),
-        str(rhs.device),
-    )
-
-
 def _maybe_get_prepacked_rhs(rhs):
-    global _MM_PREPACK_CACHE_BYTES
     if not _mm_prepack_enabled():
         return None
 
-    max_bytes = max(_get_env_int("FLAGGEMS_ARM_MM_PREPACK_MAX_BYTES", 0), 0)
-    if max_bytes <= 0:
-        return None
-
     max_tensor_bytes = max(
         _get_env_int("FLAGGEMS_ARM_MM_PREPACK_MAX_TENSOR_BYTES", 8 * 1024 * 1024), 0
     )
-    rhs_bytes = _tensor_nbytes(rhs)
-    if max_tensor_bytes > 0 and rhs_bytes > max_tensor_bytes:
-        return None
-    if rhs_bytes > max_bytes:
-        return None
-
-    key = _prepack_key(rhs)
-    packed = _MM_PREPACK_CACHE.get(key)
-    if packed is not None:
-        _MM_PREPACK_CACHE.move_to_end(key)
-        return packed
-
-    packed = rhs.contiguous()
-    packed_bytes = _tensor_nbytes(packed)
-    max_entries = max(_get_env_int("FLAGGEMS_ARM_MM_PREPACK_MAX_ENTRIES", 32), 1)
-    while _MM_PREPACK_CACHE and (
-        _MM_PREPACK_CACHE_BYTES + packed_bytes > max_bytes
-        or len(_MM_PREPACK_CACHE) >= max_entries
-    ):
-        _, evicted = _MM_PREPACK_CACHE.popitem(last=False)
-        _MM_PREPACK_CACHE_BYTES -= _tensor_nbytes(evicted)
-
-    if packed_bytes > max_bytes:
+    if max_tensor_bytes > 0 and _tensor_nbytes(rhs) > max_tensor_bytes:
         return None
-
-    _MM_PREPACK_CACHE[key] = packed
-    _MM_PREPACK_CACHE_BYTES += packed_bytes
-    return packed
+    return prepack(rhs, ("arm_mm_contiguous",), torch.Tensor.contiguous)
 
 
 def _mm_fp32_cast_cache_enabled():
@@ -395,19 +350,11 @@ def _mm_fp32_cast_cache_enabled():
     )
 
 
-def _fp32_cast_key(t):
-    return (
-        int(t.data_ptr()),
-        tuple(t.shape),
-        tuple(t.stride()),
-        int(getattr(t, "_version", 0)),
-        str(t.dtype),
-        str(t.device),
-    )
+def _to_fp32(t):
+    return t.to(torch.float32)
 
 
 def _maybe_get_cached_fp32(t):
-    global _MM_FP32_CAST_CACHE_BYTES
     if not _mm_fp32_cast_cache_enabled():
         return t.to(torch.float32)
     if t.dtype is not torch.bfloat16:
@@ -419,40 +366,24 @@ def _maybe_get_cached_fp32(t):
     if t.numel() < min_numel:
         return t.to(torch.float32)
 
-    max_bytes = max(_get_env_int("FLAGGEMS_ARM_MM_FP32_CAST_MAX_BYTES", 2**31), 0)
-    if max_bytes <= 0:
-        return t.to(torch.float32)
-
-    key = _fp32_cast_key(t)
-    cached = _MM_FP32_CAST_CACHE.get(key)
-    if cached is not None:
-        _MM_FP32_CAST_CACHE.move_to_end(key)
-        return cached
-
-    fp32_t = t.to(torch.float32)
-    fp32_bytes = _tensor_nbytes(fp32_t)
     max_tensor_bytes = max(
         _get_env_int("FLAGGEMS_ARM_MM_FP32_CAST_MAX_TENSOR_BYTES", 2**30), 0
     )
-    if (
-        max_tensor_bytes > 0 and fp32_bytes > max_tensor_bytes
-    ) or fp32_bytes > max_bytes:
-        return fp32_t
-
-    max_entries = max(_get_env_int("FLAGGEMS_ARM_MM_FP32_CAST_MAX_ENTRIES", 64), 1)
-    while _MM_FP32_CAST_CACHE and (
-        _MM_FP32_CAST_CACHE_BYTES + fp32_bytes > max_bytes
-        or len(_MM_FP32_CAST_CACHE) >= max_entries
-    ):
-        _, evicted = _MM_FP32_CAST_CACHE.popitem(last=False)
-        _MM_FP32_CAST_CACHE_BYTES -= _tensor_nbytes(evicted)
-
-    if fp32_bytes > max_bytes:
-        return fp32_t
-
-    _MM_FP32_CAST_CACHE[key] = fp32_t
-    _MM_FP32_CAST_CACHE_BYTES += fp32_bytes
-    return fp32_t
+    if max_tensor_bytes > 0 and t.numel() * 4 > max_tensor_bytes:
+        return t.to(torch.float32)
+    # activations are cast too, so the entries are bounded apart from the
+    # weights of the shared prepack cache
+    return prepack(
+        t,
+        ("arm_mm_fp32_cast",),
+        _to_fp32,
+        tag_max_bytes=max(
+            _get_env_int("FLAGGEMS_ARM_MM_FP32_CAST_MAX_BYTES", 2**31), 0
+        ),
+        tag_max_entries=max(
+            _get_env_int("FLAGGEMS_ARM_MM_FP32_CAST_MAX_ENTRIES", 64), 1
+        ),
+    )
 
 
 def _launch_mm_m1_kernel(a, b, c, N, K):
@@ -13,11 +13,19 @@
 # limitations under the License.
 
 import functools
+import hashlib
+import json
 import os
 from dataclasses import dataclass
+from pathlib import Path
 
 import yaml
 
+# Whether to cache the parsed yaml configs as JSON, keyed by file path,
+# modification time & size. JSON, unlike pickle, cannot run code when the
+# cache directory is writable by others.
+FLAGGEMS_YAML_CACHE = os.getenv("FLAGGEMS_YAML_CACHE", "1") != "0"
+
 
 # Metadata template,  Each vendor needs to specialize instances of this template
 @dataclass
@@ -38,6 +46,53 @@ class VendorDescriptor:
     tle_enabled: bool = False
 
 
+def _yaml_cache_path(file_path):
+    # same directory as flag_gems.utils.code_cache.config_cache_dir, which
+    # cannot be imported while the runtime initializes
+    cache_dir = os.environ.get("FLAGGEMS_CACHE_DIR")
+    cache_dir = Path.home() / ".flaggems" if cache_dir is None else Path(cache_dir)
+    digest = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()[:16]
+    return cache_dir / "config_cache" / "yaml" / f"{digest}.json"
+
+
+def load_yaml(file_path, file_mode="r"):
+    """Parse the yaml file at `file_path`, through the JSON cache if enabled.
+
+    A cached result is only used if the modification time & the size of the
+    file are unchanged, failures to read or write the cache are ignored.
+    Configs that JSON does not represent exactly, e.g. with non-string keys,
+    are not cached.
+    """
+    if not FLAGGEMS_YAML_CACHE:
+        with open(file_path, file_mode) as file:
+            return yaml.safe_load(file)
+
+    stat = os.stat(file_path)
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    cache_path = _yaml_cache_path(file_path)
+    try:
+        with open(cache_path, "r") as file:
+            cached = json.load(file)
+        if cached["stamp"] == stamp:
+            return cached["config"]
+    except Exception:
+        pass
+
+    with open(file_path, file_mode) as file:
+        config = yaml.safe_load(file)
+    try:
+        text = json.dumps({"stamp": stamp, "config": config})
+        if json.loads(text)["config"] == config:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w") as file:
+                file.write(text)
+            os.replace(tmp_path, cache_path)
+    except Exception:
+        pass
+    return config
+
+
 def get_tune_config(vendor_name=None, file_mode="r", file_path=None):
     BACKEND_EVENT = file_path is not None
     config = None
@@ -49,8 +104,7 @@ def get_tune_config(vendor_name=None, file_mode="r", file_path=None):
             file_path = os.path.join(base_dir, vendor_name, "tune_configs.yaml")
         else:
             file_path = os.path.join(file_path, "tune_configs.yaml")
-        with open(file_path, file_mode) as file:
-            config = yaml.safe_load(file)
+        config = load_yaml(file_path, file_mode)
     except FileNotFoundError:
         if not BACKEND_EVENT:
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
@@ -72,8 +126,7 @@ class BackendEventBase:
 
 @functools.lru_cache(maxsize=None)
 def _load_expand_config(file_path, file_mode="r"):
-    with open(file_path, file_mode) as file:
-        return yaml.safe_load(file) or {}
+    return load_yaml(file_path, file_mode) or {}
 
 
 def get_expand_config(op_name=None, file_mode="r", file_path=None):
@@ -62,8 +62,9 @@ class TunedConfigLoader(object):
             }
             if self.device.vendor_name == "hygon":
                 self.triton_config_default["num_ldmatrixes"] = 0
+            # the configs of an op are built on its first get_tuned_config &
+            # the expand yamls are located on their first get_expand_config
             self.expand_config_registry = self._build_expand_registry()
-            self.load_all()
 
     def update_config_from_arch(self):
         try:
@@ -485,14 +486,16 @@ class TunedConfigLoader(object):
     def _build_single_expand_spec(
         self,
         op_name,
-        expand_yaml_path=None,
+        expand_yaml_op=None,
         yaml_op_name=None,
     ):
+        """`expand_yaml_op` names the expand yaml searched for by
+        `_get_expand_config_path` on the first `get_expand_config`."""
         return {
             "yaml_op_name": yaml_op_name or op_name,
             "key": common.OP_KEY_ORDERS[op_name],
             "default_strategy": common.DEFAULT_STRATEGIES[op_name],
-            "expand_yaml_path": expand_yaml_path,
+            "expand_yaml_op": expand_yaml_op,
         }
 
     def _iter_expand_config_candidates(self, op_name):
@@ -544,48 +547,34 @@ class TunedConfigLoader(object):
 
     def _build_expand_registry(self):
         return {
-            "addmm": self._build_single_expand_spec(
-                "addmm", expand_yaml_path=self._get_expand_config_path("addmm")
-            ),
+            "addmm": self._build_single_expand_spec("addmm", expand_yaml_op="addmm"),
             "addmm_sqmma": self._build_single_expand_spec("addmm_sqmma"),
             "baddbmm": self._build_single_expand_spec(
-                "baddbmm", expand_yaml_path=self._get_expand_config_path("baddbmm")
-            ),
-            "bmm": self._build_single_expand_spec(
-                "bmm", expand_yaml_path=self._get_expand_config_path("bmm")
+                "baddbmm", expand_yaml_op="baddbmm"
             ),
+            "bmm": self._build_single_expand_spec("bmm", expand_yaml_op="bmm"),
             "bmm_sqmma": self._build_single_expand_spec("bmm_sqmma"),
             "fused_marlin_moe_w4a16_int4": self._build_single_expand_spec(
                 "fused_marlin_moe_w4a16_int4",
-                expand_yaml_path=self._get_expand_config_path(
-                    "fused_marlin_moe_w4a16_int4"
-                ),
+                expand_yaml_op="fused_marlin_moe_w4a16_int4",
             ),
             "fused_marlin_moe_w4a16_int4_gemm_silu": self._build_single_expand_spec(
                 "fused_marlin_moe_w4a16_int4_gemm_silu",
-                expand_yaml_path=self._get_expand_config_path(
-                    "fused_marlin_moe_w4a16_int4_gemm_silu"
-                ),
+                expand_yaml_op="fused_marlin_moe_w4a16_int4_gemm_silu",
             ),
             "fused_marlin_moe_w4a16_mxfp4": self._build_single_expand_spec(
                 "fused_marlin_moe_w4a16_mxfp4",
-                expand_yaml_path=self._get_expand_config_path(
-                    "fused_marlin_moe_w4a16_mxfp4"
-                ),
+                expand_yaml_op="fused_marlin_moe_w4a16_mxfp4",
             ),
             "fused_marlin_moe_w4a16_mxfp4_gemm_silu": self._build_single_expand_spec(
                 "fused_marlin_moe_w4a16_mxfp4_gemm_silu",
-                expand_yaml_path=self._get_expand_config_path(
-                    "fused_marlin_moe_w4a16_mxfp4_gemm_silu"
-                ),
+                expand_yaml_op="fused_marlin_moe_w4a16_mxfp4_gemm_silu",
             ),
             "gemv": self._build_single_expand_spec("gemv"),
             "gemv_k_parallel": self._build_single_expand_spec(
                 "gemv", yaml_op_name="gemv_k_parallel"
             ),
-            "mm": self._build_single_expand_spec(
-                "mm", expand_yaml_path=self._get_expand_config_path("mm")
-            ),
+            "mm": self._build_single_expand_spec("mm", expand_yaml_op="mm"),
             "mm_nn": self._build_single_expand_spec("mm_nn"),
             "mm_nt": self._build_single_expand_spec("mm_nt"),
             "mm_splitk_two_step": self._build_single_expand_spec(
@@ -595,15 +584,11 @@ class TunedConfigLoader(object):
                 "mm_sqmma", yaml_op_name="mm_general_tma"
             ),
             "mm_general_tma": self._build_single_expand_spec("mm_general_tma"),
-            "mv": self._build_single_expand_spec(
-                "mv", expand_yaml_path=self._get_expand_config_path("mv")
-            ),
-            "mul": self._build_single_expand_spec(
-                "mul", expand_yaml_path=self._get_expand_config_path("mul")
-            ),
+            "mv": self._build_single_expand_spec("mv", expand_yaml_op="mv"),
+            "mul": self._build_single_expand_spec("mul", expand_yaml_op="mul"),
             "mul_broadcast_2d": self._build_single_expand_spec(
                 "mul_broadcast_2d",
-                expand_yaml_path=self._get_expand_config_path("mul"),
+                expand_yaml_op="mul",
                 yaml_op_name="mul",
             ),
             "w8a8_block_fp8_general": self._build_single_expand_spec(
@@ -616,34 +601,27 @@ class TunedConfigLoader(object):
                 "w8a8_block_fp8_general_tma"
             ),
             "w8a8_block_fp8_bmm": self._build_single_expand_spec(
-                "w8a8_block_fp8_bmm",
-                expand_yaml_path=self._get_expand_config_path("w8a8_block_fp8_bmm"),
+                "w8a8_block_fp8_bmm", expand_yaml_op="w8a8_block_fp8_bmm"
             ),
             "w8a8_block_fp8_bmm_general": self._build_single_expand_spec(
                 "w8a8_block_fp8_bmm_general",
-                expand_yaml_path=self._get_expand_config_path(
-                    "w8a8_block_fp8_bmm_general"
-                ),
+                expand_yaml_op="w8a8_block_fp8_bmm_general",
             ),
             "w8a8_block_fp8_bmm_splitk": self._build_single_expand_spec(
-                "w8a8_block_fp8_bmm_splitk",
-                expand_yaml_path=self._get_expand_config_path(
-                    "w8a8_block_fp8_bmm_splitk"
-                ),
+                "w8a8_block_fp8_bmm_splitk", expand_yaml_op="w8a8_block_fp8_bmm_splitk"
             ),
             "mm_splitk": self._build_single_expand_spec("mm_splitk"),
             "sparse_attention": self._build_single_expand_spec("sparse_attention"),
             "compute_global_topk_indices_and_lens": self._build_single_expand_spec(
                 "compute_global_topk_indices_and_lens",
-                expand_yaml_path=self._get_expand_config_path(
-                    "compute_global_topk_indices_and_lens"
-                ),
+                expand_yaml_op="compute_global_topk_indices_and_lens",
             ),
         }
 
     def load_all(self):
+        """Build the configs of all the ops of the vendor tune config upfront."""
         for key in self.vendor_primitive_yaml_config:
-            self.loaded_triton_config[key] = self.get_tuned_config(key)
+            self.get_tuned_config(key)
 
     def get_vendor_heuristics_config(self):
         return backend.get_heuristic_config(self.device.vendor_name)
@@ -758,6 +736,12 @@ class TunedConfigLoader(object):
         if op_spec is None:
             return -1
 
+        if "expand_yaml_path" not in op_spec:
+            expand_yaml_op = op_spec.get("expand_yaml_op")
+            op_spec["expand_yaml_path"] = (
+                self._get_expand_config_path(expand_yaml_op) if expand_yaml_op else None
+            )
+
         key = op_spec.get("key", [])
         default_strategy = op_spec.get("default_strategy")
         expand_yaml_path = yaml_path or op_spec.get("expand_yaml_path")
@@ -815,9 +799,21 @@ class TunedConfigLoader(object):
         ranges = expand_config["ranges"]
         return self._build_configs_by_op(op_name, ranges, pre_hook=pre_hook)
 
+    @staticmethod
+    def _copy_configs(configs):
+        # callers, e.g. prune & pre hooks, may update the configs in place
+        copies = []
+        for config in configs:
+            config = copy.copy(config)
+            config.kwargs = dict(config.kwargs)
+            copies.append(config)
+        return copies
+
     def get_tuned_config(self, op_name):
+        """Return new copies of the triton configs of `op_name`, which are only
+        built on the first call."""
         if op_name in self.loaded_triton_config:
-            return self.loaded_triton_config[op_name]
+            return self._copy_configs(self.loaded_triton_config[op_name])
 
         current_op_configs = self._get_op_configs(op_name)
         if not current_op_configs:
@@ -836,4 +832,5 @@ class TunedConfigLoader(object):
                     current_config[default_param] = single_config[default_param]
 
             configs.append(self._create_triton_config(single_config, current_config))
-        return configs
+        self.loaded_triton_config[op_name] = configs
+        return self._copy_configs(configs)
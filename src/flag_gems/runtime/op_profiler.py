@@ -0,0 +1,263 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Call-level profiler of the registered FlagGems operators.
+
+This module is only imported when the ops are registered with
+``profile=True``, e.g. ``flag_gems.enable(profile=True)``.  Each op is then
+wrapped to record, per aten key:
+
+- the number of calls,
+- the host time spent in the call, as a total & a log2 histogram,
+- the device time between events recorded around the call, when enabled,
+- the distinct shape/dtype signatures of the tensor arguments.
+
+The statistics are aggregated in memory by the global `profiler` and reported
+with `OpProfiler.table` or `OpProfiler.dump`.  The times of an op include those
+of the registered ops it calls.
+"""
+
+import contextlib
+import json
+import threading
+import time
+
+import torch
+
+from . import torch_device_fn
+
+# number of buckets of the latency histograms, bucket i counts the calls that
+# took less than 2**i microseconds
+HISTOGRAM_BUCKETS = 24
+# distinct signatures tracked per op, more are only counted as overflow
+MAX_SIGNATURES = 1024
+# events recorded before the completed ones are resolved, the threshold then
+# grows to twice the events still pending so that each event is scanned an
+# amortized constant number of times
+MAX_PENDING_EVENTS = 4096
+
+
+class OpStats:
+    """Aggregated statistics of the calls to one op."""
+
+    __slots__ = (
+        "calls",
+        "host_ns",
+        "host_max_ns",
+        "histogram",
+        "device_ms",
+        "device_calls",
+        "signatures",
+        "signature_overflow",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.host_ns = 0
+        self.host_max_ns = 0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+        self.device_ms = 0.0
+        self.device_calls = 0
+        self.signatures = set()
+        self.signature_overflow = False
+
+    def add(self, host_ns, signature):
+        self.calls += 1
+        self.host_ns += host_ns
+        self.host_max_ns = max(self.host_max_ns, host_ns)
+        bucket = min((host_ns // 1000).bit_length(), HISTOGRAM_BUCKETS - 1)
+        self.histogram[bucket] += 1
+        if len(self.signatures) < MAX_SIGNATURES:
+            self.signatures.add(signature)
+        elif signature not in self.signatures:
+            self.signature_overflow = True
+
+    def quantile_us(self, q):
+        """Upper bound of the `q` quantile of the host time, in microseconds."""
+        target = q * self.calls
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= target:
+                return 1 << bucket
+        return 1 << (HISTOGRAM_BUCKETS - 1)
+
+    def as_dict(self, op):
+        return {
+            "op": op,
+            "calls": self.calls,
+            "host_total_us": self.host_ns / 1e3,
+            "host_mean_us": self.host_ns / 1e3 / max(self.calls, 1),
+            "host_max_us": self.host_max_ns / 1e3,
+            "host_p50_us": self.quantile_us(0.5),
+            "host_p99_us": self.quantile_us(0.99),
+            "device_total_us": self.device_ms * 1e3 if self.device_calls else None,
+            "signatures": len(self.signatures),
+            "signature_overflow": self.signature_overflow,
+            "histogram_us": {
+                f"<{1 << i}": count for i, count in enumerate(self.histogram) if count
+            },
+        }
+
+
+def _signature(args):
+    return tuple(
+        (tuple(a.shape), a.dtype) if isinstance(a, torch.Tensor) else type(a)
+        for a in args
+    )
+
+
+def _device_of(args):
+    for a in args:
+        if isinstance(a, torch.Tensor) and a.device.type != "cpu":
+            return a.device
+    return None
+
+
+class OpProfiler:
+    """Aggregates the calls of the profiled ops of all the threads.
+
+    `enabled` pauses the recording without unregistering the ops and
+    `device_time` also records a pair of events around each call.
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self.device_time = False
+        self._stats = {}
+        self._pending = []
+        self._resolve_at = MAX_PENDING_EVENTS
+        self._lock = threading.Lock()
+
+    def _get_stats(self, op):
+        stats = self._stats.get(op)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(op, OpStats())
+        return stats
+
+    def record(self, op, host_ns, signature, events=None):
+        stats = self._get_stats(op)
+        with self._lock:
+            stats.add(host_ns, signature)
+            if events is not None:
+                self._pending.append((stats, *events))
+                if len(self._pending) >= self._resolve_at:
+                    self._resolve_events(wait=False)
+
+    def _resolve_events(self, wait):
+        pending = []
+        for stats, start, end in self._pending:
+            if wait:
+                end.synchronize()
+            elif not end.query():
+                pending.append((stats, start, end))
+                continue
+            stats.device_ms += start.elapsed_time(end)
+            stats.device_calls += 1
+        self._pending = pending
+        self._resolve_at = max(MAX_PENDING_EVENTS, 2 * len(pending))
+
+    def reset(self):
+        """Drop the statistics recorded so far."""
+        with self._lock:
+            self._stats = {}
+            self._pending = []
+            self._resolve_at = MAX_PENDING_EVENTS
+
+    def summary(self, sort_by="host_total_us"):
+        """Return the statistics of each op as dicts, sorted in descending order.
+
+        Waits for the device events recorded so far.
+        """
+        with self._lock:
+            self._resolve_events(wait=True)
+            rows = [stats.as_dict(op) for op, stats in self._stats.items()]
+        return sorted(rows, key=lambda row: row[sort_by] or 0, reverse=True)
+
+    def table(self, sort_by="host_total_us", top=None):
+        """Format the statistics of the `top` ops as a text table."""
+        rows = self.summary(sort_by)[:top]
+        header = (
+            f"{'op':<40} {'calls':>9} {'host total us':>14} {'host mean us':>13} "
+            f"{'p50 us':>8} {'p99 us':>8} {'device total us':>16} {'shapes':>7}"
+        )
+        lines = [header, "-" * len(header)]
+        for row in rows:
+            device = row["device_total_us"]
+            shapes = f"{row['signatures']}{'+' if row['signature_overflow'] else ''}"
+            lines.append(
+                f"{row['op']:<40} {row['calls']:>9} {row['host_total_us']:>14.1f} "
+                f"{row['host_mean_us']:>13.2f} {'<' + str(row['host_p50_us']):>8} "
+                f"{'<' + str(row['host_p99_us']):>8} "
+                f"{'-' if device is None else f'{device:.1f}':>16} {shapes:>7}"
+            )
+        return "\n".join(lines)
+
+    def dump(self, path, sort_by="host_total_us"):
+        """Write the statistics to `path`, as JSON if it ends with .json."""
+        with open(path, "w") as f:
+            if str(path).endswith(".json"):
+                json.dump(self.summary(sort_by), f, indent=2)
+            else:
+                f.write(self.table(sort_by) + "\n")
+
+
+profiler = OpProfiler()
+
+
+def profiled(op_key, fn):
+    """Wrap the implementation `fn` of `op_key` to record its calls."""
+
+    def wrapper(*args, **kwargs):
+        if not profiler.enabled:
+            return fn(*args, **kwargs)
+        events = None
+        device = _device_of(args) if profiler.device_time else None
+        if device is not None:
+            with torch_device_fn.device(device):
+                events = (
+                    torch_device_fn.Event(enable_timing=True),
+                    torch_device_fn.Event(enable_timing=True),
+                )
+                events[0].record()
+        start = time.perf_counter_ns()
+        result = fn(*args, **kwargs)
+        host_ns = time.perf_counter_ns() - start
+        if events is not None:
+            with torch_device_fn.device(device):
+                events[1].record()
+        profiler.record(op_key, host_ns, _signature(args), events)
+        return result
+
+    wrapper.__name__ = fn.__name__
+    wrapper.__qualname__ = getattr(fn, "__qualname__", fn.__name__)
+    return wrapper
+
+
+@contextlib.contextmanager
+def profile(device_time=False, reset=True):
+    """Record the calls of the profiled ops inside the block.
+
+    Yields the global `profiler`; the ops must have been registered with
+    ``profile=True``.  The previous settings are restored on exit.
+    """
+    if reset:
+        profiler.reset()
+    previous = profiler.enabled, profiler.device_time
+    profiler.enabled, profiler.device_time = True, device_time
+    try:
+        yield profiler
+    finally:
+        profiler.enabled, profiler.device_time = previous
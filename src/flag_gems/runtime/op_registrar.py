@@ -12,12 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 import warnings
 
 from . import backend, common, error
 from .backend.device_finder import DeviceDetector
 
 
+class OpSwitch(threading.local):
+    """A thread-local switch of the ops registered by a GeneralOpRegistrar.
+
+    The ops stay registered, but they only run the FlagGems implementations in
+    the threads where the switch is on, and the kernels they replaced elsewhere.
+    The switch is re-entrant: it is on while `depth` is positive.
+    """
+
+    def __init__(self):
+        self.depth = 0
+
+    def __enter__(self):
+        self.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.depth -= 1
+
+
 class GeneralOpRegistrar:
     def __init__(
         self,
@@ -27,12 +47,18 @@ class GeneralOpRegistrar:
         cpp_patched_ops=None,
         lib=None,
         full_config_by_func=None,
+        switch=None,
+        profile=False,
     ):
         self.device = DeviceDetector()
 
         # lib is a instance of torch.library.Library
         # Some inference chips may not support the backward implementation of operators
         self.lib = lib
+        # optional OpSwitch toggling the registered ops
+        self.switch = switch
+        # whether to record the calls of the registered ops, see op_profiler
+        self.profile = profile
 
         # reg_key like 'CUDA'
         self.reg_key = self.device.dispatch_key
@@ -125,10 +151,45 @@ class GeneralOpRegistrar:
     def get_vendor_unused_op(self):
         return backend.get_unused_ops(self.device.vendor_name)
 
+    def switchable_impl(self, fn, fallback, dispatch_key):
+        """Wrap `fn` to run `fallback`, the kernel it replaces, when the switch is off."""
+        import torch
+
+        keyset = torch._C.DispatchKeySet(getattr(torch._C.DispatchKey, dispatch_key))
+        switch = self.switch
+
+        def impl(*args, **kwargs):
+            if switch.depth:
+                return fn(*args, **kwargs)
+            return fallback.call_boxed(keyset, *args, **kwargs)
+
+        impl.__name__ = fn.__name__
+        impl.__qualname__ = getattr(fn, "__qualname__", fn.__name__)
+        return impl
+
     def register_impl(self, key, fn, extra_dispatch_keys=()):
         if self.lib is None:
             raise ValueError("Library instance is not provided.")
         device_key = self.reg_key
+        if self.profile:
+            from .op_profiler import profiled
+
+            fn = profiled(key, fn)
+        impls = {
+            dispatch_key: fn for dispatch_key in (device_key, *extra_dispatch_keys)
+        }
+        if self.switch is not None:
+            import torch
+
+            # capture the replaced kernels before registering over them
+            impls = {
+                dispatch_key: self.switchable_impl(
+                    fn,
+                    torch.library.get_kernel("aten::" + key, dispatch_key),
+                    dispatch_key,
+                )
+                for dispatch_key in impls
+            }
         self.all_ops.append(fn.__name__)
         self.all_keys.append(key)
         if self.device.vendor == common.vendors.CAMBRICON:
@@ -141,15 +202,15 @@ class GeneralOpRegistrar:
             except Exception:
                 pass
             try:
-                self.lib.impl(key, fn, device_key, allow_override=True)
+                self.lib.impl(key, impls[device_key], device_key, allow_override=True)
             except TypeError:
                 # Older torch versions don't support allow_override
-                self.lib.impl(key, fn, device_key)
+                self.lib.impl(key, impls[device_key], device_key)
         else:
-            self.lib.impl(key, fn, device_key)
+            self.lib.impl(key, impls[device_key], device_key)
 
         for dispatch_key in extra_dispatch_keys:
-            self.lib.impl(key, fn, dispatch_key)
+            self.lib.impl(key, impls[dispatch_key], dispatch_key)
 
     def for_each(self):
         for key, func, extra_dispatch_keys in self.config:
@@ -20,6 +20,9 @@ imported by ``register.py`` only when the user explicitly requests
 """
 
 import functools
+import queue
+import random
+import threading
 
 import torch
 
@@ -30,6 +33,7 @@ from ..logging_utils import (
     precision_config,
     write_precision_result,
 )
+from . import torch_device_fn
 from .op_registrar import GeneralOpRegistrar
 
 # Maximum tensor element count allowed for precision check
@@ -58,6 +62,17 @@ def _to_cpu(x):
     return x
 
 
+def _snapshot(x):
+    """Recursively clone tensors on their device, without synchronizing."""
+    if isinstance(x, torch.Tensor):
+        return x.detach().clone()
+    elif isinstance(x, (list, tuple)):
+        return type(x)(_snapshot(i) for i in x)
+    elif isinstance(x, dict):
+        return {k: _snapshot(v) for k, v in x.items()}
+    return x
+
+
 def _max_tensor_numel(args):
     """Return the element count of the largest tensor in the arguments."""
     max_n = 0
@@ -96,6 +111,128 @@ def _parse_op_key(op_key):
     return op_name, overload_name, should_skip
 
 
+def _check(op_key, aten_overload, args, kwargs, fg_result):
+    """Compare `fg_result` with the native result & log a failure, if any."""
+    cpu_args = [_to_cpu(a) for a in args]
+    cpu_kwargs = {k: _to_cpu(v) for k, v in kwargs.items()}
+    fg_result_cpu = _to_cpu(fg_result)
+
+    with torch.no_grad():
+        pt_result_cpu = aten_overload(*cpu_args, **cpu_kwargs)
+
+    cfg = precision_config
+    rtol, atol = _get_dtype_tolerance(args, cfg["rtol"], cfg["atol"])
+    is_close, info = compare_outputs(fg_result_cpu, pt_result_cpu, rtol, atol)
+
+    if not is_close:
+        cfg["logged_ops"].add(op_key)
+        input_info = [get_tensor_info(a) for a in args if get_tensor_info(a)]
+        output_info = get_tensor_info(fg_result)
+
+        record = {
+            "op": op_key,
+            "status": "FAIL",
+            "inputs": input_info,
+            "output": output_info,
+            "rtol": rtol,
+            "atol": atol,
+        }
+        if "error" in info:
+            record["error"] = info["error"]
+            record["fg_value"] = info["fg"]
+            record["pt_value"] = info["pt"]
+        else:
+            record["max_abs_diff"] = info["max_abs"]
+            record["max_rel_diff"] = info["max_rel"]
+        write_precision_result(record)
+
+
+# Set on the threads running a check, so the ops they call are not checked
+_local = threading.local()
+
+
+class _AsyncChecker:
+    """Runs the sampled checks on a background thread.
+
+    The caller snapshots the inputs & results on the device and records an
+    event on its stream.  The worker waits for the event on a side stream,
+    copies the snapshots to CPU there & runs the check, so the calling stream
+    never waits for it.  Checks are dropped while `max_pending` of them are
+    queued.
+    """
+
+    def __init__(self):
+        self._queue = None
+        self._thread = None
+        self._streams = {}
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def submit(self, job):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._queue = queue.Queue(precision_config.get("max_pending", 16))
+                    self._thread = threading.Thread(
+                        target=self._run, name="flag_gems_precision", daemon=True
+                    )
+                    self._thread.start()
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            self.dropped += 1
+
+    def wait(self):
+        """Block until all the submitted checks have finished."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def _side_stream(self, device):
+        stream = self._streams.get(device)
+        if stream is None:
+            stream = self._streams[device] = torch_device_fn.Stream(device)
+        return stream
+
+    def _run(self):
+        _local.checking = True
+        while True:
+            op_key, aten_overload, args, kwargs, fg_result, ready = self._queue.get()
+            try:
+                if ready is None:
+                    _check(op_key, aten_overload, args, kwargs, fg_result)
+                else:
+                    device, event = ready
+                    stream = self._side_stream(device)
+                    with torch_device_fn.stream(stream):
+                        stream.wait_event(event)
+                        _check(op_key, aten_overload, args, kwargs, fg_result)
+            except Exception:
+                pass
+            finally:
+                self._queue.task_done()
+
+
+_async_checker = _AsyncChecker()
+
+
+def wait_precision_checks():
+    """Block until the checks queued in ``"async"`` mode have been logged."""
+    _async_checker.wait()
+
+
+def _record_event(args):
+    """Record an event on the current stream of the device of `args`."""
+    for a in args:
+        if isinstance(a, torch.Tensor) and a.device.type != "cpu":
+            if not hasattr(torch_device_fn, "Event"):
+                return None
+            with torch_device_fn.device(a.device):
+                event = torch_device_fn.Event()
+                event.record()
+            return a.device, event
+    return None
+
+
 def _wrap_op_with_precision_check(op_key, fn):
     """Wrap a FlagGems operator to compare its output against native PyTorch.
 
@@ -103,8 +240,12 @@ def _wrap_op_with_precision_check(op_key, fn):
     cannot be called on GPU, so inputs are copied to CPU to compute the
     reference result.  Performance overhead is controlled by:
     - max_checks: only check the first N calls per operator (default 10)
+    - sample_rate: only check this fraction of the calls (default 1.0)
     - skip large tensors (over 1M elements)
     - once a failure is logged, that operator is no longer checked
+
+    In ``"async"`` mode the checks run on a background thread from on-device
+    snapshots, see `_AsyncChecker`.
     """
     # --- Pre-compute everything derivable from op_key at wrap time ---
     op_name, overload_name, should_skip = _parse_op_key(op_key)
@@ -121,70 +262,70 @@ def _wrap_op_with_precision_check(op_key, fn):
     if aten_overload is None:
         return fn
 
-    # Pre-fetch the set reference for fast membership test
-    _logged_ops = precision_config["logged_ops"]
     _call_count = 0
 
     @functools.wraps(fn)
     def wrapper(*args, **kwargs):
         nonlocal _call_count
+        cfg = precision_config
 
-        # Skip operators that have already logged a failure
-        if op_key in _logged_ops:
+        # Skip operators that have already logged a failure, and the ops
+        # called by a running check
+        if op_key in cfg["logged_ops"] or getattr(_local, "checking", False):
             return fn(*args, **kwargs)
 
-        # Sampling: only check the first N calls per operator
+        # Sampling: only check a fraction of the first N calls per operator
+        sample_rate = cfg.get("sample_rate", 1.0)
+        if sample_rate < 1.0 and random.random() >= sample_rate:
+            return fn(*args, **kwargs)
         _call_count += 1
-        if _call_count > precision_config.get("max_checks", 10):
+        if _call_count > cfg.get("max_checks", 10):
             return fn(*args, **kwargs)
 
         # Skip large tensors to avoid copy overhead
         if _max_tensor_numel(args) > _MAX_NUMEL_FOR_CHECK:
             return fn(*args, **kwargs)
 
+        if cfg.get("mode", "sync") == "async":
+            # Snapshot the inputs before in-place ops modify them
+            _local.checking = True
+            try:
+                snapshot_args = _snapshot(args)
+                snapshot_kwargs = _snapshot(kwargs)
+            finally:
+                _local.checking = False
+            fg_result = fn(*args, **kwargs)
+            _local.checking = True
+            try:
+                job = (
+                    op_key,
+                    aten_overload,
+                    snapshot_args,
+                    snapshot_kwargs,
+                    _snapshot(fg_result),
+                    _record_event(args),
+                )
+                _async_checker.submit(job)
+            except Exception:
+                pass
+            finally:
+                _local.checking = False
+            return fg_result
+
         # Execute the FlagGems implementation FIRST with no interference
         fg_result = fn(*args, **kwargs)
 
+        _local.checking = True
         try:
             # Copy inputs and output to CPU for comparison.
             # The .cpu() call implicitly synchronizes the CUDA stream.
             # For in-place ops (op_name ends with '_'), inputs may have been
             # modified, but those ops are typically skipped via _SKIP_OPS.
-            cpu_args = [_to_cpu(a) for a in args]
-            cpu_kwargs = {k: _to_cpu(v) for k, v in kwargs.items()}
-            fg_result_cpu = _to_cpu(fg_result)
-
-            with torch.no_grad():
-                pt_result_cpu = aten_overload(*cpu_args, **cpu_kwargs)
-
-            cfg = precision_config
-            rtol, atol = _get_dtype_tolerance(args, cfg["rtol"], cfg["atol"])
-            is_close, info = compare_outputs(fg_result_cpu, pt_result_cpu, rtol, atol)
-
-            if not is_close:
-                _logged_ops.add(op_key)
-                input_info = [get_tensor_info(a) for a in args if get_tensor_info(a)]
-                output_info = get_tensor_info(fg_result)
-
-                record = {
-                    "op": op_key,
-                    "status": "FAIL",
-                    "inputs": input_info,
-                    "output": output_info,
-                    "rtol": rtol,
-                    "atol": atol,
-                }
-                if "error" in info:
-                    record["error"] = info["error"]
-                    record["fg_value"] = info["fg"]
-                    record["pt_value"] = info["pt"]
-                else:
-                    record["max_abs_diff"] = info["max_abs"]
-                    record["max_rel_diff"] = info["max_rel"]
-                write_precision_result(record)
-
+            _check(op_key, aten_overload, args, kwargs, fg_result)
         except Exception:
             pass
+        finally:
+            _local.checking = False
 
         return fg_result
 
@@ -24,6 +24,7 @@ from flag_gems.utils.shape_utils import (
     broadcastable_to,
     dim_compress,
     offsetCalculator,
+    reduction_view,
     restride_dim,
 )
 from flag_gems.utils.triton_driver_helper import get_device_properties
@@ -42,6 +43,7 @@ __all__ = [
     "KernelInfo",
     "PointwiseDynamicFunction",
     "dim_compress",
+    "reduction_view",
     "restride_dim",
     "offsetCalculator",
     "broadcastable_to",
@@ -48,6 +48,12 @@ def config_cache_dir() -> Path:
     return _config_cache_dir
 
 
+def kernel_cache_dir() -> Path:
+    _kernel_cache_dir = cache_dir() / "kernel_cache"
+    os.makedirs(_kernel_cache_dir, exist_ok=True)
+    return _kernel_cache_dir
+
+
 def clear_cache():
     """Clear the cache directory for code cache."""
     _cache_dir = cache_dir_path()
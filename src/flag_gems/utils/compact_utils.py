@@ -0,0 +1,91 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Output sizing of count-then-compact ops, e.g. nonzero & unique.
+
+Such ops write the selected rows at the front of an output buffer & their
+number to a device scalar, `count`. Sizing the result by the count reads it
+back, which blocks the host until the device catches up. When the caller
+provides an upper bound `size` instead, the result has exactly `size` rows,
+the rows past the count are filled with `fill_value` on the device, and the
+op stays asynchronous.
+"""
+
+import torch
+import triton
+import triton.language as tl
+
+from flag_gems.runtime import torch_device_fn
+from flag_gems.utils import triton_lang_extension as ext
+from flag_gems.utils.libentry import libentry
+
+
+@libentry()
+@triton.jit(do_not_specialize=["fill_value", "count_offset"])
+def fill_compacted_tail_kernel(
+    out,
+    count,
+    numel,
+    row_numel,
+    fill_value,
+    count_offset,
+    BLOCK_SIZE: tl.constexpr,
+):
+    pid = ext.program_id(0)
+    start = (tl.load(count).to(tl.int64) + count_offset) * row_numel
+    offset = pid * BLOCK_SIZE + tl.arange(0, BLOCK_SIZE)
+    mask = (offset >= start) & (offset < numel)
+    fill = tl.zeros((BLOCK_SIZE,), dtype=out.dtype.element_ty) + fill_value
+    tl.store(out + offset, fill.to(out.dtype.element_ty), mask=mask)
+
+
+def compacted_size(count, size=None, count_offset=0):
+    """Return `size`, or the rows counted by the device scalar `count` plus
+    `count_offset` when no bound is given, which synchronizes."""
+    if size is None:
+        return count.item() + count_offset
+    if size < 0:
+        raise ValueError(f"size must be non-negative, got {size}")
+    return size
+
+
+def compact_rows(out, count, size=None, fill_value=0, count_offset=0):
+    """Return the leading rows of `out` written by a count-then-compact kernel.
+
+    Without `size`, these are the `count + count_offset` rows. Otherwise the
+    result has `size` rows and those past the count hold `fill_value`; `out`
+    is padded when it has fewer rows.
+    """
+    rows = compacted_size(count, size, count_offset)
+    if size is None:
+        return out[:rows]
+    if out.shape[0] < rows:
+        pad = out.new_empty((rows - out.shape[0],) + tuple(out.shape[1:]))
+        out = torch.cat([out, pad])
+    out = out[:rows]
+    if out.numel() == 0:
+        return out
+    block_size = 1024
+    grid = (triton.cdiv(out.numel(), block_size),)
+    with torch_device_fn.device(out.device):
+        fill_compacted_tail_kernel[grid](
+            out,
+            count,
+            out.numel(),
+            out.numel() // rows,
+            fill_value,
+            count_offset,
+            BLOCK_SIZE=block_size,
+        )
+    return out
@@ -0,0 +1,197 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Persistent cache of the kernels dispatched by `LibEntry`.
+
+With `FLAGGEMS_PERSISTENT_KERNEL_CACHE=1`, each kernel compiled by a
+`LibEntry` is recorded under `kernel_cache_dir()`:
+
+- `<kernel hash>/<entry hash>.json` holds the hash of the compiled kernel and
+  the constexprs resolved by the autotuners & heuristics for one
+  specialization key of the `LibEntry`;
+- `artifacts/<triton hash>/` holds a copy of the files Triton compiled.
+
+The kernel hash covers the Triton version, the source of the jit function &
+its dependencies, the configs of the autotuners and the code of the
+heuristics; the entry hash covers the specialization key & the target. On the
+first launch of a specialization in a new process, the kernel is then loaded
+from these files, without running the Triton jit, autotuners and heuristics.
+
+Kernels with launch pre-hooks, non scalar constexprs or tuned by FlagTune are
+not recorded.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from collections import namedtuple
+from types import SimpleNamespace
+
+import triton
+
+from flag_gems.utils.code_cache import kernel_cache_dir
+
+logger = logging.getLogger(__name__)
+
+FLAGGEMS_PERSISTENT_KERNEL_CACHE = (
+    os.getenv("FLAGGEMS_PERSISTENT_KERNEL_CACHE", "0") == "1"
+)
+
+KernelCacheInfo = namedtuple("KernelCacheInfo", ["hits", "misses", "stores"])
+
+_JSON_SCALARS = (bool, int, float, str, type(None))
+
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "stores": 0}
+_targets = {}
+
+
+def _function_hash(fn):
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return repr(fn)
+    return f"{code.co_code.hex()}{code.co_consts!r}{code.co_names!r}"
+
+
+def kernel_hash(entry):
+    """Return the hash naming the kernels of `entry` across processes."""
+    parts = [triton.__version__]
+    fn = entry.fn
+    while not isinstance(fn, triton.runtime.JITFunction):
+        if isinstance(fn, triton.runtime.Autotuner):
+            parts.append(",".join(map(str, fn.configs)))
+        elif isinstance(fn, triton.runtime.Heuristics):
+            parts.extend(f"{k}:{_function_hash(v)}" for k, v in fn.values.items())
+        fn = fn.fn
+    parts.append(fn.cache_key)
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def _current_target(device):
+    target = _targets.get(device)
+    if target is None:
+        target = str(triton.runtime.driver.active.get_current_target())
+        _targets[device] = target
+    return target
+
+
+def _record_path(entry, device, entry_key):
+    key = repr(entry_key)
+    # objects without a stable repr, e.g. functions passed as constexprs
+    if " at 0x" in key:
+        return None
+    if entry._kernel_hash is None:
+        entry._kernel_hash = kernel_hash(entry)
+    name = hashlib.sha256(
+        f"{_current_target(device)}|{key}".encode("utf-8")
+    ).hexdigest()[:32]
+    return kernel_cache_dir() / entry._kernel_hash / f"{name}.json"
+
+
+def _write_atomic(path, text):
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+def _copy_artifacts(kernel):
+    from triton.runtime.cache import get_cache_manager
+
+    src = getattr(get_cache_manager(kernel.hash), "cache_dir", None)
+    if src is None:
+        return False
+    dst = kernel_cache_dir() / "artifacts" / kernel.hash
+    if dst.exists():
+        return True
+    tmp = dst.with_name(f"{dst.name}.{uuid.uuid4().hex}.tmp")
+    shutil.copytree(src, tmp)
+    try:
+        os.rename(tmp, dst)
+    except OSError:
+        # another process stored the same kernel
+        shutil.rmtree(tmp, ignore_errors=True)
+    return True
+
+
+def load(entry, device, entry_key):
+    """Return the cached kernel entry of `entry_key`, or None."""
+    try:
+        path = _record_path(entry, device, entry_key)
+        if path is None or not path.exists():
+            with _lock:
+                _stats["misses"] += 1
+            return None
+        from triton.compiler.compiler import CompiledKernel
+
+        record = json.loads(path.read_text())
+        artifacts = kernel_cache_dir() / "artifacts" / record["hash"]
+        metadata_group = {
+            p.name: str(p)
+            for p in artifacts.iterdir()
+            if not p.name.startswith("__grp__")
+        }
+        # the kernel only reads the jit function from its source
+        src = SimpleNamespace(fn=entry.jit_function, name=entry.jit_function.__name__)
+        kernel = CompiledKernel(src, metadata_group, record["hash"])
+    except Exception as e:
+        logger.debug("Failed to load a cached kernel of %s: %s", entry.arg_names, e)
+        with _lock:
+            _stats["misses"] += 1
+        return None
+    with _lock:
+        _stats["hits"] += 1
+    return (
+        kernel,
+        record["constexprs"],
+        record["tune_constexprs"],
+        record["heur_constexprs"],
+        (),
+    )
+
+
+def store(entry, device, entry_key, cache_entry):
+    """Record the kernel entry `cache_entry` of `entry_key` on disk."""
+    kernel, constexprs, tune_constexprs, heur_constexprs, pre_hooks = cache_entry
+    if pre_hooks or getattr(kernel, "hash", None) is None:
+        return
+    for values in (constexprs, tune_constexprs, heur_constexprs):
+        if not all(isinstance(v, _JSON_SCALARS) for v in values.values()):
+            return
+    try:
+        path = _record_path(entry, device, entry_key)
+        if path is None or not _copy_artifacts(kernel):
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            "hash": kernel.hash,
+            "constexprs": constexprs,
+            "tune_constexprs": tune_constexprs,
+            "heur_constexprs": heur_constexprs,
+        }
+        _write_atomic(path, json.dumps(record))
+    except Exception as e:
+        logger.debug("Failed to store a kernel of %s: %s", entry.arg_names, e)
+        return
+    with _lock:
+        _stats["stores"] += 1
+
+
+def kernel_cache_info() -> KernelCacheInfo:
+    """Return the statistics of the persistent kernel cache."""
+    with _lock:
+        return KernelCacheInfo(_stats["hits"], _stats["misses"], _stats["stores"])
@@ -0,0 +1,134 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy exports for packages with many operator submodules.
+
+The exports of such a package are declared by the import statements of its
+`__init__.pyi` stub, which also serves type checkers, and the package only
+imports the submodule defining an export on its first access::
+
+    # flag_gems/ops/__init__.py
+    from flag_gems.utils.lazy_import import attach_stub
+
+    attach_stub(__name__, __file__)
+
+With `FLAGGEMS_LAZY_IMPORT=1`, `import flag_gems` does not import the operator
+submodules at all: the functions it registers to torch are trampolines, see
+`lazy_functions`, which import the implementation on their first call.
+"""
+
+import ast
+import importlib
+import os
+import sys
+import types
+from typing import Callable, Dict, List, Tuple
+
+FLAGGEMS_LAZY_IMPORT = os.getenv("FLAGGEMS_LAZY_IMPORT", "0") == "1"
+
+
+def parse_stub(package_name: str, stub_path: str) -> Tuple[Dict, List[str]]:
+    """Return the exports, {name: (module, attribute)}, and `__all__` of a stub."""
+    with open(stub_path) as f:
+        tree = ast.parse(f.read(), filename=stub_path)
+
+    exports = {}
+    all_names = []
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package_name.rsplit(".", node.level - 1)[0]
+                module = f"{base}.{node.module}" if node.module else base
+            else:
+                module = node.module
+            for alias in node.names:
+                exports[alias.asname or alias.name] = (module, alias.name)
+        elif isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "__all__"
+            for target in node.targets
+        ):
+            all_names = list(ast.literal_eval(node.value))
+    return exports, all_names
+
+
+class LazyExportsModule(types.ModuleType):
+    """A package whose exports are imported from their submodules on first access."""
+
+    def __getattr__(self, name):
+        try:
+            module, attribute = self.__dict__["_lazy_exports"][name]
+        except KeyError:
+            raise AttributeError(
+                f"module {self.__name__!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(module), attribute)
+        types.ModuleType.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        # The import system binds a submodule to its package once it is loaded.
+        # Keep the exported object bound instead when they share a name, like
+        # `from .add import add` does in an eager package.
+        target = self.__dict__.get("_lazy_exports", {}).get(name)
+        if target is not None and isinstance(value, types.ModuleType):
+            module, attribute = target
+            if value.__name__ != module:
+                value = importlib.import_module(module)
+            value = getattr(value, attribute)
+        types.ModuleType.__setattr__(self, name, value)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self.__dict__["_lazy_exports"]))
+
+
+def attach_stub(package_name: str, init_file: str) -> None:
+    """Make the package lazily export what its `__init__.pyi` stub imports."""
+    package = sys.modules[package_name]
+    exports, all_names = parse_stub(
+        package_name, os.path.splitext(init_file)[0] + ".pyi"
+    )
+    package.__dict__["_lazy_exports"] = exports
+    package.__dict__["__all__"] = all_names
+    package.__class__ = LazyExportsModule
+
+
+def _trampoline(package: types.ModuleType, name: str) -> Callable:
+    impl = None
+
+    def trampoline(*args, **kwargs):
+        nonlocal impl
+        if impl is None:
+            impl = getattr(package, name)
+        return impl(*args, **kwargs)
+
+    module, attribute = package._lazy_exports[name]
+    trampoline.__name__ = attribute
+    trampoline.__qualname__ = attribute
+    trampoline.__module__ = module
+    return trampoline
+
+
+def lazy_functions(package: types.ModuleType) -> Dict[str, Callable]:
+    """Return trampolines for the functions a lazy package exports in `__all__`.
+
+    The objects of the package are not imported, so exports are taken as
+    functions unless their names are capitalized, as classes & constants are.
+    Each trampoline carries the name of the function, and imports it on its
+    first call.
+    """
+    return {
+        name: _trampoline(package, name)
+        for name in package.__all__
+        if name in package._lazy_exports and not name[0].isupper()
+    }
@@ -23,8 +23,9 @@ import multiprocessing
 import os
 import time
 import warnings
+import weakref
 from abc import abstractmethod
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 from contextlib import contextmanager
 from enum import Enum
 from functools import cached_property
@@ -33,6 +34,7 @@ from pathlib import Path
 from typing import (
     Any,
     Callable,
+    ContextManager,
     Dict,
     Final,
     Iterable,
@@ -69,8 +71,13 @@ else:
 from flag_gems import runtime
 from flag_gems.runtime import device, torch_device_fn
 from flag_gems.runtime.backend import _state
+from flag_gems.utils import kernel_cache
 from flag_gems.utils.code_cache import config_cache_dir
-from flag_gems.utils.models import PersistantModel, SQLPersistantModel
+from flag_gems.utils.models import (
+    PersistantModel,
+    SQLPersistantModel,
+    WriteBehindPersistantModel,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -191,6 +198,13 @@ def _infer_tensor_dtypes(values: Iterable[Any]) -> Tuple[Any, ...]:
     return tuple(dtypes)
 
 
+FLAGGEMS_LIBCACHE_CAPACITY = int(os.getenv("FLAGGEMS_LIBCACHE_CAPACITY", "4096"))
+FLAGGEMS_LIBCACHE_PRELOAD = os.getenv("FLAGGEMS_LIBCACHE_PRELOAD", "0") == "1"
+
+# Marks a key known to be absent from the persistent model (negative caching).
+_MISSING: Final[object] = object()
+
+
 class Cache(object):
     def __init__(
         self, table_name: str, model: PersistantModel, *args, **kwargs
@@ -203,12 +217,31 @@ class Cache(object):
 class ConfigCache(Cache):
     """
     `ConfigCache` is used to store the relationship between keys and their known best configurations.
+
+    Lookups are served by an in-process LRU tier in front of the persistent model. Both found configs and
+    misses are remembered, so a hot key never reaches the database twice. Call `invalidate` when rows may
+    have been written by another process.
+
+    A table filled by `preload` is complete: its rows are never evicted and lookups never query the
+    database, a key missing from memory is a miss. A table waiting for a bulk preload runs
+    `pending_preload` on its first memory miss.
     """
 
     def __init__(
-        self, table_name: str, model: PersistantModel, *args, **kwargs
+        self,
+        table_name: str,
+        model: PersistantModel,
+        *args,
+        capacity: int = FLAGGEMS_LIBCACHE_CAPACITY,
+        **kwargs,
     ) -> ConfigCache:
         super().__init__(table_name, model, *args, **kwargs)
+        self.capacity: int = capacity
+        self.memory: OrderedDict[Tuple[Union[int, float, str], ...], Any] = (
+            OrderedDict()
+        )
+        self.complete: bool = False
+        self.pending_preload: Optional[Callable[[], None]] = None
 
     def __contains__(self, key: Tuple[Union[int, float, str], ...]) -> bool:
         return self.get(key) is not None
@@ -224,14 +257,62 @@ class ConfigCache(Cache):
     ) -> None:
         self.set(key, config)
 
+    def _remember(self, key: Tuple[Union[int, float, str], ...], value: Any) -> None:
+        # lookups are not locked, other threads may evict the same keys
+        self.memory[key] = value
+        try:
+            self.memory.move_to_end(key)
+        except KeyError:
+            pass
+        if self.complete:
+            return
+        while len(self.memory) > self.capacity:
+            try:
+                self.memory.popitem(last=False)
+            except KeyError:
+                break
+
     def get(self, key: Tuple[Union[int, float, str], ...]) -> Optional[triton.Config]:
-        return self.model.get_config(self.table_name, key)
+        ret = self.memory.get(key)
+        if ret is None and self.pending_preload is not None:
+            self.pending_preload()
+            ret = self.memory.get(key)
+        if ret is None:
+            if self.complete:
+                return None
+            ret = self.model.get_config(self.table_name, key)
+            self._remember(key, _MISSING if ret is None else ret)
+        else:
+            try:
+                self.memory.move_to_end(key)
+            except KeyError:
+                # evicted by another thread
+                pass
+        return None if ret is _MISSING else ret
 
     def set(
         self, key: Tuple[Union[int, float, str], ...], config: triton.Config
     ) -> None:
+        if self.memory.get(key, _MISSING) is _MISSING:
+            self._remember(key, config)
         return self.model.put_config(self.table_name, key, config)
 
+    def invalidate(self, key: Optional[Tuple[Union[int, float, str], ...]] = None):
+        """Drop one key, or every key, from the in-process tier."""
+        self.complete = False
+        if key is None:
+            self.memory.clear()
+        else:
+            self.memory.pop(key, None)
+
+    def preload(
+        self, rows: Dict[Tuple[Union[int, float, str], ...], triton.Config]
+    ) -> None:
+        """Replace the in-process tier with every row of the table."""
+        self.memory = OrderedDict(rows)
+        self.complete = True
+        self.pending_preload = None
+
 
 class BenchmarkCache(Cache):
     def __init__(
@@ -244,12 +325,14 @@ class BenchmarkCache(Cache):
     ) -> BenchmarkCache:
         """
         `BenchmarkCache` is used to store the benchmark results for the pair of the specific key and configuration.
+        Results that have been read or written once are kept in process memory.
         """
         super().__init__(table_name, model, *args, **kwargs)
         self.key: Final[Tuple[Union[int, float, str], ...]] = key
+        self.memory: Dict[Tuple[Any, ...], Any] = {}
 
     def __contains__(self, config: triton.Config) -> bool:
-        return self.model.get_benchmark(self.key, config) is not None
+        return self.get(config) is not None
 
     def __getitem__(self, config: triton.Config) -> Tuple[float]:
         ret: Optional[Tuple[float, float, float]] = self.get(config)
@@ -263,13 +346,34 @@ class BenchmarkCache(Cache):
         return self.set(config, benchmark)
 
     def get(self, config: triton.Config) -> Optional[Tuple[float, float, float]]:
-        return self.model.get_benchmark(self.table_name, self.key, config)
+        config_key = PersistantModel.config_key(config)
+        ret = self.memory.get(config_key)
+        if ret is None:
+            ret = self.model.get_benchmark(self.table_name, self.key, config)
+            self.memory[config_key] = _MISSING if ret is None else ret
+        return None if ret is _MISSING else ret
 
     def set(self, config: triton.Config, benchmark: Tuple[float, float, float]) -> None:
+        config_key = PersistantModel.config_key(config)
+        if self.memory.get(config_key, _MISSING) is _MISSING:
+            self.memory[config_key] = tuple(benchmark)
         return self.model.put_benchmark(self.table_name, self.key, config, benchmark)
 
+    def invalidate(self) -> None:
+        """Drop every result of this key from the in-process tier."""
+        self.memory.clear()
+
 
 class LibCache(object):
+    """Process-wide pool of `ConfigCache` and `BenchmarkCache` tables.
+
+    All tables share one write-behind model, see `batch` and `flush`. With
+    `FLAGGEMS_LIBCACHE_PRELOAD=1` or after `enable_preload()`, the config tables
+    are bulk loaded into memory, so steady-state config lookups never query the
+    database. The tables requested at import are loaded together, in one pass
+    over the database, on the first lookup of any of them.
+    """
+
     _instance = None
 
     def __new__(cls, *args, **kwargs):
@@ -293,7 +397,75 @@ class LibCache(object):
         self.benchmark_cache_pool: Dict[
             Tuple[str, Tuple[Union[int, float, str], ...]], BenchmarkCache
         ] = {}
-        self.model: PersistantModel = SQLPersistantModel(self.db_url)
+        self.model: WriteBehindPersistantModel = WriteBehindPersistantModel(
+            SQLPersistantModel(self.db_url)
+        )
+        self.preload_enabled: bool = FLAGGEMS_LIBCACHE_PRELOAD
+        self.pending_preload_tables: List[str] = []
+
+    def preload(self, tables: Optional[Iterable[str]] = None) -> List[str]:
+        """Bulk load config tables into memory in one pass over the database.
+
+        Args:
+            tables: Config table names to load, by default every table requested
+                so far, which covers each kernel hash of the imported operators.
+
+        Returns:
+            The names of the tables that were loaded completely. Tables the model
+            cannot enumerate keep querying the database on a memory miss.
+        """
+        names = list(self.config_cache_pool if tables is None else tables)
+        if not names:
+            return []
+        loaded = self.model.load_configs(names)
+        for name, rows in loaded.items():
+            self.get_config(name).preload(rows)
+        # the tables the model cannot enumerate query the database
+        for name in names:
+            cache = self.config_cache_pool.get(name)
+            if cache is not None:
+                cache.pending_preload = None
+        done = set(names)
+        self.pending_preload_tables = [
+            name for name in self.pending_preload_tables if name not in done
+        ]
+        return list(loaded)
+
+    def _preload_pending(self) -> None:
+        names, self.pending_preload_tables = self.pending_preload_tables, []
+        if names:
+            self.preload(names)
+
+    def enable_preload(self) -> List[str]:
+        """Preload every requested config table, now and on first request."""
+        self.preload_enabled = True
+        return self.preload()
+
+    def batch(self) -> ContextManager[None]:
+        """Queue `put_config`/`put_benchmark` writes until the outermost scope exits.
+
+        The queued rows are committed in one transaction, so tuning many configs or
+        shapes does not pay one commit per row. Lookups still observe queued rows.
+        """
+        return self.model.batch()
+
+    def flush(self) -> None:
+        """Commit writes queued by an active `batch` scope immediately."""
+        self.model.flush()
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        """Drop in-process entries of one table, or of every table.
+
+        The next lookup of an invalidated key reads the persistent model again.
+        """
+        for name, cache in self.config_cache_pool.items():
+            if table is None or name == table:
+                cache.invalidate()
+        for (name, _), cache in self.benchmark_cache_pool.items():
+            if table is None or name == table:
+                cache.invalidate()
+        if self.preload_enabled and (table is None or table in self.config_cache_pool):
+            self.preload(None if table is None else [table])
 
     @overload
     def __getitem__(self, key: str) -> ConfigCache: ...
@@ -325,6 +497,10 @@ class LibCache(object):
         if ret is None:
             ret = ConfigCache(table, self.model)
             self.config_cache_pool[table] = ret
+            if self.preload_enabled:
+                # loaded with the other tables requested until its first lookup
+                ret.pending_preload = self._preload_pending
+                self.pending_preload_tables.append(table)
         return ret
 
 
@@ -559,6 +735,9 @@ class LibTuner(triton.runtime.Autotuner):
             f"{self.__name__}_{self.cache_key}_benchmark_v"
             f"{BENCHMARK_CACHE_SCHEMA_VERSION}"
         )
+        # Rows of the selected table may have been written while it was inactive,
+        # e.g. by an offline tuning process, so drop remembered misses.
+        libcache.invalidate(self.config_table_name)
         self.cache = libcache[self.config_table_name]
 
     def apply_flagtune(self):
@@ -1010,28 +1189,33 @@ class LibTuner(triton.runtime.Autotuner):
                         self.benchmark_cache_hit_count += 1
                     return list(ret)
 
-                if exhaustive_collection:
-                    best_config, timings = LibTuner.get("default").policy(
-                        self,
-                        bench,
-                        pruned_configs,
-                        args,
-                        kwargs,
-                    )
-                else:
-                    best_config, timings = self.policy(
-                        bench,
-                        pruned_configs,
-                        args,
-                        kwargs,
-                    )
-                bench_end = time.time()
-                self.bench_time = bench_end - bench_start
-                if not bypass_config_cache:
-                    self.cache[config_key] = best_config
-                    config = self.cache[config_key]
-                else:
-                    config = best_config
+                # every benchmark and the selected config are committed together
+                with libcache.batch():
+                    if exhaustive_collection:
+                        best_config, timings = LibTuner.get("default").policy(
+                            self,
+                            bench,
+                            pruned_configs,
+                            args,
+                            kwargs,
+                        )
+                    else:
+                        best_config, timings = self.policy(
+                            bench,
+                            pruned_configs,
+                            args,
+                            kwargs,
+                        )
+                    bench_end = time.time()
+                    self.bench_time = bench_end - bench_start
+                    if not bypass_config_cache:
+                        self.cache[config_key] = best_config
+                        config = self.cache[config_key]
+                    else:
+                        config = best_config
+                    # commit each tuned key, even inside an enclosing batch,
+                    # so that a killed process keeps what it has tuned
+                    libcache.flush()
                 full_nargs = {
                     **self.nargs,
                     **kwargs,
@@ -1040,6 +1224,7 @@ class LibTuner(triton.runtime.Autotuner):
                 self.pre_hook(full_nargs, reset_only=True)
                 self.configs_timings = timings
             else:
+                # served by the in-process tier after the membership probe
                 config = self.cache[config_key]
             if config.pre_hook is None:
                 cached_kwargs = config.all_kwargs()
@@ -1519,6 +1704,126 @@ def libtuner(
     return decorator
 
 
+_SPECIALIZE: Final[int] = 0
+_DO_NOT_SPECIALIZE: Final[int] = 1
+_CONSTEXPR: Final[int] = 2
+
+
+def _hashable_arg(arg: Any) -> Any:
+    if arg.__class__.__name__ != "TensorDescriptor":
+        return arg
+    # Create a hashable representation of TensorDescriptor
+    return (
+        "TensorDescriptor",
+        tuple(arg.shape) if hasattr(arg, "shape") else None,
+        tuple(arg.strides) if hasattr(arg, "strides") else None,
+        tuple(arg.block_shape) if hasattr(arg, "block_shape") else None,
+        arg.padding if hasattr(arg, "padding") else None,
+        # Add other relevant attributes
+    )
+
+
+class _ArgBinder(object):
+    """Classify launch arguments of one JITFunction with precomputed tables.
+
+    The parameter kinds (specialized, do-not-specialize and constexpr), names
+    and defaults are resolved once when the `LibEntry` is constructed, so a
+    launch only walks its arguments once and performs no per-argument
+    membership scans. `bind` returns the three key components used by
+    `LibEntry.key` together with the kernel arguments in signature order.
+    """
+
+    __slots__ = (
+        "param_names",
+        "kinds",
+        "defaults",
+        "num_params",
+        "bind_constexprs",
+    )
+
+    def __init__(self, jit_function: triton.runtime.JITFunction):
+        params = jit_function.params
+        self.param_names: Tuple[str, ...] = tuple(p.name for p in params)
+        self.kinds: Tuple[int, ...] = tuple(
+            (
+                _CONSTEXPR
+                if p.is_constexpr
+                else (_DO_NOT_SPECIALIZE if p.do_not_specialize else _SPECIALIZE)
+            )
+            for p in params
+        )
+        self.defaults: Tuple[Any, ...] = tuple(p.default for p in params)
+        self.num_params: int = len(params)
+        # Triton 3.3 ~ 3.6 expects constexprs to be passed to the compiled kernel.
+        self.bind_constexprs: bool = major_version == 3 and 3 <= minor_version <= 6
+
+    def bind(
+        self, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Tuple[List[Any], List[Any], List[Any], Dict[str, Any]]:
+        spec_args = []  # specialize arguments
+        dns_args = []  # do not specialize arguments
+        const_args = []  # constexpr arguments
+        k_args = {}
+        names = self.param_names
+        kinds = self.kinds
+        bind_constexprs = self.bind_constexprs
+        num_args = len(args)
+        for i in range(num_args):
+            arg = args[i]
+            kind = kinds[i]
+            if kind == _SPECIALIZE:
+                k_args[names[i]] = arg
+                spec_args.append(_hashable_arg(arg))
+            elif kind == _DO_NOT_SPECIALIZE:
+                k_args[names[i]] = arg
+                dns_args.append(_hashable_arg(arg))
+            else:
+                if bind_constexprs:
+                    k_args[names[i]] = arg
+                const_args.append(_hashable_arg(arg))
+        for i in range(num_args, self.num_params):
+            name = names[i]
+            if name in kwargs:
+                val = kwargs[name]
+            else:
+                val = self.defaults[i]
+                if val is inspect._empty:
+                    continue
+            kind = kinds[i]
+            if kind == _CONSTEXPR:
+                const_args.append(val)
+                if bind_constexprs:
+                    k_args[name] = val
+            elif kind == _DO_NOT_SPECIALIZE:
+                dns_args.append(val)
+                k_args[name] = val
+            else:
+                spec_args.append(val)
+                k_args[name] = val
+        return spec_args, dns_args, const_args, k_args
+
+
+# capacity of the dispatch cache of each LibEntry on each device, 0 for no
+# bound; specialized int arguments, e.g. sequence lengths, add an entry per value
+FLAGGEMS_LIBENTRY_CACHE_SIZE = int(os.getenv("FLAGGEMS_LIBENTRY_CACHE_SIZE", "1024"))
+
+# all the live LibEntries, enumerated by libentry_cache_info
+_LIBENTRIES = weakref.WeakSet()
+
+LibEntryCacheInfo = namedtuple(
+    "LibEntryCacheInfo",
+    [
+        "name",
+        "hits",
+        "misses",
+        "evictions",
+        "entries",
+        "max_entries",
+        "specializations",
+    ],
+)
+
+
 class LibEntry(triton.KernelInterface):
     def __init__(
         self,
@@ -1527,9 +1832,19 @@ class LibEntry(triton.KernelInterface):
         self.fn = fn
         self.arg_names = fn.arg_names
         self.divisibility = 16
-        self.kernel_cache = tuple(dict() for _ in range(DEVICE_COUNT))
+        self.kernel_cache = tuple(OrderedDict() for _ in range(DEVICE_COUNT))
         self._has_flagtune_tuner = self._contains_flagtune_tuner(fn)
-        self._cpu_cache = dict()
+        self._cpu_cache = OrderedDict()
+        self.max_cache_entries = FLAGGEMS_LIBENTRY_CACHE_SIZE
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+        # the configs of FlagTune tuners change at runtime, see kernel_cache
+        self._persistent = (
+            kernel_cache.FLAGGEMS_PERSISTENT_KERNEL_CACHE
+            and not self._has_flagtune_tuner
+        )
+        self._kernel_hash = None
 
         while not isinstance(fn, triton.runtime.JITFunction):
             fn = fn.fn
@@ -1546,6 +1861,38 @@ class LibEntry(triton.KernelInterface):
         ]
         self.lock = multiprocessing.Lock()
         self.signature = fn.signature
+        self.binder = _ArgBinder(self.jit_function)
+        self._tensor_spec = self._make_tensor_spec()
+        # names of the components of `key`
+        self._key_names = tuple(
+            name
+            for kind in (_SPECIALIZE, _DO_NOT_SPECIALIZE, _CONSTEXPR)
+            for name, k in zip(self.binder.param_names, self.binder.kinds)
+            if k == kind
+        )
+        _LIBENTRIES.add(self)
+
+    def _make_tensor_spec(self) -> Callable[[Any], Tuple[Any, ...]]:
+        divisibility = self.divisibility
+        if device.vendor_name == "hygon" and hasattr(triton.backends, "hcu"):
+            from triton.backends.hcu.compiler import HIPBackend
+
+            if hasattr(HIPBackend, "get_tensor_specialization"):
+                get_tensor_specialization = HIPBackend.get_tensor_specialization
+
+                def hcu_tensor_spec(arg):
+                    return (
+                        arg.dtype,
+                        arg.data_ptr() % divisibility == 0,
+                        get_tensor_specialization(arg),
+                    )
+
+                return hcu_tensor_spec
+
+        def tensor_spec(arg):
+            return (arg.dtype, arg.data_ptr() % divisibility == 0)
+
+        return tensor_spec
 
     @staticmethod
     def _contains_flagtune_tuner(fn):
@@ -1578,35 +1925,27 @@ class LibEntry(triton.KernelInterface):
                 cache.clear()
 
     def key(self, spec_args, dns_args, const_args):
-        def spec_arg(arg):
+        tensor_spec = self._tensor_spec
+        key = []
+        for arg in spec_args:
             if hasattr(arg, "data_ptr"):
-                if device.vendor_name == "hygon" and hasattr(triton.backends, "hcu"):
-                    from triton.backends.hcu.compiler import HIPBackend
-
-                    if hasattr(HIPBackend, "get_tensor_specialization"):
-                        return (
-                            arg.dtype,
-                            arg.data_ptr() % self.divisibility == 0,
-                            HIPBackend.get_tensor_specialization(arg),
-                        )
-                return (arg.dtype, arg.data_ptr() % self.divisibility == 0)
-            return (type(arg), arg)
-
-        def dns_arg(arg):
+                key.append(tensor_spec(arg))
+            else:
+                key.append((type(arg), arg))
+        for arg in dns_args:
             if hasattr(arg, "data_ptr"):
-                return arg.dtype
-            if not isinstance(arg, int):
-                return type(arg)
-            if -(2**31) <= arg and arg <= 2**31 - 1:
-                return "i32"
-            if 2**63 <= arg and arg <= 2**64 - 1:
-                return "u64"
-            return "i64"
-
-        spec_key = [spec_arg(arg) for arg in spec_args]
-        dns_key = [dns_arg(arg) for arg in dns_args]
+                key.append(arg.dtype)
+            elif not isinstance(arg, int):
+                key.append(type(arg))
+            elif -(2**31) <= arg and arg <= 2**31 - 1:
+                key.append("i32")
+            elif 2**63 <= arg and arg <= 2**64 - 1:
+                key.append("u64")
+            else:
+                key.append("i64")
         # const args passed by position
-        return tuple(spec_key + dns_key + const_args)
+        key.extend(const_args)
+        return tuple(key)
 
     def run(self, *args, **kwargs):
         grid = kwargs["grid"]
@@ -1614,54 +1953,7 @@ class LibEntry(triton.KernelInterface):
             self._apply_flagtune()
 
         # collect all the arguments
-        spec_args = []  # specialize arguments
-        dns_args = []  # do not specialize arguments
-        const_args = []  # constexpr arguments
-        k_args = OrderedDict()
-        param_names = list(self.signature.parameters.keys())
-        for i, arg in enumerate(args):
-            hashable_arg = arg
-            if (
-                hasattr(arg, "__class__")
-                and arg.__class__.__name__ == "TensorDescriptor"
-            ):
-                # Create a hashable representation of TensorDescriptor
-                hashable_arg = (
-                    "TensorDescriptor",
-                    tuple(arg.shape) if hasattr(arg, "shape") else None,
-                    tuple(arg.strides) if hasattr(arg, "strides") else None,
-                    tuple(arg.block_shape) if hasattr(arg, "block_shape") else None,
-                    arg.padding if hasattr(arg, "padding") else None,
-                    # Add other relevant attributes
-                )
-            if i in self.specialize_indices:
-                k_args[param_names[i]] = arg
-                spec_args.append(hashable_arg)
-            elif i in self.do_not_specialize_indices:
-                k_args[param_names[i]] = arg
-                dns_args.append(hashable_arg)
-            else:
-                if major_version == 3 and 3 <= minor_version <= 6:
-                    k_args[param_names[i]] = arg
-                const_args.append(hashable_arg)
-        for p in self.jit_function.params[len(args) :]:
-            if p.name in kwargs:
-                val = kwargs[p.name]
-            elif p.default is inspect._empty:
-                continue
-            else:
-                val = p.default
-
-            if p.is_constexpr:
-                const_args.append(val)
-                if major_version == 3 and 3 <= minor_version <= 6:
-                    k_args[p.name] = val
-            elif p.do_not_specialize:
-                dns_args.append(val)
-                k_args[p.name] = val
-            else:
-                spec_args.append(val)
-                k_args[p.name] = val
+        spec_args, dns_args, const_args, k_args = self.binder.bind(args, kwargs)
 
         if self._has_flagtune_tuner:
             flagtune_dtypes = _infer_tensor_dtypes(args)
@@ -1679,59 +1971,35 @@ class LibEntry(triton.KernelInterface):
             cache = self._cpu_cache
         else:
             cache = self.kernel_cache[device]
-        while entry_key not in cache:
+        entry = cache.get(entry_key)
+        if entry is not None:
+            self._cache_hits += 1
+            if self.max_cache_entries > 0:
+                try:
+                    cache.move_to_end(entry_key)
+                except KeyError:
+                    # evicted by another thread
+                    pass
+        else:
             # NOTE: we serialize the first run of a jit function regardless of which device to run on
             # because Triton runtime is currently not threadsafe.
             with self.lock:
-                if entry_key in cache:
-                    break
-                kernel = self.fn.run(*args, **kwargs)
-                fn = self.fn
-                # collect constexpr arguments for grid computation
-                constexprs = {}
-                tune_constexprs = {}
-                heur_constexprs = {}
-                launch_pre_hooks = []
-                while not isinstance(fn, triton.runtime.JITFunction):
-                    if isinstance(fn, triton.runtime.Autotuner):
-                        config = fn.best_config
-                        constexprs["num_warps"] = config.num_warps
-                        constexprs["num_stages"] = config.num_stages
-                        constexprs["num_ctas"] = config.num_ctas
-                        constexprs = {**constexprs, **config.kwargs}
-                        tune_constexprs = {**tune_constexprs, **config.kwargs}
-                        if config.pre_hook is not None:
-                            launch_pre_hooks.append(
-                                (config.pre_hook, config.all_kwargs())
-                            )
-                    elif isinstance(fn, triton.runtime.Heuristics):
-                        for v, heur in fn.values.items():
-                            heur_constexprs[v] = heur(
-                                {
-                                    **dict(zip(fn.arg_names, args)),
-                                    **kwargs,
-                                    **constexprs,
-                                }
-                            )
-                            constexprs[v] = heur_constexprs[v]
-                    else:
-                        raise RuntimeError("Invalid Runtime Function")
-                    fn = fn.fn
-                for p in self.jit_function.params:
-                    if (
-                        p.is_constexpr
-                        and p.name not in constexprs
-                        and (p.default is not inspect._empty)
-                    ):
-                        constexprs[p.name] = p.default
-                cache[entry_key] = (
-                    kernel,
-                    constexprs,
-                    tune_constexprs,
-                    heur_constexprs,
-                    tuple(launch_pre_hooks),
-                )
-            return kernel, constexprs
+                entry = cache.get(entry_key)
+                if entry is None:
+                    self._cache_misses += 1
+                    if self._persistent:
+                        entry = kernel_cache.load(self, device, entry_key)
+                    if entry is not None:
+                        cache[entry_key] = entry
+                        self._evict(cache)
+                if entry is None:
+                    kernel, constexprs = self._compile_and_cache(
+                        cache, entry_key, args, kwargs
+                    )
+                    if self._persistent:
+                        kernel_cache.store(self, device, entry_key, cache[entry_key])
+                    self._evict(cache)
+                    return kernel, constexprs
 
         (
             kernel,
@@ -1739,27 +2007,28 @@ class LibEntry(triton.KernelInterface):
             tune_constexprs,
             heur_constexprs,
             launch_pre_hooks,
-        ) = cache[entry_key]
+        ) = entry
 
+        if callable(grid) or launch_pre_hooks:
+            named_args = dict(zip(self.arg_names, args))
         if callable(grid):
             # collect all arguments to the grid fn，ie:
             # 1. args,
             # 2. kwargs,
             # 3. all all other captured arguments in CompiledKernel from Autotunner & Heuristics
             # when kwargs & captured args conflict, captured args have higher priority
-            meta = {**dict(zip(self.arg_names, args)), **kwargs, **constexprs}
-            grid = grid(meta)
+            grid = grid({**named_args, **kwargs, **constexprs})
         grid = grid + (1, 1)
 
         if launch_pre_hooks:
-            hook_nargs = {**dict(zip(self.arg_names, args)), **kwargs}
+            hook_nargs = {**named_args, **kwargs}
             for pre_hook, hook_kwargs in launch_pre_hooks:
                 pre_hook({**hook_nargs, **hook_kwargs})
 
-        if major_version == 3 and 3 <= minor_version <= 6:
+        if self.binder.bind_constexprs:
             all_args = []
             missing_keys = []
-            for key in list(self.signature.parameters.keys()):
+            for key in self.binder.param_names:
                 if key in k_args:
                     all_args.append(k_args[key])
                 elif key in tune_constexprs:
@@ -1770,15 +2039,100 @@ class LibEntry(triton.KernelInterface):
                     all_args.append(constexprs[key])
                 else:
                     missing_keys.append(key)
-                if len(missing_keys):
-                    raise RuntimeError(
-                        f"[libentry]: probably a bug, the following kernel params where not captured: {missing_keys}"
-                    )
+            if len(missing_keys):
+                raise RuntimeError(
+                    f"[libentry]: probably a bug, the following kernel params where not captured: {missing_keys}"
+                )
             kernel[grid[0:3]](*all_args)
         else:
             kernel[grid[0:3]](*k_args.values())
         return kernel, constexprs
 
+    def _evict(self, cache):
+        max_entries = self.max_cache_entries
+        while max_entries > 0 and len(cache) > max_entries:
+            cache.popitem(last=False)
+            self._cache_evictions += 1
+
+    def set_max_cache_entries(self, max_entries: int) -> None:
+        """Bound the dispatch cache of each device, evicting the oldest entries."""
+        with self.lock:
+            self.max_cache_entries = max_entries
+            for cache in (*self.kernel_cache, self._cpu_cache):
+                self._evict(cache)
+
+    def cache_info(self) -> LibEntryCacheInfo:
+        """Report the statistics of the dispatch caches of all the devices.
+
+        `specializations` maps the arguments taking several values in the cached
+        keys to their number of values; an argument with many values, e.g. a
+        sequence length, is a candidate for `do_not_specialize`.
+        """
+        keys = []
+        for cache in (*self.kernel_cache, self._cpu_cache):
+            # a single call, not interleaved with the launches of other threads
+            keys.extend(list(cache))
+        values = {}
+        for key in keys:
+            for name, value in zip(self._key_names, key):
+                values.setdefault(name, set()).add(value)
+        return LibEntryCacheInfo(
+            self.jit_function.__name__,
+            self._cache_hits,
+            self._cache_misses,
+            self._cache_evictions,
+            len(keys),
+            self.max_cache_entries,
+            {name: len(v) for name, v in values.items() if len(v) > 1},
+        )
+
+    def _compile_and_cache(self, cache, entry_key, args, kwargs):
+        kernel = self.fn.run(*args, **kwargs)
+        fn = self.fn
+        # collect constexpr arguments for grid computation
+        constexprs = {}
+        tune_constexprs = {}
+        heur_constexprs = {}
+        launch_pre_hooks = []
+        while not isinstance(fn, triton.runtime.JITFunction):
+            if isinstance(fn, triton.runtime.Autotuner):
+                config = fn.best_config
+                constexprs["num_warps"] = config.num_warps
+                constexprs["num_stages"] = config.num_stages
+                constexprs["num_ctas"] = config.num_ctas
+                constexprs = {**constexprs, **config.kwargs}
+                tune_constexprs = {**tune_constexprs, **config.kwargs}
+                if config.pre_hook is not None:
+                    launch_pre_hooks.append((config.pre_hook, config.all_kwargs()))
+            elif isinstance(fn, triton.runtime.Heuristics):
+                for v, heur in fn.values.items():
+                    heur_constexprs[v] = heur(
+                        {
+                            **dict(zip(fn.arg_names, args)),
+                            **kwargs,
+                            **constexprs,
+                        }
+                    )
+                    constexprs[v] = heur_constexprs[v]
+            else:
+                raise RuntimeError("Invalid Runtime Function")
+            fn = fn.fn
+        for p in self.jit_function.params:
+            if (
+                p.is_constexpr
+                and p.name not in constexprs
+                and (p.default is not inspect._empty)
+            ):
+                constexprs[p.name] = p.default
+        cache[entry_key] = (
+            kernel,
+            constexprs,
+            tune_constexprs,
+            heur_constexprs,
+            tuple(launch_pre_hooks),
+        )
+        return kernel, constexprs
+
 
 def find_flagtune_benchmark_target(
     public_operator: Callable[..., Any], op_id: str, variant: str
@@ -1853,6 +2207,25 @@ def clear_libentry_dispatch_cache(entry: "LibEntry") -> None:
     entry._cpu_cache.clear()
 
 
+def libentry_cache_info() -> List[LibEntryCacheInfo]:
+    """Report the dispatch caches of all the LibEntries holding entries.
+
+    The entries are sorted by decreasing number of cached kernels, so that
+    kernels compiled for many specializations come first.
+    """
+    infos = [entry.cache_info() for entry in list(_LIBENTRIES)]
+    infos = [info for info in infos if info.entries or info.misses]
+    return sorted(infos, key=lambda info: info.entries, reverse=True)
+
+
+def set_libentry_cache_size(max_entries: int) -> None:
+    """Bound the dispatch caches of all the LibEntries, 0 for no bound."""
+    global FLAGGEMS_LIBENTRY_CACHE_SIZE
+    FLAGGEMS_LIBENTRY_CACHE_SIZE = max_entries
+    for entry in list(_LIBENTRIES):
+        entry.set_max_cache_entries(max_entries)
+
+
 def libentry():
     """Decorator for triton library entries."""
 
@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .buffered import WriteBehindPersistantModel
 from .model import PersistantModel
 from .sql import SQLPersistantModel
 
-__all__ = ["PersistantModel", "SQLPersistantModel"]
+__all__ = ["PersistantModel", "SQLPersistantModel", "WriteBehindPersistantModel"]
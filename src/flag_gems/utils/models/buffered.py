@@ -0,0 +1,168 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+from contextlib import contextmanager
+from typing import Any, Dict, Final, Iterator, Optional, Sequence, Tuple, Union
+
+import triton
+from typing_extensions import override
+
+from .model import PersistantModel
+
+
+class WriteBehindPersistantModel(PersistantModel):
+    """Defer the writes of another `PersistantModel` and flush them in batches.
+
+    Outside of a `batch()` scope every `put_*` call is forwarded immediately, so
+    the persistence guarantees of the wrapped model are unchanged. Inside the
+    scope, writes are queued and committed through `put_many` when the
+    outermost scope exits, which turns an autotuning sweep over many configs
+    into a single transaction. Reads observe queued writes.
+    """
+
+    def __init__(self, model: PersistantModel, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.model: Final[PersistantModel] = model
+        self.depth: int = 0
+        self.pending_configs: Dict[
+            Tuple[str, Tuple[Any, ...]],
+            Union[triton.Config, Dict[str, Union[bool, int, float, str]]],
+        ] = {}
+        self.pending_benchmarks: Dict[
+            Tuple[str, Tuple[Any, ...], Tuple[Any, ...]],
+            Tuple[
+                Union[triton.Config, Dict[str, Union[bool, int, float, str]]],
+                Tuple[float, float, float],
+            ],
+        ] = {}
+        atexit.register(self.flush)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        with self.lock:
+            self.depth += 1
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.depth -= 1
+                outermost = self.depth == 0
+            if outermost:
+                self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            configs = [
+                (name, keys, config)
+                for (name, keys), config in self.pending_configs.items()
+            ]
+            benchmarks = [
+                (name, keys, config, benchmark)
+                for (name, keys, _), (
+                    config,
+                    benchmark,
+                ) in self.pending_benchmarks.items()
+            ]
+            self.pending_configs.clear()
+            self.pending_benchmarks.clear()
+        if configs or benchmarks:
+            self.model.put_many(configs, benchmarks)
+
+    @override
+    def get_config(
+        self, name: str, keys: Sequence[Union[bool, int, float, str]]
+    ) -> Optional[triton.Config]:
+        pending = self.pending_configs.get((name, tuple(keys)))
+        if pending is None:
+            return self.model.get_config(name, keys)
+        if isinstance(pending, triton.Config):
+            return pending
+        return PersistantModel.build_config(pending)
+
+    @override
+    def load_configs(
+        self, names: Sequence[str]
+    ) -> Dict[str, Dict[Tuple[Union[bool, int, float, str], ...], triton.Config]]:
+        loaded = self.model.load_configs(names)
+        with self.lock:
+            for (name, keys), config in self.pending_configs.items():
+                if name in loaded:
+                    loaded[name].setdefault(
+                        keys,
+                        (
+                            config
+                            if isinstance(config, triton.Config)
+                            else PersistantModel.build_config(config)
+                        ),
+                    )
+        return loaded
+
+    @override
+    def get_benchmark(
+        self,
+        name: str,
+        keys: Sequence[Union[bool, int, float, str]],
+        config: triton.Config,
+    ) -> Optional[Tuple[float, float, float]]:
+        pending = self.pending_benchmarks.get(
+            (name, tuple(keys), PersistantModel.config_key(config))
+        )
+        if pending is not None:
+            return pending[1]
+        return self.model.get_benchmark(name, keys, config)
+
+    @override
+    def put_config(
+        self,
+        name: str,
+        keys: Sequence[Union[bool, int, float, str]],
+        config: Union[triton.Config, Dict[str, Union[bool, int, float, str]]],
+    ) -> None:
+        with self.lock:
+            if self.depth > 0:
+                self.pending_configs.setdefault((name, tuple(keys)), config)
+                return
+        self.model.put_config(name, keys, config)
+
+    @override
+    def put_benchmark(
+        self,
+        name: str,
+        keys: Sequence[Union[bool, int, float, str]],
+        config: Union[triton.Config, Dict[str, Union[bool, int, float, str]]],
+        benchmark: Tuple[float, float, float],
+    ) -> None:
+        with self.lock:
+            if self.depth > 0:
+                self.pending_benchmarks.setdefault(
+                    (name, tuple(keys), PersistantModel.config_key(config)),
+                    (config, benchmark),
+                )
+                return
+        self.model.put_benchmark(name, keys, config, benchmark)
+
+    @override
+    def put_many(self, configs=(), benchmarks=()) -> None:
+        with self.lock:
+            if self.depth > 0:
+                for name, keys, config in configs:
+                    self.pending_configs.setdefault((name, tuple(keys)), config)
+                for name, keys, config, benchmark in benchmarks:
+                    self.pending_benchmarks.setdefault(
+                        (name, tuple(keys), PersistantModel.config_key(config)),
+                        (config, benchmark),
+                    )
+                return
+        self.model.put_many(configs, benchmarks)
@@ -35,11 +35,42 @@ class PersistantModel(object):
             if isinstance(v, (int, float, str))
         }
 
+    @staticmethod
+    def build_config(values: Dict[str, Union[bool, int, float, str]]) -> triton.Config:
+        kwargs: Dict[str, Union[bool, int, float, str]] = {
+            k: v
+            for k, v in values.items()
+            if k not in PersistantModel.signature.parameters
+        }
+        config_dict: Dict[str, int] = {
+            k: v for k, v in values.items() if k in PersistantModel.signature.parameters
+        }
+        return triton.Config(kwargs, **config_dict)
+
+    @staticmethod
+    def config_key(
+        config: Union[triton.Config, Dict[str, Union[bool, int, float, str]]],
+    ) -> Tuple[Tuple[str, Union[int, float, str]], ...]:
+        if isinstance(config, triton.Config):
+            config = PersistantModel.parse_config(config)
+        return tuple(sorted(config.items()))
+
     @abstractmethod
     def get_config(
         self, name: str, key: Sequence[Union[bool, int, float, str]]
     ) -> Optional[triton.Config]: ...
 
+    def load_configs(
+        self, names: Sequence[str]
+    ) -> Dict[str, Dict[Tuple[Union[bool, int, float, str], ...], triton.Config]]:
+        """Load every stored config of the given tables at once.
+
+        Returns a mapping from each completely loaded table name to its rows.
+        Tables the model cannot enumerate are left out, lookups for them keep
+        going through `get_config`.
+        """
+        return {}
+
     @abstractmethod
     def get_benchmark(
         self,
@@ -98,3 +129,32 @@ class PersistantModel(object):
         config: Union[triton.Config, Dict[str, Union[bool, int, float, str]]],
         benchmark: Tuple[float, float, float],
     ) -> None: ...
+
+    def put_many(
+        self,
+        configs: Sequence[
+            Tuple[
+                str,
+                Sequence[Union[bool, int, float, str]],
+                Union[triton.Config, Dict[str, Union[bool, int, float, str]]],
+            ]
+        ] = (),
+        benchmarks: Sequence[
+            Tuple[
+                str,
+                Sequence[Union[bool, int, float, str]],
+                Union[triton.Config, Dict[str, Union[bool, int, float, str]]],
+                Tuple[float, float, float],
+            ]
+        ] = (),
+    ) -> None:
+        """Persist several configs and benchmarks at once.
+
+        Each item of `configs` holds the arguments of `put_config` and each item
+        of `benchmarks` the arguments of `put_benchmark`. Subclasses should
+        override this to write all rows in one transaction.
+        """
+        for item in configs:
+            self.put_config(*item)
+        for item in benchmarks:
+            self.put_benchmark(*item)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import os
+import re
 from hashlib import md5
 from itertools import chain
 from typing import (
@@ -29,6 +30,7 @@ from typing import (
 )
 
 import sqlalchemy
+import sqlalchemy.exc
 import sqlalchemy.ext.automap
 import sqlalchemy.orm
 import triton
@@ -271,13 +273,46 @@ class SQLPersistantModel(PersistantModel):
                     for k in sqlalchemy.inspect(obj).mapper.columns
                     if k.key not in key_dict
                 }
-            kwargs: Dict[str, Union[bool, int, float, str]] = {
-                k: v for k, v in obj_dict.items() if k not in self.signature.parameters
-            }
-            config_dict: Dict[str, int] = {
-                k: v for k, v in obj_dict.items() if k in self.signature.parameters
-            }
-            return triton.Config(kwargs, **config_dict)
+            return PersistantModel.build_config(obj_dict)
+
+    @override
+    def load_configs(
+        self, names: Sequence[str]
+    ) -> Dict[str, Dict[Tuple[Union[bool, int, float, str], ...], triton.Config]]:
+        # Table names are only recoverable when they are not shortened, which
+        # is the case for every backend but postgresql.
+        if "postgresql" in str(self.engine.url):
+            return {}
+        loaded: Dict[
+            str, Dict[Tuple[Union[bool, int, float, str], ...], triton.Config]
+        ] = {name: {} for name in names}
+        incomplete = set()
+        metadata = sqlalchemy.MetaData()
+        with self.engine.connect() as conn:
+            for table_name in sqlalchemy.inspect(conn).get_table_names():
+                name, sep, _ = table_name.rpartition("-")
+                if not sep or name not in loaded:
+                    continue
+                table = sqlalchemy.Table(table_name, metadata, autoload_with=conn)
+                if "key_hash" in table.columns:
+                    # blob mode keys are not reversible
+                    incomplete.add(name)
+                    continue
+                key_columns = sorted(
+                    (c.name for c in table.columns if re.fullmatch(r"key_\d+", c.name)),
+                    key=lambda column: int(column[len("key_") :]),
+                )
+                rows = loaded[name]
+                for row in conn.execute(sqlalchemy.select(table)):
+                    values = row._mapping
+                    key = tuple(values[c] for c in key_columns)
+                    rows.setdefault(
+                        key,
+                        PersistantModel.build_config(
+                            {k: v for k, v in values.items() if k not in key_columns}
+                        ),
+                    )
+        return {name: rows for name, rows in loaded.items() if name not in incomplete}
 
     @override
     def get_benchmark(
@@ -310,12 +345,12 @@ class SQLPersistantModel(PersistantModel):
             p80: float = obj.p80
             return (p50, p20, p80)
 
-    def put_config(
+    def _config_row(
         self,
         name: str,
         keys: Sequence[Union[bool, int, float, str]],
         config: Union[triton.Config, Dict[str, Union[bool, int, float, str]]],
-    ) -> None:
+    ) -> Tuple[Optional[Type[Base]], Dict[str, Union[int, float, str]], Dict[str, Any]]:
         use_blob_mode = len(keys) > self.key_count_limit
         if isinstance(config, triton.Config):
             config: Dict[str, Union[int, float, str]] = (
@@ -329,21 +364,15 @@ class SQLPersistantModel(PersistantModel):
             {k: type(v) for k, v in key_dict.items()},
             {k: type(v) for k, v in config.items()},
         )
-        if ConfigCls is not None:
-            with RollbackSession(self.engine) as session:
-                existing: Optional[Base] = session.get(ConfigCls, key_dict)
-                if existing is not None:
-                    return
-                session.add(ConfigCls(**key_dict, **config))
-                session.commit()
+        return ConfigCls, key_dict, config
 
-    def put_benchmark(
+    def _benchmark_row(
         self,
         name: str,
         keys: Sequence[Union[bool, int, float, str]],
         config: Union[triton.Config, Dict[str, Union[bool, int, float, str]]],
         benchmark: Tuple[float, float, float],
-    ) -> None:
+    ) -> Tuple[Optional[Type[Base]], Dict[str, Union[int, float, str]], Dict[str, Any]]:
         if isinstance(config, triton.Config):
             config: Dict[str, Union[int, float, str]] = (
                 SQLPersistantModel.get_config_dict(config)
@@ -359,13 +388,101 @@ class SQLPersistantModel(PersistantModel):
             key_dict | config,
             benchmark,
         )
+        return BenchmarkCls, key_dict | config, benchmark
+
+    @staticmethod
+    def _add_row(
+        session: sqlalchemy.orm.Session,
+        ModelCls: Optional[Type[Base]],
+        key_dict: Dict[str, Union[int, float, str]],
+        values: Dict[str, Any],
+    ) -> bool:
+        if ModelCls is None:
+            return False
+        existing: Optional[Base] = session.get(ModelCls, key_dict)
+        if existing is not None:
+            return False
+        session.add(ModelCls(**key_dict, **values))
+        return True
+
+    def put_config(
+        self,
+        name: str,
+        keys: Sequence[Union[bool, int, float, str]],
+        config: Union[triton.Config, Dict[str, Union[bool, int, float, str]]],
+    ) -> None:
+        ConfigCls, key_dict, config = self._config_row(name, keys, config)
+        if ConfigCls is not None:
+            with RollbackSession(self.engine) as session:
+                if SQLPersistantModel._add_row(session, ConfigCls, key_dict, config):
+                    session.commit()
+
+    def put_benchmark(
+        self,
+        name: str,
+        keys: Sequence[Union[bool, int, float, str]],
+        config: Union[triton.Config, Dict[str, Union[bool, int, float, str]]],
+        benchmark: Tuple[float, float, float],
+    ) -> None:
+        BenchmarkCls, key_dict, benchmark = self._benchmark_row(
+            name, keys, config, benchmark
+        )
         if BenchmarkCls is not None:
             with RollbackSession(self.engine) as session:
-                benchmark_key_dict: Dict[str, Union[bool, int, float, str]] = (
-                    key_dict | config
+                if SQLPersistantModel._add_row(
+                    session, BenchmarkCls, key_dict, benchmark
+                ):
+                    session.commit()
+
+    @override
+    def put_many(
+        self,
+        configs: Sequence[
+            Tuple[
+                str,
+                Sequence[Union[bool, int, float, str]],
+                Union[triton.Config, Dict[str, Union[bool, int, float, str]]],
+            ]
+        ] = (),
+        benchmarks: Sequence[
+            Tuple[
+                str,
+                Sequence[Union[bool, int, float, str]],
+                Union[triton.Config, Dict[str, Union[bool, int, float, str]]],
+                Tuple[float, float, float],
+            ]
+        ] = (),
+    ) -> None:
+        rows = [self._config_row(*item) for item in configs] + [
+            self._benchmark_row(*item) for item in benchmarks
+        ]
+        # Deduplicate rows sharing one primary key, the first write wins as it
+        # does for consecutive `put_*` calls.
+        unique_rows = {}
+        for ModelCls, key_dict, values in rows:
+            if ModelCls is None:
+                continue
+            identity = (ModelCls, tuple(sorted(key_dict.items())))
+            unique_rows.setdefault(identity, (ModelCls, key_dict, values))
+        if not unique_rows:
+            return
+        with sqlalchemy.orm.Session(self.engine) as session:
+            added = False
+            for ModelCls, key_dict, values in unique_rows.values():
+                added = (
+                    SQLPersistantModel._add_row(session, ModelCls, key_dict, values)
+                    or added
                 )
-                existing: Optional[Base] = session.get(BenchmarkCls, benchmark_key_dict)
-                if existing is not None:
-                    return
-                session.add(BenchmarkCls(**benchmark_key_dict, **benchmark))
+            if not added:
+                return
+            try:
                 session.commit()
+                return
+            except sqlalchemy.exc.IntegrityError:
+                session.rollback()
+        # Another process committed some of these rows concurrently, fall back
+        # to row-by-row writes so that the remaining rows are still persisted.
+        with RollbackSession(self.engine) as session:
+            for ModelCls, key_dict, values in unique_rows.values():
+                if SQLPersistantModel._add_row(session, ModelCls, key_dict, values):
+                    session.commit()
@@ -0,0 +1,387 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pointwise ops & norms over lists of tensors with a few launches.
+
+The tensors of the lists are split in chunks of `MTA_CHUNK_SIZE` elements,
+each of them processed by one program. A table uploaded to the device holds
+the data pointers of the tensors of each list, their numbers of elements and,
+for each program, its tensor & chunk. The tensors are grouped by dtype & each
+group takes one launch, so the number of launches does not depend on the
+number of tensors.
+
+The op applied to the elements is selected by the `OP` constexpr of
+`_apply_op`; add a branch there for a new one. Elements are computed in
+float32.
+"""
+
+import torch
+import triton
+import triton.language as tl
+
+from flag_gems.runtime import torch_device_fn
+from flag_gems.utils import tl_extra_shim
+from flag_gems.utils import triton_lang_extension as tle
+from flag_gems.utils.libentry import libentry
+from flag_gems.utils.table_utils import upload_table
+from flag_gems.utils.workspace import workspace
+
+# elements processed by a program
+MTA_CHUNK_SIZE = 65536
+MTA_BLOCK_SIZE = 1024
+MTA_DTYPES = (torch.float16, torch.bfloat16, torch.float32)
+# name -> number of tensor inputs of the pointwise ops of `_apply_op`
+MTA_OPS = {
+    "add": 2,
+    "sub": 2,
+    "mul": 2,
+    "div": 2,
+    "add_scalar": 1,
+    "sub_scalar": 1,
+    "mul_scalar": 1,
+    "div_scalar": 1,
+    "lerp": 2,
+    "addcmul": 3,
+    "addcdiv": 3,
+    "sqrt": 1,
+    "neg": 1,
+    "reciprocal": 1,
+    "exp": 1,
+    "zero": 1,
+    # x * scalar where x is finite, also sets `found_inf` on non-finite results
+    "unscale": 1,
+}
+MTA_NORMS = (1, 2, float("inf"))
+
+
+@triton.jit
+def _apply_op(x, y, z, scalar, OP: tl.constexpr):
+    if OP == "add":
+        return x + scalar * y
+    elif OP == "sub":
+        return x - scalar * y
+    elif OP == "mul":
+        return x * y
+    elif OP == "div":
+        return x / y
+    elif OP == "add_scalar":
+        return x + scalar
+    elif OP == "sub_scalar":
+        return x - scalar
+    elif OP == "mul_scalar":
+        return x * scalar
+    elif OP == "div_scalar":
+        return x / scalar
+    elif OP == "lerp":
+        return x + scalar * (y - x)
+    elif OP == "addcmul":
+        return x + scalar * y * z
+    elif OP == "addcdiv":
+        return x + scalar * y / z
+    elif OP == "sqrt":
+        return tl.sqrt(x)
+    elif OP == "neg":
+        return -x
+    elif OP == "reciprocal":
+        return 1.0 / x
+    elif OP == "exp":
+        return tl.exp(x)
+    elif OP == "unscale":
+        return tl.where(tl_extra_shim.finitef(x), x * scalar, x)
+    else:
+        return tl.zeros_like(x)
+
+
+@libentry()
+@triton.jit
+def multi_tensor_apply_kernel(
+    out_ref,
+    x_ref,
+    y_ref,
+    z_ref,
+    addrs,
+    numels,
+    prog_tensor,
+    prog_chunk,
+    num_tensors,
+    scalar_ptr,
+    scalar,
+    found_inf,
+    OP: tl.constexpr,
+    NUM_INPUTS: tl.constexpr,
+    SCALAR_TENSOR: tl.constexpr,
+    CHUNK_SIZE: tl.constexpr,
+    BLOCK_SIZE: tl.constexpr,
+):
+    # addrs holds the data pointers of the out, x, y & z lists in this order,
+    # num_tensors of each; the *_ref tensors only carry the dtype of the lists
+    pid = tle.program_id(0)
+    t = tl.load(prog_tensor + pid)
+    start = tl.load(prog_chunk + pid) * CHUNK_SIZE
+    end = tl.minimum(start + CHUNK_SIZE, tl.load(numels + t))
+    out_ptr = tl.load(addrs + t).to(tl.pointer_type(out_ref.dtype.element_ty))
+    x_ptr = tl.load(addrs + num_tensors + t).to(tl.pointer_type(x_ref.dtype.element_ty))
+    if NUM_INPUTS > 1:
+        y_ptr = tl.load(addrs + 2 * num_tensors + t).to(
+            tl.pointer_type(y_ref.dtype.element_ty)
+        )
+    if NUM_INPUTS > 2:
+        z_ptr = tl.load(addrs + 3 * num_tensors + t).to(
+            tl.pointer_type(z_ref.dtype.element_ty)
+        )
+    if SCALAR_TENSOR:
+        s = tl.load(scalar_ptr).to(tl.float32)
+    else:
+        s = scalar.to(tl.float32)
+
+    for block_start in range(start, end, BLOCK_SIZE):
+        offset = block_start + tl.arange(0, BLOCK_SIZE)
+        mask = offset < end
+        x = tl.load(x_ptr + offset, mask=mask, other=1).to(tl.float32)
+        y = x
+        z = x
+        if NUM_INPUTS > 1:
+            y = tl.load(y_ptr + offset, mask=mask, other=1).to(tl.float32)
+        if NUM_INPUTS > 2:
+            z = tl.load(z_ptr + offset, mask=mask, other=1).to(tl.float32)
+        result = _apply_op(x, y, z, s, OP).to(out_ref.dtype.element_ty)
+        if OP == "unscale":
+            non_finite = mask & ~tl_extra_shim.finitef(result.to(tl.float32))
+            if tl.sum(non_finite.to(tl.int32)) > 0:
+                tl.store(found_inf, 1.0)
+        tl.store(out_ptr + offset, result, mask=mask)
+
+
+@libentry()
+@triton.jit
+def multi_tensor_norm_kernel_1(
+    x_ref,
+    addrs,
+    numels,
+    prog_tensor,
+    prog_chunk,
+    mid,
+    ORD: tl.constexpr,
+    CHUNK_SIZE: tl.constexpr,
+    BLOCK_SIZE: tl.constexpr,
+):
+    pid = tle.program_id(0)
+    t = tl.load(prog_tensor + pid)
+    start = tl.load(prog_chunk + pid) * CHUNK_SIZE
+    end = tl.minimum(start + CHUNK_SIZE, tl.load(numels + t))
+    x_ptr = tl.load(addrs + t).to(tl.pointer_type(x_ref.dtype.element_ty))
+
+    acc = tl.zeros([BLOCK_SIZE], dtype=tl.float32)
+    for block_start in range(start, end, BLOCK_SIZE):
+        offset = block_start + tl.arange(0, BLOCK_SIZE)
+        x = tl.load(x_ptr + offset, mask=offset < end, other=0).to(tl.float32)
+        if ORD == 1:
+            acc += tl.abs(x)
+        elif ORD == 2:
+            acc += x * x
+        else:
+            acc = tl.maximum(acc, tl.abs(x))
+    if ORD == 1 or ORD == 2:
+        partial = tl.sum(acc)
+    else:
+        partial = tl.max(acc)
+    tl.store(mid + pid, partial)
+
+
+@libentry()
+@triton.jit
+def multi_tensor_norm_kernel_2(
+    mid,
+    first_prog,
+    out,
+    ORD: tl.constexpr,
+    BLOCK_SIZE: tl.constexpr,
+):
+    # the partial results of the programs of a tensor are contiguous
+    t = tle.program_id(0)
+    start = tl.load(first_prog + t)
+    end = tl.load(first_prog + t + 1)
+    acc = tl.zeros([BLOCK_SIZE], dtype=tl.float32)
+    for block_start in range(start, end, BLOCK_SIZE):
+        offset = block_start + tl.arange(0, BLOCK_SIZE)
+        partial = tl.load(mid + offset, mask=offset < end, other=0)
+        if ORD == 1 or ORD == 2:
+            acc += partial
+        else:
+            acc = tl.maximum(acc, partial)
+    if ORD == 1:
+        result = tl.sum(acc)
+    elif ORD == 2:
+        result = tl.sqrt(tl.sum(acc))
+    else:
+        result = tl.max(acc)
+    tl.store(out + t, result.to(out.dtype.element_ty))
+
+
+def can_use_multi_tensor_apply(*tensor_lists):
+    """Whether `multi_tensor_apply` supports the lists, which must be of the
+    same length, with tensors of the same shape, dtype & device at each index.
+    """
+    first = tensor_lists[0]
+    if len(first) == 0:
+        return False
+    device = first[0].device
+    for tensors in tensor_lists:
+        if len(tensors) != len(first):
+            return False
+        for tensor, ref in zip(tensors, first):
+            if (
+                not isinstance(tensor, torch.Tensor)
+                or tensor.dtype not in MTA_DTYPES
+                or tensor.dtype != ref.dtype
+                or tensor.device != device
+                or tensor.shape != ref.shape
+            ):
+                return False
+    return True
+
+
+def _group_by_dtype(tensors):
+    groups = {}
+    for i, tensor in enumerate(tensors):
+        groups.setdefault(tensor.dtype, []).append(i)
+    return groups.values()
+
+
+def _upload_table(tensor_lists, indices, device):
+    """Upload the pointers & sizes of the tensors at `indices` of the lists.
+
+    Returns the views of the table passed to the kernels & the first program
+    of each tensor, followed by the number of programs.
+    """
+    addrs = [
+        tensor_lists[j][i].data_ptr() for j in range(len(tensor_lists)) for i in indices
+    ]
+    numels = []
+    prog_tensor = []
+    prog_chunk = []
+    first_prog = []
+    for t, i in enumerate(indices):
+        numel = tensor_lists[0][i].numel()
+        num_chunks = triton.cdiv(numel, MTA_CHUNK_SIZE)
+        numels.append(numel)
+        first_prog.append(len(prog_tensor))
+        prog_tensor.extend([t] * num_chunks)
+        prog_chunk.extend(range(num_chunks))
+    first_prog.append(len(prog_tensor))
+
+    sizes = (len(addrs), len(numels), len(prog_tensor), len(prog_chunk))
+    table = upload_table(addrs + numels + prog_tensor + prog_chunk + first_prog, device)
+    views = []
+    offset = 0
+    for size in sizes:
+        views.append(table[offset : offset + size])
+        offset += size
+    return views, table[offset:], len(prog_tensor)
+
+
+def multi_tensor_apply(op, out, *inputs, scalar=1.0, found_inf=None):
+    """Apply the pointwise `op` of `MTA_OPS` to the tensors of `inputs`.
+
+    The results are written to the tensors of `out`, which may be the first
+    input for in-place ops. `scalar` is a number or a tensor of one element
+    and `found_inf` the float32 flag of the "unscale" op. The lists must
+    satisfy `can_use_multi_tensor_apply`.
+    """
+    assert len(inputs) == MTA_OPS[op], f"{op} takes {MTA_OPS[op]} inputs"
+    # non-contiguous outputs are computed in a row-major buffer, like the
+    # contiguous inputs, & copied back
+    results = [
+        (
+            t
+            if t.is_contiguous()
+            else torch.empty_like(t, memory_format=torch.contiguous_format)
+        )
+        for t in out
+    ]
+    inputs = [[t.contiguous() for t in tensors] for tensors in inputs]
+    tensor_lists = [results, *inputs]
+    scalar_tensor = isinstance(scalar, torch.Tensor)
+    device = out[0].device
+
+    with torch_device_fn.device(device):
+        for indices in _group_by_dtype(out):
+            (addrs, numels, prog_tensor, prog_chunk), _, num_programs = _upload_table(
+                tensor_lists, indices, device
+            )
+            if num_programs == 0:
+                continue
+            refs = [tensors[indices[0]] for tensors in tensor_lists]
+            refs += [refs[1]] * (4 - len(refs))
+            multi_tensor_apply_kernel[(num_programs,)](
+                *refs,
+                addrs,
+                numels,
+                prog_tensor,
+                prog_chunk,
+                len(indices),
+                scalar if scalar_tensor else addrs,
+                0.0 if scalar_tensor else float(scalar),
+                addrs if found_inf is None else found_inf,
+                OP=op,
+                NUM_INPUTS=len(inputs),
+                SCALAR_TENSOR=scalar_tensor,
+                CHUNK_SIZE=MTA_CHUNK_SIZE,
+                BLOCK_SIZE=MTA_BLOCK_SIZE,
+            )
+
+    for tensor, result in zip(out, results):
+        if tensor is not result:
+            tensor.copy_(result)
+    return out
+
+
+def multi_tensor_norm(tensors, ord=2):
+    """Return the `ord` norms of the tensors as a list of 0-dim tensors."""
+    assert ord in MTA_NORMS, f"unsupported norm order {ord}"
+    ord = 3 if ord == float("inf") else int(ord)
+    tensors = [t.contiguous() for t in tensors]
+    device = tensors[0].device
+    results = [None] * len(tensors)
+
+    with torch_device_fn.device(device):
+        for indices in _group_by_dtype(tensors):
+            (addrs, numels, prog_tensor, prog_chunk), first_prog, num_programs = (
+                _upload_table([tensors], indices, device)
+            )
+            out = torch.empty(
+                (len(indices),), dtype=tensors[indices[0]].dtype, device=device
+            )
+            if num_programs > 0:
+                with workspace(device) as ws:
+                    mid = ws.empty((num_programs,), torch.float32)
+                    multi_tensor_norm_kernel_1[(num_programs,)](
+                        tensors[indices[0]],
+                        addrs,
+                        numels,
+                        prog_tensor,
+                        prog_chunk,
+                        mid,
+                        ORD=ord,
+                        CHUNK_SIZE=MTA_CHUNK_SIZE,
+                        BLOCK_SIZE=MTA_BLOCK_SIZE,
+                    )
+                    multi_tensor_norm_kernel_2[(len(indices),)](
+                        mid, first_prog, out, ORD=ord, BLOCK_SIZE=MTA_BLOCK_SIZE
+                    )
+            else:
+                out.zero_()
+            for i, norm in zip(indices, out.unbind()):
+                results[i] = norm
+    return results
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import dataclasses
 import importlib
 import os
+import weakref
+from collections import OrderedDict, namedtuple
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Callable, Iterable, List, Mapping, Optional, Sequence, Tuple
@@ -28,6 +31,8 @@ from flag_gems.utils.codegen_config_utils import CodeGenConfig, get_codegen_conf
 from flag_gems.utils.device_info import get_device_capability
 from flag_gems.utils.shape_utils import (
     MemOverlap,
+    Shape,
+    Stride,
     all_c_contiguous,
     all_the_same_shape,
     all_the_same_stride,
@@ -35,6 +40,7 @@ from flag_gems.utils.shape_utils import (
     broadcasted_stride,
     check_tensor_attributes,
     has_internal_overlapping,
+    simplify_task,
 )
 from flag_gems.utils.tensor_wrapper import StridedBuffer
 from flag_gems.utils.type_utils import ELEMENTWISE_TYPE_PROMOTION_KIND, type_promotion
@@ -1243,6 +1249,41 @@ class ComplexStrategy:
     fallback_target: object = None
 
 
+# capacity of the launch plan cache of each PointwiseDynamicFunction, 0 disables it
+FLAGGEMS_POINTWISE_PLAN_CACHE_SIZE = int(
+    os.getenv("FLAGGEMS_POINTWISE_PLAN_CACHE_SIZE", "256")
+)
+
+# all the live PointwiseDynamicFunctions, enumerated by flag_gems.warmup
+_POINTWISE_DYNAMIC_FUNCTIONS = weakref.WeakSet()
+
+PlanCacheInfo = namedtuple("PlanCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+@dataclass(frozen=True)
+class _LaunchPlan:
+    """Result of `prepare_args` that only depends on the metadata of operands."""
+
+    ndim: int
+    task_shape: Shape
+    # strides over task_shape of outputs (in the order of out_keys) & input tensors
+    strides: Tuple[Stride, ...]
+    # keys of the given outputs, followed by those of outputs to allocate
+    out_keys: Tuple[str, ...]
+    output_dtypes: Tuple[torch.dtype, ...]
+    # index of the tensor (given outputs & input tensors) allocated outputs follow,
+    # None to allocate contiguous outputs of allocate_shape
+    allocate_like: Optional[int]
+    allocate_shape: Shape
+
+
+def _operand_signature(item):
+    if isinstance(item, torch.Tensor):
+        return (item.shape, item.stride(), item.dtype)
+    # type promotion only depends on the type of scalars
+    return type(item)
+
+
 _REAL_TO_COMPLEX = {
     torch.float16: torch.complex32,
     torch.bfloat16: torch.complex32,
@@ -1276,6 +1317,17 @@ class PointwiseDynamicFunction:
         self.complex_strategy = ComplexStrategy()
         self._operand_indices = self._infer_operand_indices()
 
+        # cached launch plans of prepare_args
+        self._valid_out_keys = frozenset(
+            f"out{i}" for i in range(op_desc.num_output_tensors())
+        )
+        self._plan_cache: OrderedDict = OrderedDict()
+        self._plan_cache_size = FLAGGEMS_POINTWISE_PLAN_CACHE_SIZE
+        self._plan_cache_hits = 0
+        self._plan_cache_misses = 0
+
+        _POINTWISE_DYNAMIC_FUNCTIONS.add(self)
+
     # -------------------- operand index inference --------------------
 
     def _infer_operand_indices(self):
@@ -1497,20 +1549,85 @@ class PointwiseDynamicFunction:
     def prepare_args(self, *args, _skip_tensor_check=False, **kwargs):
         # output allocation(when needed)
         # task simplification & task-rank infernece & input-output reinterpretation
+        # The metadata-only part is cached as a launch plan keyed on the
+        # signature of the operands, so that a hit only allocates the outputs
+        # and wraps the operands.
         schema = self.fx
-        outputs_that_need_allocation: List[int] = []
-        out_tensors = []
-        for i in range(schema.num_output_tensors()):
-            k = f"out{i}"
-            if k in kwargs and kwargs[k] is not None:
-                out_tensors.append(kwargs[k])
-            else:
-                outputs_that_need_allocation.append(i)
 
         # Clean kwargs: only keep valid outN keys, discard mismatched keys
         # and None values that leaked through caller wrappers.
-        valid_out_keys = {f"out{i}" for i in range(schema.num_output_tensors())}
-        kwargs = {k: v for k, v in kwargs.items() if k in valid_out_keys}
+        valid_out_keys = self._valid_out_keys
+        kwargs = {
+            k: v for k, v in kwargs.items() if k in valid_out_keys and v is not None
+        }
+
+        key = (
+            _skip_tensor_check,
+            tuple(map(_operand_signature, args)),
+            tuple((k, _operand_signature(v)) for k, v in kwargs.items()),
+        )
+        plan = self._plan_cache.get(key)
+        if plan is None:
+            self._plan_cache_misses += 1
+            plan, allocated_outputs = self._make_plan(args, kwargs, _skip_tensor_check)
+            if self._plan_cache_size > 0:
+                self._plan_cache[key] = plan
+                if len(self._plan_cache) > self._plan_cache_size:
+                    try:
+                        self._plan_cache.popitem(last=False)
+                    except KeyError:
+                        # emptied by another thread
+                        pass
+        else:
+            self._plan_cache_hits += 1
+            try:
+                self._plan_cache.move_to_end(key)
+            except KeyError:
+                # evicted by another thread
+                pass
+            allocated_outputs = self._allocate_outputs(plan, args, kwargs)
+
+        outputs = list(kwargs.values()) + allocated_outputs
+        strides = iter(plan.strides)
+        kwargs = {
+            k: StridedBuffer(item, plan.task_shape, next(strides))
+            for k, item in zip(plan.out_keys, outputs)
+        }
+        args = tuple(
+            (
+                StridedBuffer(item, plan.task_shape, next(strides))
+                if schema.is_tensor(i)
+                else item
+            )
+            for i, item in enumerate(args)
+        )
+        return (plan.ndim, args, kwargs)
+
+    def _allocate_outputs(self, plan, args, kwargs):
+        if plan.allocate_like is None:
+            device = next(
+                item for i, item in enumerate(args) if self.fx.is_tensor(i)
+            ).device
+            return [
+                torch.empty(plan.allocate_shape, dtype=dtype, device=device)
+                for dtype in plan.output_dtypes
+            ]
+        tensors = list(kwargs.values()) + [
+            item for i, item in enumerate(args) if self.fx.is_tensor(i)
+        ]
+        like = tensors[plan.allocate_like]
+        return [torch.empty_like(like, dtype=dtype) for dtype in plan.output_dtypes]
+
+    def _make_plan(self, args, kwargs, _skip_tensor_check=False):
+        schema = self.fx
+        outputs_that_need_allocation: List[int] = [
+            i for i in range(schema.num_output_tensors()) if f"out{i}" not in kwargs
+        ]
+        out_tensors = list(kwargs.values())
+        out_keys = tuple(kwargs) + tuple(
+            f"out{i}" for i in outputs_that_need_allocation
+        )
+
         # input arguments must be passed by position
         if not _skip_tensor_check and schema._is_tensor is not None:
             if not check_tensor_attributes(args, (schema._is_tensor)):
@@ -1526,97 +1643,90 @@ class PointwiseDynamicFunction:
             promote_args = (args[j] for j in arg_indices)
             _, dtype = type_promotion(*promote_args, type_promotion=method)
             outputs_dtypes_for_allocation.append(dtype)
+        output_dtypes = tuple(outputs_dtypes_for_allocation)
 
         tensors = out_tensors + in_tensors
         INT32_MAX = torch.iinfo(torch.int32).max
         if tensors[0].numel() > INT32_MAX:
             self.config.prefer_block_pointer = False
         if self.use_fast_path(tensors):  # dimension collapse & use physical ordering
-            allocated_outputs = [
-                torch.empty_like(tensors[0], dtype=dtype)
-                for dtype in outputs_dtypes_for_allocation
-            ]
             task_shape = (tensors[0].numel(),)
-            strides = (1,)
-            ndim = 1
-            args = tuple(
-                (
-                    StridedBuffer(item, task_shape, strides)
-                    if schema.is_tensor(i)
-                    else item
-                )
-                for i, item in enumerate(args)
+            plan = _LaunchPlan(
+                ndim=1,
+                task_shape=task_shape,
+                strides=((1,),) * (len(out_keys) + len(in_tensors)),
+                out_keys=out_keys,
+                output_dtypes=output_dtypes,
+                allocate_like=0,
+                allocate_shape=tuple(tensors[0].shape),
             )
-            kwargs = {
-                k: StridedBuffer(item, task_shape, strides)
-                for k, item in kwargs.items()
-            }
-            for seq_id, output_id in enumerate(outputs_that_need_allocation):
-                kwargs[f"out{output_id}"] = StridedBuffer(
-                    allocated_outputs[seq_id], task_shape, strides
-                )
-        else:
-            # a simple strategy: all the undefined tensors will follow the first
-            # tensor that is not broadcated, no attempts to simplify task, no reordering,
-            # no dimenion collapsing
-            shapes = tuple(item.shape for item in in_tensors)
-
-            task_shape = broadcast_shapes(shapes)
-
-            if out_tensors:
-                for index, item in enumerate(out_tensors):
-                    if list(item.shape) != list(task_shape):
-                        raise RuntimeError(
-                            f"out tensor at index {index} shape is invalid, should be {task_shape} but is {item.shape}!"
-                        )
-                    # output arguments must not have internal overlapping for pointwise operation
-                    if has_internal_overlapping(item) == MemOverlap.Yes:
-                        raise RuntimeError(
-                            "Pointwise Input arguments should not have internal overlapping."
-                        )
+            return plan, self._allocate_outputs(plan, args, kwargs)
 
-            ndim = len(task_shape)
-            for item in tensors:
-                if item.shape == task_shape:
-                    allocated_outputs = [
-                        torch.empty_like(item, dtype=dtype)
-                        for dtype in outputs_dtypes_for_allocation
-                    ]
-                    break
-            else:  # nobreak
-                device = tensors[0].device
-                allocated_outputs = [
-                    torch.empty(task_shape, dtype=dtype, device=device)
-                    for dtype in outputs_dtypes_for_allocation
-                ]
-            args = tuple(
-                (
-                    StridedBuffer(
-                        item,
-                        task_shape,
-                        broadcasted_stride(item.shape, item.stride(), task_shape),
+        # all the undefined tensors will follow the first tensor that is not
+        # broadcasted, then the task is simplified: size-1 dimensions are
+        # dropped, dimensions are reordered into the physical order of the
+        # operands and dimensions contiguous in every operand are collapsed
+        shapes = tuple(item.shape for item in in_tensors)
+
+        task_shape = broadcast_shapes(shapes)
+
+        if out_tensors:
+            for index, item in enumerate(out_tensors):
+                if list(item.shape) != list(task_shape):
+                    raise RuntimeError(
+                        f"out tensor at index {index} shape is invalid, should be {task_shape} but is {item.shape}!"
                     )
-                    if schema.is_tensor(i)
-                    else item
-                )
-                for i, item in enumerate(args)
-            )
-            kwargs = {
-                k: StridedBuffer(
-                    item,
-                    task_shape,
-                    broadcasted_stride(item.shape, item.stride(), task_shape),
-                )
-                for k, item in kwargs.items()
-            }
-            for seq_id, output_id in enumerate(outputs_that_need_allocation):
-                item = allocated_outputs[seq_id]
-                kwargs[f"out{output_id}"] = StridedBuffer(
-                    item,
-                    task_shape,
-                    broadcasted_stride(item.shape, item.stride(), task_shape),
-                )
-        return (ndim, args, kwargs)
+                # output arguments must not have internal overlapping for pointwise operation
+                if has_internal_overlapping(item) == MemOverlap.Yes:
+                    raise RuntimeError(
+                        "Pointwise Input arguments should not have internal overlapping."
+                    )
+
+        for index, item in enumerate(tensors):
+            if item.shape == task_shape:
+                allocate_like = index
+                break
+        else:  # nobreak
+            allocate_like = None
+        plan = _LaunchPlan(
+            ndim=len(task_shape),
+            task_shape=tuple(task_shape),
+            strides=(),
+            out_keys=out_keys,
+            output_dtypes=output_dtypes,
+            allocate_like=allocate_like,
+            allocate_shape=tuple(task_shape),
+        )
+        allocated_outputs = self._allocate_outputs(plan, args, kwargs)
+
+        # outputs go first so that they decide the iteration order
+        operands = out_tensors + allocated_outputs + in_tensors
+        task_shape, strides = simplify_task(
+            task_shape,
+            [
+                broadcasted_stride(item.shape, item.stride(), task_shape)
+                for item in operands
+            ],
+        )
+        plan = dataclasses.replace(
+            plan, ndim=len(task_shape), task_shape=task_shape, strides=strides
+        )
+        return plan, allocated_outputs
+
+    def plan_cache_info(self) -> PlanCacheInfo:
+        """Report statistics of the launch plan cache of `prepare_args`."""
+        return PlanCacheInfo(
+            self._plan_cache_hits,
+            self._plan_cache_misses,
+            self._plan_cache_size,
+            len(self._plan_cache),
+        )
+
+    def clear_plan_cache(self):
+        """Clear the launch plan cache of `prepare_args` and its statistics."""
+        self._plan_cache.clear()
+        self._plan_cache_hits = 0
+        self._plan_cache_misses = 0
 
     def _unwrap(self, tensors):
         # unwrap StridedBuffer to get Tensor
@@ -1737,6 +1847,14 @@ class PointwiseDynamicFunction:
         return self._kernel_info_cache[key]
 
 
+def all_pointwise_dynamic_functions() -> List[PointwiseDynamicFunction]:
+    """Return all the live PointwiseDynamicFunctions, ordered by their qualified names."""
+    return sorted(
+        _POINTWISE_DYNAMIC_FUNCTIONS,
+        key=lambda fn: (fn._scalar_fn.__module__, fn._scalar_fn.__name__),
+    )
+
+
 def pointwise_dynamic(
     f: Optional[JITFunction] = None,
     *,
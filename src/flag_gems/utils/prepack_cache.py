@@ -0,0 +1,225 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cache of the transformed copies of weights, e.g. packed or cast layouts.
+
+Ops that rewrite a weight into the layout their kernel expects get it through
+`prepack`, which runs the transform once per weight::
+
+    packed = prepack(w, ("marlin_w_interleave", block_size_k), pack_fn)
+
+Entries are keyed by the storage of the weight, its offset, shape, strides &
+dtype, and by the tag naming the layout. An entry also records the version
+counter of the weight, so that in-place updates, e.g. loading new weights,
+repack it on the next call, and the tensor owning the storage, so that a
+new weight allocated at the address of a freed one is not served its layout.
+Entries are dropped when the tensor owning the storage is freed, or
+explicitly with `invalidate`.
+
+Entries live as long as their weights by default. A positive
+`FLAGGEMS_PREPACK_CACHE_MAX_BYTES` bounds the bytes of all the entries, least
+recently used ones being evicted first; a budget smaller than the packed
+weights used by each step, e.g. of all the layers of a model, repacks them on
+every step. 0, the default, means no bound & a negative budget disables the
+cache. Callers transforming tensors that are not long-lived weights, e.g.
+activations, also bound the entries of their tag, see `prepack`.
+"""
+
+import os
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
+
+import torch
+
+FLAGGEMS_PREPACK_CACHE_MAX_BYTES = int(
+    os.getenv("FLAGGEMS_PREPACK_CACHE_MAX_BYTES", "0")
+)
+
+PrepackCacheInfo = namedtuple(
+    "PrepackCacheInfo",
+    ["hits", "misses", "evictions", "invalidations", "entries", "bytes", "max_bytes"],
+)
+
+_lock = threading.RLock()
+_entries = OrderedDict()
+# {tag: [bytes, OrderedDict of the keys of its entries in LRU order]}
+_tags = {}
+_stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+_state = {"bytes": 0, "max_bytes": FLAGGEMS_PREPACK_CACHE_MAX_BYTES}
+
+
+class _Entry:
+    __slots__ = ("value", "version", "nbytes", "owner")
+
+    def __init__(self, value, version, nbytes, owner):
+        self.value = value
+        self.version = version
+        self.nbytes = nbytes
+        self.owner = owner
+
+
+def _nbytes(value):
+    if isinstance(value, torch.Tensor):
+        return value.numel() * value.element_size()
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(v) for v in value)
+    return 0
+
+
+def _storage_key(tensor):
+    return (tensor.device, tensor.untyped_storage().data_ptr())
+
+
+def _key(tensor, tag):
+    return (
+        *_storage_key(tensor),
+        tensor.storage_offset(),
+        tuple(tensor.shape),
+        tuple(tensor.stride()),
+        tensor.dtype,
+        tag,
+    )
+
+
+def _drop(key, counter=None):
+    entry = _entries.pop(key, None)
+    if entry is not None:
+        _state["bytes"] -= entry.nbytes
+        usage = _tags[key[-1]]
+        usage[0] -= entry.nbytes
+        del usage[1][key]
+        if counter is not None:
+            _stats[counter] += 1
+
+
+def _owner(tensor):
+    # views, e.g. weight.t(), are recreated on each call; follow their base,
+    # which owns the storage
+    return tensor if tensor._base is None else tensor._base
+
+
+def _make_owner_ref(tensor, key):
+    owner = _owner(tensor)
+
+    def on_free(_):
+        with _lock:
+            entry = _entries.get(key)
+            if entry is not None and entry.owner is ref:
+                _drop(key)
+
+    ref = weakref.ref(owner, on_free)
+    return ref
+
+
+def _evict(nbytes):
+    max_bytes = _state["max_bytes"]
+    if max_bytes == 0:
+        return
+    while _entries and _state["bytes"] + nbytes > max_bytes:
+        key = next(iter(_entries))
+        _drop(key, "evictions")
+
+
+def _evict_tag(tag, nbytes, max_bytes, max_entries):
+    usage = _tags.get(tag)
+    while usage is not None and usage[1]:
+        fits_bytes = max_bytes <= 0 or usage[0] + nbytes <= max_bytes
+        fits_entries = max_entries <= 0 or len(usage[1]) < max_entries
+        if fits_bytes and fits_entries:
+            break
+        _drop(next(iter(usage[1])), "evictions")
+
+
+def prepack(tensor, tag, pack_fn, *, tag_max_bytes=0, tag_max_entries=0):
+    """Return `pack_fn(tensor)`, reusing the result of a previous call.
+
+    `tag` is a hashable naming the layout produced by `pack_fn`, including the
+    parameters it depends on. The result is cached unless it does not fit in
+    the budget. `tag_max_bytes` & `tag_max_entries` also bound the entries of
+    `tag`, evicting its least recently used ones; 0 means no bound.
+    """
+    max_bytes = _state["max_bytes"]
+    if max_bytes < 0:
+        return pack_fn(tensor)
+
+    key = _key(tensor, tag)
+    version = tensor._version
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            if entry.version == version and entry.owner() is _owner(tensor):
+                _entries.move_to_end(key)
+                _tags[tag][1].move_to_end(key)
+                _stats["hits"] += 1
+                return entry.value
+            _drop(key, "invalidations")
+        _stats["misses"] += 1
+
+    value = pack_fn(tensor)
+    nbytes = _nbytes(value)
+    if 0 < max_bytes < nbytes or 0 < tag_max_bytes < nbytes:
+        return value
+    with _lock:
+        _drop(key)
+        _evict(nbytes)
+        _evict_tag(tag, nbytes, tag_max_bytes, tag_max_entries)
+        _entries[key] = _Entry(value, version, nbytes, _make_owner_ref(tensor, key))
+        _state["bytes"] += nbytes
+        usage = _tags.setdefault(tag, [0, OrderedDict()])
+        usage[0] += nbytes
+        usage[1][key] = None
+    return value
+
+
+def invalidate(tensor):
+    """Drop the cached layouts of all the tensors sharing the storage of `tensor`."""
+    storage_key = _storage_key(tensor)
+    with _lock:
+        for key in [k for k in _entries if k[:2] == storage_key]:
+            _drop(key, "invalidations")
+
+
+def set_prepack_cache_max_bytes(max_bytes):
+    """Change the budget of the cache, evicting entries that no longer fit.
+
+    0 means no bound & a negative budget disables the cache.
+    """
+    with _lock:
+        _state["max_bytes"] = max_bytes
+        _evict(0)
+
+
+def prepack_cache_info() -> PrepackCacheInfo:
+    """Return the statistics & the usage of the prepack cache."""
+    with _lock:
+        return PrepackCacheInfo(
+            _stats["hits"],
+            _stats["misses"],
+            _stats["evictions"],
+            _stats["invalidations"],
+            len(_entries),
+            _state["bytes"],
+            _state["max_bytes"],
+        )
+
+
+def clear_prepack_cache():
+    """Drop all the entries & reset the statistics."""
+    with _lock:
+        _entries.clear()
+        _tags.clear()
+        _state["bytes"] = 0
+        for key in _stats:
+            _stats[key] = 0
@@ -18,6 +18,7 @@ import triton.language as tl
 
 import flag_gems
 from flag_gems.runtime import torch_device_fn
+from flag_gems.utils.libentry import libentry
 
 _SPACEMIT_CPU_GENERATOR = None
 
@@ -47,22 +48,58 @@ except AttributeError:
         return x * scale
 
 
-# This function is roughly a python wrapper of CUDAGeneratorImpl::philox_cuda_state in Pytorch.
-# https://github.com/pytorch/pytorch/blob/8a4597980c2692b73f35fb3c7145eaeaf2273e77/aten/src/ATen/cuda/CUDAGeneratorImpl.cpp#L452
-# It returns the current state of the default Philox RNG in seed and offset and
-# updates the next offset by adding `increment`.
-def philox_backend_seed_offset(increment, generator=None):
+# Offset from which graph-captured random ops draw, far above the offsets of the
+# generator, so that the replays of a graph never repeat the numbers of eager ops.
+CAPTURE_PHILOX_OFFSET_BASE = 1 << 62
+
+# whether the generators of a device type expose get_offset/set_offset, which
+# read & write the Philox offset without copying the whole state
+_offset_api = {}
+# device state [seed, offset] of the graph-captured random ops, per device
+_capture_states = {}
+_capture_seeds = {}
+
+
+def _default_generator():
     global _SPACEMIT_CPU_GENERATOR
 
-    if generator is None:
-        device = torch_device_fn.current_device()
-        # SPACEMIT uses CPU generator
-        if flag_gems.vendor_name == "spacemit":
-            if _SPACEMIT_CPU_GENERATOR is None:
-                _SPACEMIT_CPU_GENERATOR = torch.Generator(device="cpu")
-            generator = _SPACEMIT_CPU_GENERATOR
-        else:
-            generator = torch_device_fn.default_generators[device]
+    # SPACEMIT uses CPU generator
+    if flag_gems.vendor_name == "spacemit":
+        if _SPACEMIT_CPU_GENERATOR is None:
+            _SPACEMIT_CPU_GENERATOR = torch.Generator(device="cpu")
+        return _SPACEMIT_CPU_GENERATOR
+    device = torch_device_fn.current_device()
+    return torch_device_fn.default_generators[device]
+
+
+def _has_offset_api(generator):
+    device_type = generator.device.type
+    supported = _offset_api.get(device_type)
+    if supported is None:
+        # kunlunxin, aipu & spacemit keep the seed & offset at the end of a
+        # backend specific state, which the offset api does not address
+        supported = flag_gems.vendor_name not in (
+            "kunlunxin",
+            "aipu",
+            "spacemit",
+        ) and hasattr(generator, "get_offset")
+        if supported:
+            try:
+                generator.get_offset()
+            except RuntimeError:
+                # the probe also fails while a graph is being captured, so the
+                # api is probed again by the next call
+                return False
+        _offset_api[device_type] = supported
+    return supported
+
+
+def _is_capturing():
+    is_capturing = getattr(torch_device_fn, "is_current_stream_capturing", None)
+    return is_capturing is not None and is_capturing()
+
+
+def _advance_state_copy(generator, increment):
     state_copy = generator.get_state()
     # TODO[kunlunxin]: we will upgrade torch version in 2025.04
     if flag_gems.vendor_name in ("kunlunxin", "aipu"):
@@ -75,13 +112,81 @@ def philox_backend_seed_offset(increment, generator=None):
         c0, c1 = state_copy.view(torch.int64)
 
     seed, offset = int(c0), int(c1)
-    increment = (increment + 3) // 4 * 4
     c1 += increment
     # get_state returns a new tensor, so it needs set_state to update the actual generator state.
     generator.set_state(state_copy)
     return seed, offset
 
 
+@libentry()
+@triton.jit(do_not_specialize=["increment"])
+def advance_capture_offset_kernel(state, offset, increment):
+    philox_offset = tl.load(state + 1)
+    tl.store(offset, philox_offset)
+    tl.store(state + 1, philox_offset + increment)
+
+
+def _capture_seed_offset(generator, increment):
+    device = generator.device
+    state = _capture_states.get(device)
+    if _is_capturing():
+        if state is None:
+            raise RuntimeError(
+                f"random op captured in a graph without an eager call on {device} "
+                "before the capture; run it eagerly first, e.g. as a warmup iteration"
+            )
+        offset = torch.empty((1,), dtype=torch.int64, device=device)
+        with torch_device_fn.device(device):
+            advance_capture_offset_kernel[(1,)](state, offset, increment)
+        return state[:1], offset
+
+    # the state is set up by eager calls, e.g. warmup iterations, since a
+    # state initialized during a capture would be reinitialized by each replay
+    seed = generator.initial_seed()
+    if state is None:
+        _capture_states[device] = torch.tensor(
+            [seed, CAPTURE_PHILOX_OFFSET_BASE], dtype=torch.int64, device=device
+        )
+    elif _capture_seeds[device] != seed:
+        state[0].fill_(seed)
+        state[1].fill_(CAPTURE_PHILOX_OFFSET_BASE)
+    _capture_seeds[device] = seed
+    return None
+
+
+# This function is roughly a python wrapper of CUDAGeneratorImpl::philox_cuda_state in Pytorch.
+# https://github.com/pytorch/pytorch/blob/8a4597980c2692b73f35fb3c7145eaeaf2273e77/aten/src/ATen/cuda/CUDAGeneratorImpl.cpp#L452
+# It returns the current state of the default Philox RNG in seed and offset and
+# updates the next offset by adding `increment`.
+def philox_backend_seed_offset(increment, generator=None, capturable=False):
+    """Return the Philox seed & offset of a random op & reserve `increment` offsets.
+
+    Generators that expose their offset are read & advanced in place, others
+    through a copy of their whole state.
+
+    With `capturable`, for kernels that read the seed & offset with
+    `load_philox_seed_offset`, an op on the default generator captured in a
+    graph gets them as device tensors instead. Each replay advances a device
+    offset & draws new numbers. The op must have been called eagerly on the
+    device before, e.g. by a warmup iteration, otherwise the capture raises a
+    RuntimeError.
+    """
+    increment = (increment + 3) // 4 * 4
+    if generator is None:
+        generator = _default_generator()
+        if capturable:
+            seed_offset = _capture_seed_offset(generator, increment)
+            if seed_offset is not None:
+                return seed_offset
+
+    if not _has_offset_api(generator):
+        return _advance_state_copy(generator, increment)
+    seed = generator.initial_seed()
+    offset = generator.get_offset()
+    generator.set_offset(offset + increment)
+    return seed, offset
+
+
 def set_philox_state(seed, offset, device=None):
     global _SPACEMIT_CPU_GENERATOR
     assert offset % 4 == 0
@@ -99,6 +204,10 @@ def set_philox_state(seed, offset, device=None):
     else:
         device = device or torch_device_fn.current_device()
         gen = torch_device_fn.default_generators[device]
+        if _has_offset_api(gen):
+            gen.manual_seed(seed)
+            gen.set_offset(offset)
+            return
         state_copy = gen.get_state()
         state_copy.view(torch.int64)[0] = seed
         state_copy.view(torch.int64)[1] = offset
@@ -106,6 +215,16 @@ def set_philox_state(seed, offset, device=None):
     return
 
 
+@triton.jit
+def load_philox_seed_offset(philox_seed, philox_offset):
+    """Return the seed & offset passed by value, or loaded from device tensors."""
+    if philox_seed.dtype.is_ptr():
+        philox_seed = tl.load(philox_seed)
+    if philox_offset.dtype.is_ptr():
+        philox_offset = tl.load(philox_offset)
+    return philox_seed.to(tl.int64), philox_offset.to(tl.int64)
+
+
 def per_thread_offset(N, num_blocks, num_warps, warp_threads=32):
     block_threads = num_warps * warp_threads
     max_threads = num_blocks * block_threads
@@ -0,0 +1,202 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Single-launch reduction of all the elements of a tensor to a scalar.
+
+`full_reduce` launches at most `FULL_REDUCE_MAX_PROGRAMS` programs which
+stride over the input and write one partial result each. The program that
+finishes last, as counted by an atomic counter, combines the partial results
+and resets the counter for the next launch on the stream. Launches captured in
+a graph use counters of their own. Inputs that fit in a single block are
+reduced by one program without partial results.
+
+The number of programs only depends on the number of elements and the partial
+results are combined in a fixed order, so the results are deterministic.
+"""
+
+import threading
+
+import torch
+import triton
+import triton.language as tl
+
+from flag_gems.runtime import torch_device_fn
+from flag_gems.utils import triton_lang_extension as ext
+from flag_gems.utils.libentry import libentry
+from flag_gems.utils.limits import get_dtype_max, get_dtype_min
+from flag_gems.utils.workspace import _is_capturing, _stream_key, workspace
+
+# elements reduced by a program per iteration
+FULL_REDUCE_BLOCK_SIZE = 4096
+# upper bound of the programs of a launch, also the number of partial results
+FULL_REDUCE_MAX_PROGRAMS = 1024
+FULL_REDUCE_OPS = ("sum", "mean", "max", "min", "all", "any")
+
+_lock = threading.Lock()
+_counters = {}
+
+
+@triton.jit
+def _combine(a, b, OP: tl.constexpr):
+    if OP == "max" or OP == "any":
+        return tl.maximum(a, b)
+    elif OP == "min" or OP == "all":
+        return tl.minimum(a, b)
+    else:
+        return a + b
+
+
+@triton.jit
+def _reduce(x, OP: tl.constexpr):
+    if OP == "max" or OP == "any":
+        return tl.max(x)
+    elif OP == "min" or OP == "all":
+        return tl.min(x)
+    else:
+        return tl.sum(x)
+
+
+@triton.jit
+def _store_result(out, result, M, OP: tl.constexpr):
+    if OP == "mean":
+        result = result / M
+    if OP == "all" or OP == "any":
+        result = result != 0
+    tl.store(out, result.to(out.dtype.element_ty))
+
+
+@libentry()
+@triton.jit
+def full_reduce_kernel(
+    inp,
+    out,
+    mid,
+    counter,
+    M,
+    BLOCK_SIZE: tl.constexpr,
+    BLOCK_MID: tl.constexpr,
+    ONE_PROGRAM: tl.constexpr,
+    OP: tl.constexpr,
+):
+    dtype = inp.dtype.element_ty
+    # sums accumulate in the dtype of the result, e.g. sum(int32, dtype=int64)
+    if OP == "sum" or OP == "mean":
+        acc_dtype = out.dtype.element_ty
+    else:
+        acc_dtype = dtype
+    if OP == "all" or OP == "any":
+        cdtype = tl.int32
+    elif tl.constexpr(acc_dtype == tl.float16) or tl.constexpr(
+        acc_dtype == tl.bfloat16
+    ):
+        cdtype = tl.float32
+    elif tl.constexpr(acc_dtype.is_int()) and tl.constexpr(
+        acc_dtype.primitive_bitwidth < 32
+    ):
+        cdtype = tl.int32
+    else:
+        cdtype = acc_dtype
+    if OP == "max":
+        init = get_dtype_min(dtype)
+    elif OP == "min":
+        init = get_dtype_max(dtype)
+    elif OP == "all":
+        init = 1
+    else:
+        init = 0
+
+    pid = ext.program_id(0)
+    num_programs = tl.num_programs(0)
+    acc = tl.full([BLOCK_SIZE], init, dtype=cdtype)
+    for start in range(pid * BLOCK_SIZE, M, num_programs * BLOCK_SIZE):
+        offset = start + tl.arange(0, BLOCK_SIZE)
+        inp_val = tl.load(inp + offset, mask=offset < M, other=init)
+        if OP == "all" or OP == "any":
+            inp_val = inp_val != 0
+        acc = _combine(acc, inp_val.to(cdtype), OP)
+    partial = _reduce(acc, OP)
+
+    if ONE_PROGRAM:
+        _store_result(out, partial, M, OP)
+    else:
+        tl.store(mid + pid, partial)
+        # release the partial result to the last program, which acquires all
+        # of them through the counter
+        done = tl.atomic_add(counter, 1, sem="acq_rel")
+        if done == num_programs - 1:
+            offset = tl.arange(0, BLOCK_MID)
+            mid_val = tl.load(mid + offset, mask=offset < num_programs, other=init)
+            _store_result(out, _reduce(mid_val.to(cdtype), OP), M, OP)
+            tl.store(counter, 0)
+
+
+def _get_counter(device):
+    if _is_capturing(device):
+        # a cached counter would be shared by the replays and the eager calls;
+        # this one is allocated from the pool of the graph and zeroed by each
+        # replay
+        return torch.zeros((1,), dtype=torch.int32, device=device)
+    key = (device, _stream_key(device))
+    counter = _counters.get(key)
+    if counter is None:
+        with _lock:
+            counter = _counters.get(key)
+            if counter is None:
+                counter = torch.zeros((1,), dtype=torch.int32, device=device)
+                _counters[key] = counter
+    return counter
+
+
+def _mid_dtype(inp_dtype, out_dtype, op):
+    # the accumulation dtype of full_reduce_kernel
+    if op in ("all", "any"):
+        return torch.int32
+    dtype = out_dtype if op in ("sum", "mean") else inp_dtype
+    if dtype in (torch.float16, torch.bfloat16):
+        return torch.float32
+    # bool & integers narrower than int32
+    if not (dtype.is_floating_point or dtype.is_complex) and dtype.itemsize < 4:
+        return torch.int32
+    return dtype
+
+
+def full_reduce(inp, out, op):
+    """Reduce all the elements of the contiguous `inp` into `out` with one launch.
+
+    `op` is one of `FULL_REDUCE_OPS`; `out` holds a single element and `inp`
+    must not be empty.
+    """
+    assert op in FULL_REDUCE_OPS, f"unsupported full reduction {op}"
+    M = inp.numel()
+    block_size = min(triton.next_power_of_2(M), FULL_REDUCE_BLOCK_SIZE)
+    num_programs = min(triton.cdiv(M, block_size), FULL_REDUCE_MAX_PROGRAMS)
+    with torch_device_fn.device(inp.device):
+        if num_programs == 1:
+            full_reduce_kernel[(1,)](inp, out, out, out, M, block_size, 1, True, op)
+            return out
+        counter = _get_counter(inp.device)
+        with workspace(inp.device) as ws:
+            mid = ws.empty((num_programs,), _mid_dtype(inp.dtype, out.dtype, op))
+            full_reduce_kernel[(num_programs,)](
+                inp,
+                out,
+                mid,
+                counter,
+                M,
+                block_size,
+                triton.next_power_of_2(num_programs),
+                False,
+                op,
+            )
+    return out
@@ -120,6 +120,57 @@ def broadcasted_stride(shape: Shape, stride: Stride, new_shape: Shape) -> Stride
     return tuple(new_stride)
 
 
+def simplify_task(
+    shape: Shape, strides: Sequence[Stride]
+) -> Tuple[Shape, Tuple[Stride, ...]]:
+    """Simplify the task space of a pointwise operation over several operands.
+
+    `strides` holds the strides of each operand over `shape`, with 0 for
+    broadcasted dimensions, and operands listed first (e.g. outputs) take
+    priority when deciding the order. Size-1 dimensions are dropped, the others
+    are permuted from the outermost to the innermost in the physical order of
+    the operands, and adjacent dimensions that are contiguous in every operand
+    are merged. Each task index still maps to the same element of every
+    operand, so the simplified task can be launched with a kernel of lower rank.
+    """
+    if volume(shape) == 0:
+        return tuple(shape), tuple(tuple(item) for item in strides)
+
+    def is_inner(a, b):
+        # whether dim `a` should be iterated inside dim `b`
+        for item in strides:
+            sa, sb = item[a], item[b]
+            if sa == 0 or sb == 0 or sa == sb:
+                continue
+            return sa < sb
+        return False
+
+    perm = []
+    for d in range(len(shape)):
+        if shape[d] == 1:
+            continue
+        pos = len(perm)
+        while pos > 0 and is_inner(perm[pos - 1], d):
+            pos -= 1
+        perm.insert(pos, d)
+
+    new_shape = []
+    new_strides = [[] for _ in strides]
+    for d in perm:
+        if new_shape and all(
+            merged[-1] == item[d] * shape[d]
+            for merged, item in zip(new_strides, strides)
+        ):
+            new_shape[-1] *= shape[d]
+            for merged, item in zip(new_strides, strides):
+                merged[-1] = item[d]
+        else:
+            new_shape.append(shape[d])
+            for merged, item in zip(new_strides, strides):
+                merged.append(item[d])
+    return tuple(new_shape), tuple(tuple(item) for item in new_strides)
+
+
 def volume(shape: Shape) -> int:
     return functools.reduce(operator.mul, shape, 1)
 
@@ -223,6 +274,44 @@ def dim_compress(inp, dims):
     return inp.permute(order).contiguous()
 
 
+def _collapse_dims(shape: Shape, stride: Stride, dims: Sequence[int]):
+    # size & stride of `dims`, listed from the outermost, as a single dimension
+    numel, inner_stride = 1, 1
+    for i, d in enumerate(reversed(dims)):
+        if i == 0:
+            inner_stride = stride[d]
+        elif stride[d] != inner_stride * numel:
+            return None
+        numel *= shape[d]
+    return numel, inner_stride
+
+
+def reduction_view(inp, dims):
+    """Describe `inp` as M rows of N elements to reduce over `dims`.
+
+    Returns `(inp, M, N, stride_m, stride_n)`, where element n of row m is at
+    `m * stride_m + n * stride_n` and rows are in the order of the output with
+    the reduced dims removed. When the kept dims and the reduced dims each
+    collapse into a single strided dimension, as for the leading dims of a
+    contiguous tensor, `inp` is returned without copying. Otherwise it is
+    copied by `dim_compress`, which makes the rows contiguous.
+    """
+    if isinstance(dims, int):
+        dims = [dims]
+    shape, stride = inp.shape, inp.stride()
+    kept = [d for d in range(inp.ndim) if d not in dims]
+    M = volume([shape[d] for d in kept])
+    N = volume([shape[d] for d in dims])
+    if M != 0 and N != 0:
+        # the order of the reduced elements does not matter
+        reduced = sorted(dims, key=lambda d: stride[d], reverse=True)
+        rows = _collapse_dims(shape, stride, [d for d in kept if shape[d] != 1])
+        cols = _collapse_dims(shape, stride, [d for d in reduced if shape[d] != 1])
+        if rows is not None and cols is not None:
+            return inp, M, N, rows[1], cols[1]
+    return dim_compress(inp, dims), M, N, N, 1
+
+
 def size_in_bytes(a):
     return a.numel() * a.element_size()
 
@@ -0,0 +1,76 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Upload of the host tables that describe the operands of grouped kernels.
+
+Ops over many tensors, e.g. cat & the foreach ops, pass the pointers & sizes
+of their operands to one launch through a table built on the host.
+`torch.tensor(rows, device=device)` copies it from pageable memory, which
+blocks the host until the stream catches up and is not permitted while the
+stream captures a graph. `upload_table` copies from pinned memory instead,
+without blocking, and keeps the pinned table alive until the copy is done:
+
+- eager copies are followed by an event, and the table is released once a
+  later upload finds the event completed;
+- each replay of a captured graph copies from the table again, so the tables
+  uploaded while capturing are kept for the lifetime of the process.
+"""
+
+import collections
+import threading
+
+import torch
+
+from flag_gems.runtime import torch_device_fn
+
+_lock = threading.Lock()
+# (event, pinned table) of the eager copies that may still read the table
+_in_flight = collections.deque()
+# pinned tables read by the copies of captured graphs
+_captured = []
+
+
+def _is_capturing():
+    is_capturing = getattr(torch_device_fn, "is_current_stream_capturing", None)
+    return is_capturing is not None and is_capturing()
+
+
+def _release_completed():
+    # the caller holds _lock; copies complete roughly in the order of uploads
+    while _in_flight and _in_flight[0][0].query():
+        _in_flight.popleft()
+
+
+def upload_table(values, device, dtype=torch.int64):
+    """Return a new tensor on `device` holding `values`, a (nested) list.
+
+    The copy does not block the host and may be captured in a graph.
+    """
+    table = torch.tensor(values, dtype=dtype)
+    device = torch.device(device)
+    if device.type == "cpu":
+        return table
+    table = table.pin_memory()
+    with torch_device_fn.device(device):
+        out = table.to(device, non_blocking=True)
+        if _is_capturing():
+            with _lock:
+                _captured.append(table)
+            return out
+        event = torch_device_fn.Event()
+        event.record()
+    with _lock:
+        _release_completed()
+        _in_flight.append((event, table))
+    return out
@@ -0,0 +1,294 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ahead-of-time generation & compilation of pointwise_dynamic kernels.
+
+`PointwiseDynamicFunction` generates the module of each task rank on its first
+use, and triton compiles the kernel on its first launch. `warmup` does both
+ahead of time for the registered functions, so that the generated code, kept in
+`FLAGGEMS_CACHE_DIR`, and the compiled kernels, kept in `TRITON_CACHE_DIR`, can
+be baked into an image::
+
+    flag_gems.warmup(ops=["add", "mul"], ranks=[1, 2], dtypes=[torch.float16])
+
+or from the command line::
+
+    flaggems-warmup --ops add mul --ranks 1 2 --dtypes float16 --workers 8
+
+Kernels are compiled with dummy operands whose sizes are multiples of 16 and
+whose innermost dimension is contiguous, which is how triton specializes the
+kernels for typical workloads.
+"""
+
+import argparse
+import importlib
+import logging
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import torch
+
+from flag_gems.utils.pointwise_dynamic import (
+    PointwiseDynamicFunction,
+    all_pointwise_dynamic_functions,
+)
+from flag_gems.utils.type_utils import type_promotion
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RANKS = (1, 2, 3, 4)
+DEFAULT_DTYPES = (torch.float16, torch.bfloat16, torch.float32)
+# size of each dimension of the dummy operands
+WARMUP_DIM_SIZE = 16
+
+_DUMMY_SCALARS = {None: 1.0, bool: False, int: 1, float: 1.0}
+
+
+@dataclass
+class WarmupResult:
+    op: str
+    rank: int
+    dtype: str
+    # "compiled": generated & compiled, "generated": generated but compilation
+    # failed (e.g. the dtype is not supported), "failed": generation failed
+    status: str
+    message: str = ""
+
+
+def _op_names(fn: PointwiseDynamicFunction) -> Tuple[str, ...]:
+    # qualified name, name of the scalar function & name of the defining module
+    scalar_fn = fn._scalar_fn
+    module = scalar_fn.__module__
+    return (
+        f"{module}.{scalar_fn.__name__}",
+        scalar_fn.__name__,
+        module.rsplit(".", 1)[-1],
+    )
+
+
+def _import_op_modules(ops: Sequence[str]) -> None:
+    # With FLAGGEMS_LAZY_IMPORT=1, the operator modules are only imported on
+    # first use; import those backing the requested ops, matched by export or
+    # module name, or the module of a qualified name.
+    import flag_gems.fused
+    import flag_gems.ops
+
+    modules = {name.rsplit(".", 1)[0] for name in ops if "." in name}
+    for package in (flag_gems.ops, flag_gems.fused):
+        for export, (module, _) in package._lazy_exports.items():
+            if export in ops or module.rsplit(".", 1)[-1] in ops:
+                modules.add(module)
+    for module in sorted(modules):
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            logger.debug("cannot import %s: %s", module, e)
+
+
+def _select_functions(
+    ops: Optional[Sequence[str]] = None,
+) -> Dict[str, PointwiseDynamicFunction]:
+    # Without `ops`, only the functions of the imported operator modules are
+    # selected: with FLAGGEMS_LAZY_IMPORT=1, importing all of them would undo
+    # the lazy import.
+    if ops is not None:
+        _import_op_modules(ops)
+    selected = {}
+    matched = set()
+    for fn in all_pointwise_dynamic_functions():
+        names = _op_names(fn)
+        if ops is None or any(name in ops for name in names):
+            selected.setdefault(names[0], fn)
+            matched.update(names)
+    if ops is not None:
+        unmatched = [name for name in ops if name not in matched]
+        if unmatched:
+            logger.warning(
+                "no pointwise_dynamic function matches %s", ", ".join(unmatched)
+            )
+    return selected
+
+
+def _dtype_name(dtype: Union[str, torch.dtype]) -> str:
+    name = str(dtype).replace("torch.", "")
+    if not isinstance(getattr(torch, name, None), torch.dtype):
+        raise ValueError(f"Unknown dtype: {dtype}")
+    return name
+
+
+def _warmup_one(
+    name: str, fn: PointwiseDynamicFunction, rank: int, dtype_name: str
+) -> WarmupResult:
+    from flag_gems import device
+    from flag_gems.runtime import torch_device_fn
+
+    try:
+        overload = fn.instantiate(rank)
+    except Exception as e:
+        return WarmupResult(name, rank, dtype_name, "failed", repr(e))
+
+    schema = fn.fx
+    dtype = getattr(torch, dtype_name)
+    shape = (WARMUP_DIM_SIZE,) * rank
+    try:
+        args = []
+        for i in range(schema.num_inputs()):
+            if schema.is_tensor(i):
+                args.append(torch.ones(shape, dtype=dtype, device=device))
+            elif schema.input_type(i) in _DUMMY_SCALARS:
+                args.append(_DUMMY_SCALARS[schema.input_type(i)])
+            else:
+                raise TypeError(
+                    f"cannot make a dummy argument of type {schema.input_type(i)}"
+                )
+        outputs = {}
+        for i in range(schema.num_output_tensors()):
+            *arg_indices, method = schema._promotion_methods[i]
+            _, out_dtype = type_promotion(
+                *(args[j] for j in arg_indices), type_promotion=method
+            )
+            outputs[f"out{i}"] = torch.empty(shape, dtype=out_dtype, device=device)
+        overload(*args, **outputs)
+        torch_device_fn.synchronize()
+    except Exception as e:
+        return WarmupResult(name, rank, dtype_name, "generated", repr(e))
+    return WarmupResult(name, rank, dtype_name, "compiled")
+
+
+def _warmup_task(task: Tuple[str, int, Tuple[str, ...]]) -> List[WarmupResult]:
+    # run in worker processes, which find the function by name after importing flag_gems
+    name, rank, dtype_names = task
+    fn = _select_functions([name]).get(name)
+    if fn is None:
+        return [
+            WarmupResult(name, rank, dtype_name, "failed", "not registered in worker")
+            for dtype_name in dtype_names
+        ]
+    return [_warmup_one(name, fn, rank, dtype_name) for dtype_name in dtype_names]
+
+
+def warmup(
+    ops: Optional[Sequence[str]] = None,
+    ranks: Sequence[int] = DEFAULT_RANKS,
+    dtypes: Sequence[Union[str, torch.dtype]] = DEFAULT_DTYPES,
+    num_workers: int = 0,
+) -> List[WarmupResult]:
+    """Generate & compile the kernels of pointwise_dynamic functions ahead of time.
+
+    Args:
+        ops: Functions to warm up, matched by the name of the scalar function
+            (e.g. "add_func"), the name of the module defining it (e.g. "add")
+            or the qualified name of the scalar function. All the registered
+            functions when None; with FLAGGEMS_LAZY_IMPORT=1, those of the
+            operator modules imported so far. The modules defining the named
+            ops are imported, and names matching no function are logged.
+        ranks: Task ranks to generate kernels for.
+        dtypes: Dtypes of the tensor operands to compile kernels for.
+        num_workers: Number of worker processes. Kernels are compiled in the
+            current process when it is less than 2.
+
+    Returns:
+        A WarmupResult for each function, rank and dtype.
+    """
+    functions = _select_functions(ops)
+    dtype_names = tuple(_dtype_name(dtype) for dtype in dtypes)
+    tasks = [(name, rank, dtype_names) for name in functions for rank in ranks]
+    logger.info(
+        "warming up %d pointwise_dynamic functions for ranks %s and dtypes %s",
+        len(functions),
+        list(ranks),
+        list(dtype_names),
+    )
+
+    if num_workers < 2:
+        results = [
+            _warmup_one(name, functions[name], rank, dtype_name)
+            for name, rank, dtype_names in tasks
+            for dtype_name in dtype_names
+        ]
+    else:
+        # spawn since the device runtime cannot be used by forked processes
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(num_workers, mp_context=context) as pool:
+            results = [
+                result
+                for task_results in pool.map(_warmup_task, tasks)
+                for result in task_results
+            ]
+
+    for result in results:
+        if result.status != "compiled":
+            logger.debug(
+                "%s rank %d %s: %s %s",
+                result.op,
+                result.rank,
+                result.dtype,
+                result.status,
+                result.message,
+            )
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate & compile the kernels of pointwise_dynamic functions ahead of time."
+    )
+    parser.add_argument(
+        "--ops",
+        nargs="+",
+        default=None,
+        help="names of functions or ops to warm up, all the registered ones by default",
+    )
+    parser.add_argument(
+        "--ranks", nargs="+", type=int, default=list(DEFAULT_RANKS), help="task ranks"
+    )
+    parser.add_argument(
+        "--dtypes",
+        nargs="+",
+        default=[_dtype_name(dtype) for dtype in DEFAULT_DTYPES],
+        help="dtypes of the tensor operands",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0, help="number of worker processes"
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="list the matched functions and exit"
+    )
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in _select_functions(args.ops):
+            print(name)
+        return 0
+
+    results = warmup(args.ops, args.ranks, args.dtypes, args.workers)
+    counts = {"compiled": 0, "generated": 0, "failed": 0}
+    for result in results:
+        counts[result.status] += 1
+        if result.status != "compiled":
+            print(
+                f"{result.status:<10}{result.op} rank {result.rank} {result.dtype}: {result.message}"
+            )
+    print(
+        f"{counts['compiled']} compiled, {counts['generated']} generated only, "
+        f"{counts['failed']} failed"
+    )
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Scratch workspace for the intermediate buffers of multi-pass kernels.
+
+Ops request their throwaway buffers, e.g. the partial results of a two-kernel
+reduction, inside a workspace scope::
+
+    with workspace(inp.device) as ws:
+        mid = ws.empty((mid_size,), dtype)
+        kernel_1[grid](inp, mid, ...)
+        kernel_2[(1,)](mid, out, ...)
+
+Buffers are carved from one arena per thread, device and stream, and are
+released when the scope exits, so that kernels enqueued later on the same
+stream may reuse the memory. Nested scopes carve after the buffers of the
+enclosing scopes. When the arena is too small, buffers fall back to
+`torch.empty` and the arena grows to a power-of-two size class on exiting the
+outermost scope, so steady-state calls do not allocate scratch memory.
+Buffers must not outlive their scope, e.g. be returned by the op. While the
+current stream is capturing a graph, buffers are allocated by `torch.empty`
+from the memory pool of the graph, and the arena is left untouched.
+
+`FLAGGEMS_WORKSPACE_MAX_BYTES` caps the size of each arena, 256 MiB by
+default; 0 disables the workspace.
+"""
+
+import contextlib
+import os
+import threading
+from collections import namedtuple
+
+import torch
+
+from flag_gems.runtime import torch_device_fn
+from flag_gems.utils.shape_utils import volume
+
+FLAGGEMS_WORKSPACE_MAX_BYTES = int(
+    os.getenv("FLAGGEMS_WORKSPACE_MAX_BYTES", str(256 << 20))
+)
+# alignment of the buffers carved from an arena
+WORKSPACE_ALIGNMENT = 256
+# smallest size class of an arena
+WORKSPACE_MIN_BYTES = 1 << 20
+
+WorkspaceInfo = namedtuple(
+    "WorkspaceInfo", ["hits", "misses", "fallbacks", "reserved_bytes", "max_bytes"]
+)
+
+_lock = threading.Lock()
+# {thread: {(device, stream id): arena}}, pruned of dead threads
+_thread_arenas = {}
+_local = threading.local()
+_stats = {"hits": 0, "misses": 0, "fallbacks": 0}
+
+
+class _Arena:
+    __slots__ = ("device", "buffer", "offset", "peak")
+
+    def __init__(self, device):
+        self.device = device
+        self.buffer = None
+        self.offset = 0
+        self.peak = 0
+
+    def capacity(self):
+        return 0 if self.buffer is None else self.buffer.numel()
+
+
+def _size_class(nbytes):
+    return max(WORKSPACE_MIN_BYTES, 1 << (nbytes - 1).bit_length())
+
+
+def _stream_key(device):
+    if device.type == "cpu" or not hasattr(torch_device_fn, "current_stream"):
+        return 0
+    return torch_device_fn.current_stream(device).stream_id
+
+
+def _is_capturing(device):
+    if device.type == "cpu":
+        return False
+    is_capturing = getattr(torch_device_fn, "is_current_stream_capturing", None)
+    return is_capturing is not None and is_capturing()
+
+
+def _count(name):
+    with _lock:
+        _stats[name] += 1
+
+
+def _prune_dead_threads():
+    # the caller holds _lock; releases the arenas of the threads that exited
+    for thread in [t for t in _thread_arenas if not t.is_alive()]:
+        del _thread_arenas[thread]
+
+
+def _get_arena(device):
+    arenas = getattr(_local, "arenas", None)
+    if arenas is None:
+        arenas = _local.arenas = {}
+        with _lock:
+            _prune_dead_threads()
+            _thread_arenas[threading.current_thread()] = arenas
+    key = (device, _stream_key(device))
+    arena = arenas.get(key)
+    if arena is None:
+        with _lock:
+            arena = arenas[key] = _Arena(device)
+    return arena
+
+
+def _all_arenas():
+    # the caller holds _lock
+    _prune_dead_threads()
+    return [arena for arenas in _thread_arenas.values() for arena in arenas.values()]
+
+
+class Workspace:
+    """Hands out scratch buffers from an arena until its scope exits."""
+
+    def __init__(self, arena, device):
+        self._arena = arena
+        self._device = device
+
+    def empty(self, shape, dtype):
+        """Return an uninitialized scratch tensor, like `torch.empty`."""
+        arena = self._arena
+        if arena is None:
+            return torch.empty(shape, dtype=dtype, device=self._device)
+        nbytes = volume(shape) * dtype.itemsize
+        start = -(-arena.offset // WORKSPACE_ALIGNMENT) * WORKSPACE_ALIGNMENT
+        end = start + nbytes
+        arena.peak = max(arena.peak, end)
+        if end > arena.capacity():
+            _count("fallbacks")
+            return torch.empty(shape, dtype=dtype, device=self._device)
+        arena.offset = end
+        _count("hits")
+        return arena.buffer[start:end].view(dtype).view(shape)
+
+
+@contextlib.contextmanager
+def workspace(device):
+    """Scope of scratch buffers on `device` & its current stream."""
+    device = torch.device(device)
+    if FLAGGEMS_WORKSPACE_MAX_BYTES <= 0 or _is_capturing(device):
+        yield Workspace(None, device)
+        return
+
+    arena = _get_arena(device)
+    offset = arena.offset
+    try:
+        yield Workspace(arena, device)
+    finally:
+        arena.offset = offset
+        if offset == 0:
+            if arena.peak > arena.capacity():
+                size = _size_class(arena.peak)
+                if size <= FLAGGEMS_WORKSPACE_MAX_BYTES:
+                    arena.buffer = torch.empty(size, dtype=torch.uint8, device=device)
+                    _count("misses")
+            arena.peak = 0
+
+
+def workspace_info() -> WorkspaceInfo:
+    """Return the usage of the scratch workspace by all the threads."""
+    with _lock:
+        return WorkspaceInfo(
+            _stats["hits"],
+            _stats["misses"],
+            _stats["fallbacks"],
+            sum(arena.capacity() for arena in _all_arenas()),
+            FLAGGEMS_WORKSPACE_MAX_BYTES,
+        )
+
+
+def clear_workspace():
+    """Release the arenas of all the threads & reset the statistics.
+
+    Only call it when no op is running, e.g. before capturing a graph.
+    """
+    with _lock:
+        for arena in _all_arenas():
+            arena.buffer = None
+            arena.peak = 0
+        for key in _stats:
+            _stats[key] = 0
@@ -0,0 +1,158 @@
+"""Multiprocessing tests for static and dynamic benchmark task dispatch.
+
+Inputs and outputs:
+    Tests launch real worker subprocesses from a fake worker script that sleeps
+    for the duration carried by each payload, and assert the rows collected by
+    the parent scheduler.
+
+Implementation:
+    The scheduler module is loaded from its source path and its worker script
+    path is replaced, so neither FlagGems nor a device backend is imported by
+    the workers. A fake CPU device runtime supplies the backend name and the
+    worker visibility variable.
+
+Limitations:
+    Timing assertions use coarse margins; the suite does not measure real
+    benchmark latency or database sharding.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCHMARK_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "src"
+    / "flag_gems"
+    / "flagtune"
+    / "collection"
+    / "scheduler.py"
+)
+
+FAKE_WORKER = """
+import argparse, json, os, sys, time
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--worker", action="store_true")
+parser.add_argument("--task-file")
+parser.add_argument("--result-file")
+parser.add_argument("--worker-id", type=int)
+parser.add_argument("--fail-fast", action="store_true")
+args, _ = parser.parse_known_args()
+if args.task_file == "-":
+    tasks = (json.loads(line) for line in iter(sys.stdin.readline, "") if line.strip())
+else:
+    tasks = json.loads(open(args.task_file).read())
+with open(args.result_file, "w") as output:
+    for task in tasks:
+        time.sleep(task["payload"]["seconds"])
+        row = {
+            "task_index": task["task_index"],
+            "worker_id": args.worker_id,
+            "device": os.environ["FAKE_VISIBLE_DEVICES"],
+        }
+        output.write(json.dumps(row) + "\\n")
+        output.flush()
+"""
+
+
+class FakeCpuRuntime:
+    """Expose each worker token through a fake CPU visibility variable."""
+
+    backend = "cpu"
+
+    @staticmethod
+    def apply_worker_visibility(environment, token):
+        environment["FAKE_VISIBLE_DEVICES"] = token
+
+
+def load_scheduler():
+    """Load the scheduler without importing the FlagGems package."""
+    spec = importlib.util.spec_from_file_location(
+        "flag_gems_scheduler_dispatch", BENCHMARK_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def scheduler(tmp_path, monkeypatch):
+    mod = load_scheduler()
+    worker = tmp_path / "fake_worker.py"
+    worker.write_text(FAKE_WORKER, encoding="utf-8")
+    monkeypatch.setattr(mod, "MODULE_PATH", worker)
+    monkeypatch.setattr(mod, "PROJECT_ROOT", tmp_path)
+    return mod
+
+
+def launch(mod, tmp_path, seconds, **kwargs):
+    tasks = [
+        mod.BenchmarkTask(index, {"seconds": s}) for index, s in enumerate(seconds)
+    ]
+    return mod._launch_workers(
+        tasks,
+        operator_config=tmp_path / "operator.yaml",
+        work_dir=tmp_path,
+        gpu_tokens=["0", "1"],
+        database_urls=["sqlite:///:memory:"] * 2,
+        dtypes=["bfloat16"],
+        warmup=0,
+        iterations=1,
+        benchmark_mode="event",
+        benchmark_retries=1,
+        tuning_run_mode="normal",
+        latency_warmup=0,
+        latency_iterations=1,
+        latency_trials=1,
+        fail_fast=False,
+        stream_worker_logs=False,
+        device_runtime=FakeCpuRuntime(),
+        **kwargs,
+    )
+
+
+def test_estimate_task_cost_uses_shape_values_and_configs(scheduler):
+    payload = {"values": {"M": 64, "N": 32, "K": 2}, "configs": [{}, {}, {}]}
+
+    assert scheduler.estimate_task_cost(payload) == 64 * 32 * 2 * 3
+    assert scheduler.estimate_task_cost({"values": {"M": 0}, "configs": None}) == 1
+    assert scheduler.estimate_task_cost([1, 2]) == 1
+
+
+def test_dynamic_dispatch_spreads_large_tasks(scheduler, tmp_path):
+    # round robin would give both large tasks to worker 0
+    seconds = [0.6, 0.05, 0.6, 0.05, 0.05, 0.05]
+    results, codes, fail_fast, _ = launch(
+        scheduler,
+        tmp_path,
+        seconds,
+        dispatch="dynamic",
+        task_cost=lambda payload: payload["seconds"],
+    )
+
+    assert codes == [0, 0] and not fail_fast
+    assert [row["task_index"] for row in results] == list(range(len(seconds)))
+    assert results[0]["worker_id"] != results[2]["worker_id"]
+    assert {row["device"] for row in results} == {"0", "1"}
+
+    static_results, *_ = launch(scheduler, tmp_path, seconds)
+    assert static_results[0]["worker_id"] == static_results[2]["worker_id"]
+
+
+def test_dynamic_dispatch_stops_at_time_budget(scheduler, tmp_path):
+    seconds = [1.0, 1.0, 0.05, 0.05, 0.05]
+    results, codes, _, _ = launch(
+        scheduler,
+        tmp_path,
+        seconds,
+        dispatch="dynamic",
+        time_budget=0.5,
+        task_cost=lambda payload: payload["seconds"],
+    )
+
+    assert codes == [0, 0]
+    assert [row["task_index"] for row in results] == [0, 1]
@@ -137,3 +137,67 @@ def test_amp_foreach_non_finite_check_and_unscale__nan(dtype):
 
     # Compare found_inf - should be 1.0 when nan is present
     utils.gems_assert_equal(res_found_inf, ref_found_inf)
+
+
+@pytest.mark.amp_foreach_non_finite_check_and_unscale_
+@pytest.mark.parametrize("dtype", PRIMARY_FLOAT_DTYPES)
+def test_amp_foreach_non_finite_check_and_unscale__many(dtype):
+    """Test _amp_foreach_non_finite_check_and_unscale_ with many tensors."""
+    inv_scale = torch.tensor(0.5, device=flag_gems.device, dtype=torch.float32)
+    found_inf = torch.tensor(0.0, device=flag_gems.device, dtype=torch.float32)
+
+    tensors = [
+        torch.randn(shape, device=flag_gems.device, dtype=dtype)
+        for shape in [(16, 32), (1,), (300, 301), (0,)] * 16
+    ]
+    tensors[-2][5, 7] = float("inf")
+
+    ref_tensors = [utils.to_reference(t.clone()) for t in tensors]
+    ref_found_inf = utils.to_reference(found_inf.clone())
+    ref_inv_scale = utils.to_reference(inv_scale.clone())
+    torch._amp_foreach_non_finite_check_and_unscale_(
+        ref_tensors, ref_found_inf, ref_inv_scale
+    )
+
+    res_tensors = [t.clone() for t in tensors]
+    res_found_inf = found_inf.clone()
+    with flag_gems.use_gems():
+        torch._amp_foreach_non_finite_check_and_unscale_(
+            res_tensors, res_found_inf, inv_scale
+        )
+
+    for inp, ref_inp in zip(res_tensors, ref_tensors):
+        utils.gems_assert_close(inp, ref_inp, dtype)
+    utils.gems_assert_equal(res_found_inf, ref_found_inf)
+
+
+@pytest.mark.amp_foreach_non_finite_check_and_unscale_
+@pytest.mark.parametrize("dtype", PRIMARY_FLOAT_DTYPES)
+def test_amp_foreach_non_finite_check_and_unscale__transposed(dtype):
+    """Test _amp_foreach_non_finite_check_and_unscale_ with transposed grads."""
+    inv_scale = torch.tensor(0.5, device=flag_gems.device, dtype=torch.float32)
+    found_inf = torch.tensor(0.0, device=flag_gems.device, dtype=torch.float32)
+
+    tensors = [
+        torch.randn(shape, device=flag_gems.device, dtype=dtype).t()
+        for shape in [(16, 32), (300, 301)] * 4
+    ]
+
+    ref_tensors = [utils.to_reference(t.clone()) for t in tensors]
+    ref_found_inf = utils.to_reference(found_inf.clone())
+    ref_inv_scale = utils.to_reference(inv_scale.clone())
+    torch._amp_foreach_non_finite_check_and_unscale_(
+        ref_tensors, ref_found_inf, ref_inv_scale
+    )
+
+    # clone keeps the transposed strides
+    res_tensors = [t.clone() for t in tensors]
+    res_found_inf = found_inf.clone()
+    with flag_gems.use_gems():
+        torch._amp_foreach_non_finite_check_and_unscale_(
+            res_tensors, res_found_inf, inv_scale
+        )
+
+    for inp, ref_inp in zip(res_tensors, ref_tensors):
+        utils.gems_assert_close(inp, ref_inp, dtype)
+    utils.gems_assert_equal(res_found_inf, ref_found_inf)
@@ -16,6 +16,7 @@ import pytest
 import torch
 
 import flag_gems
+from flag_gems.runtime import torch_device_fn
 
 from . import accuracy_utils as utils
 from . import conftest as cfg
@@ -133,3 +134,52 @@ def test_cat_out_matches_reference(dtype):
         torch.ops.aten.cat.out([a, b], dim, out=out)
 
     utils.gems_assert_close(out, ref_out, dtype)
+
+
+@pytest.mark.cat
+@pytest.mark.parametrize("num_inputs", [8, 64])
+@pytest.mark.parametrize("dim", [0, 1, -1])
+@pytest.mark.skipif(
+    flag_gems.vendor_name == "tsingmicro", reason="Issue #4131: not working"
+)
+def test_cat_many_inputs(num_inputs, dim):
+    # inputs of different sizes, some empty, with mixed dtypes cast in the copy
+    dtypes = [torch.float16, torch.float32, torch.int32]
+    inp = []
+    for i in range(num_inputs):
+        shape = [4, 3, 5]
+        shape[dim] = i % 5
+        inp.append(
+            torch.randint(-100, 100, shape, device=flag_gems.device).to(
+                dtypes[i % len(dtypes)]
+            )
+        )
+    ref_inp = [utils.to_reference(_) for _ in inp]
+    ref_out = torch.cat(ref_inp, dim)
+
+    with flag_gems.use_gems():
+        res_out = torch.cat(inp, dim)
+
+    utils.gems_assert_equal(res_out, ref_out)
+
+
+@pytest.mark.cat
+@pytest.mark.skipif(
+    not hasattr(torch_device_fn, "CUDAGraph"),
+    reason="device graphs are unavailable",
+)
+def test_cat_many_inputs_captured():
+    inp = [torch.randn((4, i % 5 + 1), device=flag_gems.device) for i in range(64)]
+    ref_out = torch.cat([utils.to_reference(_) for _ in inp], 1)
+
+    with flag_gems.use_gems():
+        # warm up the kernel before the capture
+        torch.cat(inp, 1)
+        graph = torch_device_fn.CUDAGraph()
+        with torch_device_fn.graph(graph):
+            res_out = torch.cat(inp, 1)
+
+    for tensor in inp:
+        tensor.add_(1)
+    graph.replay()
+    utils.gems_assert_equal(res_out, ref_out + 1)
@@ -0,0 +1,69 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+from flag_gems import runtime
+from flag_gems.runtime.backend import backend_utils
+
+
+def test_load_yaml_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("FLAGGEMS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(backend_utils, "FLAGGEMS_YAML_CACHE", True)
+    config_path = tmp_path / "tune_configs.yaml"
+    config_path.write_text("op:\n- META: {BLOCK: 64}\n  num_warps: 4\n")
+
+    config = backend_utils.load_yaml(config_path)
+    assert config == {"op": [{"META": {"BLOCK": 64}, "num_warps": 4}]}
+    assert backend_utils._yaml_cache_path(config_path).exists()
+    assert backend_utils.load_yaml(config_path) == config
+
+    # a modified file invalidates the cached result
+    config_path.write_text("op:\n- META: {BLOCK: 128}\n  num_warps: 8\n")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert backend_utils.load_yaml(config_path) == {
+        "op": [{"META": {"BLOCK": 128}, "num_warps": 8}]
+    }
+
+
+def test_tuned_configs_are_built_on_demand():
+    loader = runtime.config_loader
+    op_name = next(iter(loader.vendor_primitive_yaml_config))
+    configs = runtime.get_tuned_config(op_name)
+    assert op_name in loader.loaded_triton_config
+
+    # each call returns its own configs, which callers may update in place
+    again = runtime.get_tuned_config(op_name)
+    assert again is not configs
+    assert [c.all_kwargs() for c in again] == [c.all_kwargs() for c in configs]
+    if configs:
+        configs[0].kwargs["UPDATED_IN_PLACE"] = 1
+        configs[0].pre_hook = print
+        again = runtime.get_tuned_config(op_name)
+        assert "UPDATED_IN_PLACE" not in again[0].kwargs
+        assert again[0].pre_hook is not print
+
+
+def test_load_yaml_cache_skips_configs_json_cannot_hold(tmp_path, monkeypatch):
+    monkeypatch.setenv("FLAGGEMS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(backend_utils, "FLAGGEMS_YAML_CACHE", True)
+    config_path = tmp_path / "tune_configs.yaml"
+    config_path.write_text("op:\n  64: {num_warps: 4}\n")
+
+    config = backend_utils.load_yaml(config_path)
+    assert config == {"op": {64: {"num_warps": 4}}}
+    # integer keys would be read back as strings
+    assert not backend_utils._yaml_cache_path(config_path).exists()
+    assert backend_utils.load_yaml(config_path) == config
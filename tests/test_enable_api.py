@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import logging
 import re
+import threading
 
 import pytest
 import torch
@@ -213,3 +215,115 @@ def test_only_enable_default(tmp_path, monkeypatch, caplog):
     assert found_ops.issubset(
         set(include_ops)
     ), f"Found unexpected ops via default include: {found_ops - set(include_ops)}"
+
+
+@pytest.mark.skipif(
+    not hasattr(torch.library, "get_kernel"),
+    reason="persistent use_gems requires torch.library.get_kernel",
+)
+def test_use_gems_persistent(tmp_path):
+    a = torch.tensor([1.0, 2.0, 3.0], device=flag_gems.device)
+    b = torch.tensor([4.0, 5.0, 6.0], device=flag_gems.device)
+    path_file = tmp_path / "gems_persistent.log"
+    for _ in range(2):
+        with flag_gems.use_gems(
+            include=["add"], record=True, path=path_file, persistent=True
+        ):
+            torch.testing.assert_close(a + b, torch.tensor([5.0, 7.0, 9.0]).to(a))
+        # the ops are switched off, not deregistered, when exiting the context
+        torch.testing.assert_close(a + b, torch.tensor([5.0, 7.0, 9.0]).to(a))
+    assert len(flag_gems._PERSISTENT_REGISTRATIONS) >= 1
+
+    found_ops = set(re.findall(r"flag_gems\.ops\.\w+\.(\w+):", path_file.read_text()))
+    assert found_ops and found_ops <= {"add"}
+
+
+@pytest.mark.skipif(
+    not hasattr(torch.library, "get_kernel"),
+    reason="persistent use_gems requires torch.library.get_kernel",
+)
+def test_use_gems_persistent_registers_once_across_threads():
+    a = torch.tensor([1.0, 2.0, 3.0], device=flag_gems.device)
+    before = set(flag_gems._PERSISTENT_REGISTRATIONS)
+    barrier = threading.Barrier(4)
+    errors = []
+
+    def enter():
+        try:
+            barrier.wait()
+            with flag_gems.use_gems(include=["mul"], persistent=True):
+                torch.testing.assert_close(a * a, torch.tensor([1.0, 4.0, 9.0]).to(a))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=enter) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(set(flag_gems._PERSISTENT_REGISTRATIONS) - before) <= 1
+
+
+def test_use_gems_profile(tmp_path):
+    from flag_gems.runtime.op_profiler import profile
+
+    a = torch.tensor([1.0, 2.0, 3.0], device=flag_gems.device)
+    b = torch.tensor([4.0, 5.0, 6.0], device=flag_gems.device)
+    with flag_gems.use_gems(include=["add"], profile=True):
+        with profile(device_time=True) as profiler:
+            for _ in range(3):
+                _ = a + b
+            _ = a[:2] + b[:2]
+
+    rows = {row["op"]: row for row in profiler.summary()}
+    assert "add.Tensor" in rows
+    assert rows["add.Tensor"]["calls"] == 4
+    assert rows["add.Tensor"]["signatures"] == 2
+    assert sum(rows["add.Tensor"]["histogram_us"].values()) == 4
+
+    path_file = tmp_path / "profile.json"
+    profiler.dump(path_file)
+    assert json.loads(path_file.read_text())[0]["op"] == "add.Tensor"
+    assert "add.Tensor" in profiler.table()
+
+
+def test_op_profiler_amortizes_pending_events(monkeypatch):
+    import threading
+
+    from flag_gems.runtime import op_profiler
+
+    class Event:
+        queries = 0
+
+        def __init__(self, done):
+            self.done = done
+
+        def query(self):
+            Event.queries += 1
+            return self.done
+
+        def synchronize(self):
+            self.done = True
+
+        def elapsed_time(self, end):
+            return 1.0
+
+    monkeypatch.setattr(op_profiler, "MAX_PENDING_EVENTS", 16)
+    profiler = op_profiler.OpProfiler()
+
+    def run():
+        for _ in range(1000):
+            # events that never complete on their own, like those of a stalled stream
+            profiler.record("op", 1000, (), (Event(False), Event(False)))
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # each pending event is scanned an amortized constant number of times
+    assert Event.queries < 3 * 4000
+    rows = profiler.summary()
+    assert rows[0]["calls"] == 4000
+    assert rows[0]["device_total_us"] == 4000 * 1e3
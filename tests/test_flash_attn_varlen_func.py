@@ -540,3 +540,121 @@ def test_flash_attn_varlen_func_swap_qg(
         torch.testing.assert_close(
             output, ref_output, atol=2e-2, rtol=1e-2
         ), f"{torch.max(torch.abs(output - ref_output))}"
+
+
+@pytest.mark.flash_attn_varlen_func
+def test_varlen_tile_list():
+    from flag_gems.ops.flash_api import varlen_tile_list
+
+    query_lens = [300, 1, 0, 17, 64]
+    cu_query_lens = torch.tensor(
+        [0] + query_lens, dtype=torch.int32, device=device
+    ).cumsum(dim=0, dtype=torch.int32)
+    seqused_k = torch.tensor([300, 40, 5, 100, 64], dtype=torch.int32, device=device)
+    block_m = 32
+    tile_list = varlen_tile_list(
+        cu_query_lens, None, seqused_k, sum(query_lens), block_m, True, -1, 0
+    )
+    # reused until the inputs are updated
+    assert (
+        varlen_tile_list(
+            cu_query_lens, None, seqused_k, sum(query_lens), block_m, True, -1, 0
+        )
+        is tile_list
+    )
+
+    seqs, m_blocks = tile_list.tolist()
+    assert len(seqs) == -(-sum(query_lens) // block_m) + len(query_lens)
+    tiles = [(s, m) for s, m in zip(seqs, m_blocks) if s >= 0]
+    expected = [
+        (s, m)
+        for s, q_len in enumerate(query_lens)
+        for m in range(-(-q_len // block_m))
+    ]
+    assert sorted(tiles) == expected
+    # the unused tiles come last
+    assert seqs[len(tiles) :] == [-1] * (len(seqs) - len(tiles))
+
+    seqused_k.fill_(64)
+    assert (
+        varlen_tile_list(
+            cu_query_lens, None, seqused_k, sum(query_lens), block_m, True, -1, 0
+        )
+        is not tile_list
+    )
+
+
+@pytest.mark.flash_attn_varlen_func
+@pytest.mark.skipif(vendor_name == "kunlunxin", reason="Issue #2815: Not supported")
+@pytest.mark.skipif(vendor_name == "hygon", reason="Issue #2816: Not working")
+@pytest.mark.skipif(
+    flag_gems.vendor_name == "tsingmicro", reason="Issue #4131: not working"
+)
+@pytest.mark.parametrize("tile_list", [False, True])
+@torch.inference_mode()
+def test_flash_attn_varlen_func_skewed_batch(monkeypatch, tile_list):
+    from flag_gems.ops import flash_api
+
+    monkeypatch.setattr(flash_api, "FLAGGEMS_FLASH_VARLEN_TILE_LIST", tile_list)
+    # one long prefill & many decodes
+    seq_lens = [(1024, 1024)] + [(1, 200 + 7 * i) for i in range(31)]
+    num_query_heads, num_kv_heads, head_size = 8, 2, 128
+    dtype = torch.float16
+    block_size, num_blocks = 32, 2048
+
+    with torch.device(flag_gems.device):
+        utils.init_seed(1234567890)
+        query_lens = [x[0] for x in seq_lens]
+        kv_lens = [x[1] for x in seq_lens]
+        max_kv_len = max(kv_lens)
+        scale = head_size**-0.5
+        query = torch.randn(
+            sum(query_lens), num_query_heads, head_size, dtype=dtype, device=device
+        )
+        key_cache, value_cache = make_paged_kv_cache(
+            num_blocks,
+            block_size,
+            num_kv_heads,
+            head_size,
+            dtype=dtype,
+            device=device,
+            non_contiguous=False,
+        )
+        cu_query_lens = torch.tensor(
+            [0] + query_lens, dtype=torch.int32, device=device
+        ).cumsum(dim=0, dtype=torch.int32)
+        seqused_k = torch.tensor(kv_lens, dtype=torch.int32, device=device)
+        max_num_blocks_per_seq = (max_kv_len + block_size - 1) // block_size
+        block_tables = torch.randint(
+            0,
+            num_blocks,
+            (len(seq_lens), max_num_blocks_per_seq),
+            dtype=torch.int32,
+            device=device,
+        )
+
+        output = flag_gems.flash_attn_varlen_func(
+            q=query,
+            k=key_cache,
+            v=value_cache,
+            cu_seqlens_q=cu_query_lens,
+            seqused_k=seqused_k,
+            max_seqlen_q=max(query_lens),
+            max_seqlen_k=max_kv_len,
+            softmax_scale=scale,
+            causal=True,
+            window_size=(-1, -1),
+            block_table=block_tables,
+            fa_version=2,
+        )
+        ref_output = ref_paged_attn(
+            query=query,
+            key_cache=key_cache,
+            value_cache=value_cache,
+            query_lens=query_lens,
+            kv_lens=kv_lens,
+            block_tables=block_tables,
+            scale=scale,
+        )
+
+        torch.testing.assert_close(output, ref_output, atol=2e-2, rtol=1e-2)
@@ -0,0 +1,227 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+import flag_gems
+from flag_gems.runtime import torch_device_fn
+
+from . import accuracy_utils as utils
+from . import conftest as cfg
+
+# the last shape spans several chunks of multi_tensor_apply
+FOREACH_SHAPES = [(), (1,), (7, 13), (64, 64), (3, 0), (1024, 129)]
+FOREACH_NUM_TENSORS = [1, 4] if cfg.QUICK_MODE else [1, 4, 37]
+
+
+def _make_list(num_tensors, dtype, positive=False):
+    tensors = []
+    for i in range(num_tensors):
+        shape = FOREACH_SHAPES[i % len(FOREACH_SHAPES)]
+        t = torch.randn(shape, dtype=dtype, device=flag_gems.device)
+        tensors.append(t.abs() + 0.5 if positive else t)
+    return tensors
+
+
+def _to_reference(tensors):
+    return [utils.to_reference(t, True) for t in tensors]
+
+
+def _assert_close(res, ref, dtype):
+    assert len(res) == len(ref)
+    for r, e in zip(res, ref):
+        utils.gems_assert_close(r, e, dtype)
+
+
+@pytest.mark.foreach
+@pytest.mark.parametrize("num_tensors", FOREACH_NUM_TENSORS)
+@pytest.mark.parametrize("dtype", utils.FLOAT_DTYPES)
+@pytest.mark.parametrize(
+    "op, kwargs",
+    [
+        ("_foreach_add", {"alpha": 0.5}),
+        ("_foreach_sub", {"alpha": 2.0}),
+        ("_foreach_mul", {}),
+        ("_foreach_div", {}),
+    ],
+)
+def test_foreach_binary_list(op, kwargs, num_tensors, dtype):
+    x = _make_list(num_tensors, dtype)
+    y = _make_list(num_tensors, dtype, positive=True)
+    ref_out = getattr(torch, op)(_to_reference(x), _to_reference(y), **kwargs)
+    with flag_gems.use_gems():
+        res_out = getattr(torch, op)(x, y, **kwargs)
+    _assert_close(res_out, ref_out, dtype)
+
+    ref_x = _to_reference(x)
+    getattr(torch, op + "_")(ref_x, _to_reference(y), **kwargs)
+    with flag_gems.use_gems():
+        getattr(torch, op + "_")(x, y, **kwargs)
+    _assert_close(x, ref_x, dtype)
+
+
+@pytest.mark.foreach
+@pytest.mark.parametrize("num_tensors", FOREACH_NUM_TENSORS)
+@pytest.mark.parametrize("dtype", utils.FLOAT_DTYPES)
+@pytest.mark.parametrize(
+    "op", ["_foreach_add", "_foreach_sub", "_foreach_mul", "_foreach_div"]
+)
+def test_foreach_binary_scalar(op, num_tensors, dtype):
+    x = _make_list(num_tensors, dtype)
+    scalar = 1.75
+    ref_out = getattr(torch, op)(_to_reference(x), scalar)
+    with flag_gems.use_gems():
+        res_out = getattr(torch, op)(x, scalar)
+    _assert_close(res_out, ref_out, dtype)
+
+    ref_x = _to_reference(x)
+    getattr(torch, op + "_")(ref_x, scalar)
+    with flag_gems.use_gems():
+        getattr(torch, op + "_")(x, scalar)
+    _assert_close(x, ref_x, dtype)
+
+
+@pytest.mark.foreach
+@pytest.mark.parametrize("dtype", utils.FLOAT_DTYPES)
+def test_foreach_mul_tensor(dtype):
+    x = _make_list(8, dtype)
+    scale = torch.tensor(0.25, dtype=torch.float32, device=flag_gems.device)
+    ref_out = torch._foreach_mul(_to_reference(x), utils.to_reference(scale))
+    with flag_gems.use_gems():
+        res_out = torch._foreach_mul(x, scale)
+    _assert_close(res_out, ref_out, dtype)
+
+
+@pytest.mark.foreach
+@pytest.mark.parametrize("num_tensors", FOREACH_NUM_TENSORS)
+@pytest.mark.parametrize("dtype", utils.FLOAT_DTYPES)
+@pytest.mark.parametrize("op", ["_foreach_addcmul", "_foreach_addcdiv"])
+def test_foreach_ternary(op, num_tensors, dtype):
+    x = _make_list(num_tensors, dtype)
+    y = _make_list(num_tensors, dtype)
+    z = _make_list(num_tensors, dtype, positive=True)
+    ref_x = _to_reference(x)
+    getattr(torch, op + "_")(ref_x, _to_reference(y), _to_reference(z), value=-0.3)
+    with flag_gems.use_gems():
+        getattr(torch, op + "_")(x, y, z, value=-0.3)
+    _assert_close(x, ref_x, dtype)
+
+
+@pytest.mark.foreach
+@pytest.mark.parametrize("num_tensors", FOREACH_NUM_TENSORS)
+@pytest.mark.parametrize("dtype", utils.FLOAT_DTYPES)
+def test_foreach_lerp(num_tensors, dtype):
+    x = _make_list(num_tensors, dtype)
+    y = _make_list(num_tensors, dtype)
+    ref_out = torch._foreach_lerp(_to_reference(x), _to_reference(y), 0.1)
+    with flag_gems.use_gems():
+        res_out = torch._foreach_lerp(x, y, 0.1)
+    _assert_close(res_out, ref_out, dtype)
+
+
+@pytest.mark.foreach
+@pytest.mark.parametrize("num_tensors", FOREACH_NUM_TENSORS)
+@pytest.mark.parametrize("dtype", utils.FLOAT_DTYPES)
+@pytest.mark.parametrize(
+    "op", ["_foreach_sqrt", "_foreach_neg", "_foreach_reciprocal", "_foreach_exp"]
+)
+def test_foreach_unary(op, num_tensors, dtype):
+    x = _make_list(num_tensors, dtype, positive=True)
+    ref_out = getattr(torch, op)(_to_reference(x))
+    with flag_gems.use_gems():
+        res_out = getattr(torch, op)(x)
+    _assert_close(res_out, ref_out, dtype)
+
+
+@pytest.mark.foreach
+@pytest.mark.parametrize("dtype", utils.FLOAT_DTYPES)
+def test_foreach_zero_(dtype):
+    x = _make_list(8, dtype)
+    # a non-contiguous tensor is computed in a buffer & copied back
+    x.append(torch.randn(64, 32, dtype=dtype, device=flag_gems.device).t())
+    with flag_gems.use_gems():
+        torch._foreach_zero_(x)
+    for t in x:
+        utils.gems_assert_equal(t, utils.to_reference(torch.zeros_like(t)))
+
+
+@pytest.mark.foreach
+@pytest.mark.parametrize("num_tensors", FOREACH_NUM_TENSORS)
+@pytest.mark.parametrize("dtype", utils.FLOAT_DTYPES)
+@pytest.mark.parametrize("ord", [1, 2, float("inf")])
+def test_foreach_norm(ord, num_tensors, dtype):
+    x = _make_list(num_tensors, dtype)
+    ref_out = torch._foreach_norm(_to_reference(x), ord)
+    with flag_gems.use_gems():
+        res_out = torch._foreach_norm(x, ord)
+    for r, e, t in zip(res_out, ref_out, x):
+        utils.gems_assert_close(r, e, dtype, reduce_dim=max(t.numel(), 1))
+
+
+@pytest.mark.foreach
+def test_foreach_mixed_dtypes():
+    # each dtype takes its own launch, mismatched lists fall back per tensor
+    x = _make_list(4, torch.float16) + _make_list(4, torch.float32)
+    y = _make_list(4, torch.float32) + _make_list(4, torch.float32)
+    ref_x = _to_reference(x)
+    torch._foreach_add_(ref_x, 3.0)
+    ref_out = torch._foreach_mul(ref_x, _to_reference(y))
+    with flag_gems.use_gems():
+        torch._foreach_add_(x, 3.0)
+        res_out = torch._foreach_mul(x, y)
+    for r, e in zip(res_out, ref_out):
+        utils.gems_assert_close(r, e, r.dtype)
+    for r, e in zip(x, ref_x):
+        utils.gems_assert_close(r, e, r.dtype)
+
+
+@pytest.mark.foreach
+@pytest.mark.skipif(
+    not hasattr(torch_device_fn, "CUDAGraph"),
+    reason="device graphs are unavailable",
+)
+def test_foreach_captured():
+    # an optimizer-like step whose table upload is replayed by the graph
+    x = _make_list(8, torch.float32)
+    y = _make_list(8, torch.float32)
+    ref_x = _to_reference(x)
+    with flag_gems.use_gems():
+        torch._foreach_add_(x, y, alpha=0.5)
+        graph = torch_device_fn.CUDAGraph()
+        with torch_device_fn.graph(graph):
+            torch._foreach_add_(x, y, alpha=0.5)
+    torch._foreach_add_(ref_x, _to_reference(y), alpha=0.5)
+    for _ in range(2):
+        graph.replay()
+        torch._foreach_add_(ref_x, _to_reference(y), alpha=0.5)
+    _assert_close(x, ref_x, torch.float32)
+
+
+@pytest.mark.foreach
+@pytest.mark.parametrize("op", ["_foreach_add", "_foreach_mul"])
+def test_foreach_transposed(op):
+    # dense but non-contiguous tensors, e.g. transposed params or grads
+    x = [t.t() for t in _make_list(4, torch.float32) if t.dim() == 2]
+    y = [t.t() for t in _make_list(4, torch.float32) if t.dim() == 2]
+    ref_out = getattr(torch, op)(_to_reference(x), _to_reference(y))
+    with flag_gems.use_gems():
+        res_out = getattr(torch, op)(x, y)
+    _assert_close(res_out, ref_out, torch.float32)
+
+    ref_x = _to_reference(x)
+    getattr(torch, op + "_")(ref_x, _to_reference(y))
+    with flag_gems.use_gems():
+        getattr(torch, op + "_")(x, y)
+    _assert_close(x, ref_x, torch.float32)
@@ -0,0 +1,113 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import flag_gems
+from flag_gems.utils import lazy_import
+
+_LAZY_ENABLE_SCRIPT = """
+import sys
+import flag_gems
+from flag_gems.utils.warmup import _select_functions
+
+def op_modules():
+    return {m for m in sys.modules if m.startswith("flag_gems.ops.")}
+
+assert not op_modules(), op_modules()
+flag_gems.only_enable(include=["add", "mul"])
+assert {"add", "mul"} <= set(flag_gems.all_registered_ops())
+assert "abs" not in flag_gems.all_registered_ops()
+flag_gems.enable()
+assert {"add", "abs", "softmax"} <= set(flag_gems.all_registered_ops())
+assert not op_modules(), op_modules()
+_select_functions()
+assert not op_modules(), op_modules()
+# the modules backing the requested ops are imported
+selected = _select_functions(["add", "no_such_op"])
+assert op_modules() == {"flag_gems.ops.add"}, op_modules()
+assert selected and all(name.startswith("flag_gems.ops.add.") for name in selected)
+"""
+
+
+@pytest.fixture
+def lazy_package(tmp_path, monkeypatch):
+    package = tmp_path / "lazy_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        "from flag_gems.utils.lazy_import import attach_stub\n"
+        "attach_stub(__name__, __file__)\n"
+    )
+    (package / "__init__.pyi").write_text(
+        "from lazy_pkg.add import add\n"
+        "from .mul import Mul, mul as times\n"
+        '__all__ = ["add", "Mul", "times"]\n'
+    )
+    (package / "add.py").write_text("def add(a, b):\n    return a + b\n")
+    (package / "mul.py").write_text(
+        "import lazy_pkg.add\n"
+        "class Mul:\n    pass\n"
+        "def mul(a, b):\n    return a * b\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    for name in [m for m in sys.modules if m.split(".")[0] == "lazy_pkg"]:
+        del sys.modules[name]
+
+
+def test_lazy_exports_import_on_first_access(lazy_package):
+    import lazy_pkg
+
+    assert "lazy_pkg.add" not in sys.modules
+    assert lazy_pkg.times(2, 3) == 6
+    # importing lazy_pkg.mul binds the submodule lazy_pkg.add to the package
+    assert "lazy_pkg.add" in sys.modules
+    assert lazy_pkg.add(1, 2) == 3
+    assert {"add", "Mul", "times"} <= set(dir(lazy_pkg))
+    with pytest.raises(AttributeError):
+        lazy_pkg.sub
+
+
+def test_lazy_functions_are_named_trampolines(lazy_package):
+    import lazy_pkg
+
+    functions = lazy_import.lazy_functions(lazy_pkg)
+    assert set(functions) == {"add", "times"}
+    assert functions["times"].__name__ == "mul"
+    assert "lazy_pkg.mul" not in sys.modules
+    assert functions["times"](2, 3) == 6
+    assert "lazy_pkg.mul" in sys.modules
+
+
+@pytest.mark.parametrize("package", [flag_gems.ops, flag_gems.fused])
+def test_operator_stubs_declare_all_exports(package):
+    exports = package._lazy_exports
+    assert set(exports) <= set(package.__all__)
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+
+
+def test_lazy_import_registers_trampolines():
+    env = dict(os.environ, FLAGGEMS_LAZY_IMPORT="1")
+    result = subprocess.run(
+        [sys.executable, "-c", _LAZY_ENABLE_SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
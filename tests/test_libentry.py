@@ -20,7 +20,8 @@ import signal
 import sqlite3
 import threading
 import time
-from contextlib import contextmanager
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -655,6 +656,25 @@ def test_kernel_arg_apply_default():
         _ = softmax_inner_kernel_arg_apply_default(x, dim=2)
 
 
+def test_arg_binder_matches_signature_order():
+    binder = softmax_kernel_inner.binder
+    out, inp = object(), object()
+    positional = binder.bind((out, inp, 128, 256), {"DUMMY": 60})
+    keyword = binder.bind((out, inp, 128), {"N": 256, "DUMMY": 60})
+    assert positional[:3] == keyword[:3] == ([out, inp, 128, 256], [], [60])
+    assert list(positional[3]) == list(keyword[3])
+    assert list(positional[3])[:4] == ["output_ptr", "input_ptr", "M", "N"]
+
+    # constexpr defaults are applied when the argument is omitted
+    spec_args, dns_args, const_args, _ = binder.bind((out, inp, 128, 256), {})
+    assert const_args == [42]
+    assert softmax_kernel_inner.key(spec_args, dns_args, const_args)[2:] == (
+        (int, 128),
+        (int, 256),
+        42,
+    )
+
+
 class TaskThread(threading.Thread):
     def __init__(self, func, args):
         threading.Thread.__init__(self)
@@ -689,6 +709,64 @@ def test_threadsafety():
             run_two_threads()
 
 
+@pytest.mark.skipif(flag_gems.vendor_name == "kunlunxin", reason="Issue #2825")
+def test_persistent_kernel_cache(monkeypatch, tmp_path):
+    kernel_cache_mod = libentry_mod.kernel_cache
+    monkeypatch.setattr(kernel_cache_mod, "kernel_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(softmax_kernel_inner, "_persistent", True)
+    x = torch.randn((64, 96), device=flag_gems.device)
+    ref = torch.softmax(x, dim=1)
+
+    libentry_mod.clear_libentry_dispatch_cache(softmax_kernel_inner)
+    before = kernel_cache_mod.kernel_cache_info()
+    torch.testing.assert_close(softmax_inner_decorator_cascade(x, 1), ref)
+    assert kernel_cache_mod.kernel_cache_info().stores == before.stores + 1
+    assert any(tmp_path.glob("*/*.json"))
+
+    # a new process loads the kernel & its config without the jit or tuners
+    def fail(*args, **kwargs):
+        raise AssertionError("the kernel was compiled again")
+
+    libentry_mod.clear_libentry_dispatch_cache(softmax_kernel_inner)
+    monkeypatch.setattr(softmax_kernel_inner.fn, "run", fail)
+    torch.testing.assert_close(softmax_inner_decorator_cascade(x, 1), ref)
+    assert kernel_cache_mod.kernel_cache_info().hits == before.hits + 1
+
+
+@libentry()
+@triton.jit
+def scale_kernel(out_ptr, in_ptr, N, BLOCK: tl.constexpr):
+    offsets = tl.program_id(0) * BLOCK + tl.arange(0, BLOCK)
+    mask = offsets < N
+    tl.store(out_ptr + offsets, tl.load(in_ptr + offsets, mask=mask) * 2, mask=mask)
+
+
+def test_libentry_cache_eviction_and_stats():
+    libentry_mod.clear_libentry_dispatch_cache(scale_kernel)
+    scale_kernel.set_max_cache_entries(4)
+    try:
+        x = torch.randn(1024, device=flag_gems.device)
+        # each length is a specialization of N
+        for n in [100, 200, 300, 400, 500, 600, 100, 600]:
+            out = torch.empty(n, device=flag_gems.device)
+            with torch_device_fn.device(x.device):
+                scale_kernel[(triton.cdiv(n, 256),)](out, x, n, BLOCK=256)
+            torch.testing.assert_close(out, x[:n] * 2)
+
+        info = scale_kernel.cache_info()
+        assert info.name == "scale_kernel"
+        assert (info.entries, info.max_entries) == (4, 4)
+        # 100 was evicted by 500, 600 was hit
+        assert (info.misses, info.hits, info.evictions) == (7, 1, 3)
+        assert info.specializations == {"N": 4}
+        assert info in libentry_mod.libentry_cache_info()
+
+        scale_kernel.set_max_cache_entries(2)
+        assert scale_kernel.cache_info().entries == 2
+    finally:
+        scale_kernel.set_max_cache_entries(libentry_mod.FLAGGEMS_LIBENTRY_CACHE_SIZE)
+
+
 def test_hash_generation():
     @libtuner(
         configs=[
@@ -1188,6 +1266,13 @@ def test_benchmark_success_count_tracks_finite_uncached_benchmarks(monkeypatch):
             )
             return benchmark_cache
 
+        def batch(self):
+            """Run the tuning pass without deferring writes."""
+            return nullcontext()
+
+        def flush(self):
+            """Nothing is deferred, so there is nothing to commit."""
+
     class FakeFn:
         """Capture the final config chosen for the synthetic kernel launch."""
 
@@ -1329,6 +1414,161 @@ def test_benchmark_success_count_tracks_finite_uncached_benchmarks(monkeypatch):
     assert tuner._run_mode is LibTunerRunMode.NORMAL
 
 
+class CountingModel(libentry_mod.PersistantModel):
+    """Record every persistent-model call made through the in-process tiers."""
+
+    def __init__(self):
+        super().__init__()
+        self.configs = {}
+        self.benchmarks = {}
+        self.calls = []
+
+    def get_config(self, name, keys):
+        self.calls.append("get_config")
+        return self.configs.get((name, tuple(keys)))
+
+    def get_benchmark(self, name, keys, config):
+        self.calls.append("get_benchmark")
+        return self.benchmarks.get(
+            (name, tuple(keys), self.config_key(config)),
+        )
+
+    def put_config(self, name, keys, config):
+        self.calls.append("put_config")
+        self.configs.setdefault((name, tuple(keys)), config)
+
+    def put_benchmark(self, name, keys, config, benchmark):
+        self.calls.append("put_benchmark")
+        self.benchmarks.setdefault(
+            (name, tuple(keys), self.config_key(config)), benchmark
+        )
+
+    def put_many(self, configs=(), benchmarks=()):
+        self.calls.append("put_many")
+        for name, keys, config in configs:
+            self.configs.setdefault((name, tuple(keys)), config)
+        for name, keys, config, benchmark in benchmarks:
+            self.benchmarks.setdefault(
+                (name, tuple(keys), self.config_key(config)), benchmark
+            )
+
+
+def test_config_cache_memory_tier_serves_hot_and_missing_keys():
+    model = CountingModel()
+    cache = libentry_mod.ConfigCache("table", model, capacity=2)
+    config = triton.Config({"BLOCK": 16}, num_warps=4)
+
+    assert (1,) not in cache
+    assert (1,) not in cache
+    assert model.calls == ["get_config"]
+
+    cache[(1,)] = config
+    assert (1,) in cache and cache[(1,)] is config
+    assert model.calls == ["get_config", "put_config"]
+
+    # rows written by another process become visible after invalidation
+    model.configs[("table", (2,))] = config
+    assert cache.get((2,)) is config
+    model.configs[("table", (3,))] = config
+    assert cache.get((3,)) is config
+    assert len(cache.memory) == 2
+    cache.invalidate()
+    model.calls.clear()
+    assert cache.get((1,)) is config
+    assert model.calls == ["get_config"]
+
+
+def test_config_cache_preload_answers_without_database(tmp_path):
+    model = libentry_mod.SQLPersistantModel(f"sqlite:///{tmp_path / 'tuned.db'}")
+    config = triton.Config({"BLOCK": 16}, num_warps=4)
+    model.put_config("preload_table", (128, "torch.float16"), config)
+    model.put_config("preload_table", (256, "torch.float16"), config)
+    model.put_config("other_table", (128, "torch.float16"), config)
+
+    loaded = model.load_configs(["preload_table"])
+    assert set(loaded) == {"preload_table"}
+    assert set(loaded["preload_table"]) == {
+        (128, "torch.float16"),
+        (256, "torch.float16"),
+    }
+
+    counting = CountingModel()
+    cache = libentry_mod.ConfigCache("preload_table", counting, capacity=1)
+    cache.preload(loaded["preload_table"])
+    assert cache[(128, "torch.float16")].kwargs == {"BLOCK": 16}
+    assert cache[(256, "torch.float16")].num_warps == 4
+    assert (512, "torch.float16") not in cache
+    assert counting.calls == []
+
+
+def test_libcache_preloads_requested_tables_in_one_pass():
+    config = triton.Config({"BLOCK": 16}, num_warps=4)
+
+    class PreloadModel(CountingModel):
+        def load_configs(self, names):
+            self.calls.append(("load_configs", tuple(names)))
+            return {name: {(1,): config} for name in names if name != "blob"}
+
+    model = PreloadModel()
+    cache = object.__new__(libentry_mod.LibCache)
+    cache.config_cache_pool = {}
+    cache.benchmark_cache_pool = {}
+    cache.model = model
+    cache.preload_enabled = True
+    cache.pending_preload_tables = []
+
+    # the tables are requested at import, before any lookup
+    tables = [cache["a"], cache["b"], cache["blob"]]
+    assert model.calls == []
+    assert tables[1][(1,)] is config
+    assert model.calls == [("load_configs", ("a", "b", "blob"))]
+    assert tables[0][(1,)] is config
+    assert (2,) not in tables[0]
+    # tables the model cannot enumerate query the database
+    assert (1,) not in tables[2]
+    assert model.calls[1:] == ["get_config"]
+
+
+def test_write_behind_model_commits_batch_once():
+    model = CountingModel()
+    buffered = libentry_mod.WriteBehindPersistantModel(model)
+    config = triton.Config({"BLOCK": 16}, num_warps=4)
+    other = triton.Config({"BLOCK": 32}, num_warps=4)
+
+    with buffered.batch():
+        with buffered.batch():
+            buffered.put_benchmark("bench", (1,), config, (1.0, 1.0, 1.0))
+        buffered.put_benchmark("bench", (1,), other, (2.0, 2.0, 2.0))
+        buffered.put_config("table", (1,), config)
+        assert buffered.get_config("table", (1,)) is config
+        assert buffered.get_benchmark("bench", (1,), other) == (2.0, 2.0, 2.0)
+        assert "put_many" not in model.calls
+    assert model.calls.count("put_many") == 1
+    assert model.configs[("table", (1,))] is config
+    assert len(model.benchmarks) == 2
+
+    # writes outside of a batch are forwarded immediately
+    buffered.put_config("table", (2,), other)
+    assert model.calls[-1] == "put_config"
+
+
+def test_config_cache_tolerates_concurrent_eviction():
+    model = CountingModel()
+    cache = libentry_mod.ConfigCache("table", model, capacity=1)
+    config = triton.Config({"BLOCK": 16}, num_warps=4)
+    cache.set((1,), config)
+
+    # another thread evicts the key between the lookup and the LRU update
+    class EvictingDict(OrderedDict):
+        def get(self, key, default=None):
+            value = super().get(key, default)
+            self.pop(key, None)
+            return value
+
+    cache.memory = EvictingDict(cache.memory)
+    assert cache.get((1,)) is config
+
+
 def test_benchmark_key_preserves_raw_shape_and_scopes_timing_protocol(monkeypatch):
     """Keep ConfigCache bucketing while separating exact benchmark labels."""
 
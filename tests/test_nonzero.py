@@ -53,3 +53,34 @@ def test_nonzero(shape, dtype):
         res_out = torch.nonzero(inp)
 
     utils.gems_assert_equal(res_out, ref_out)
+
+
+@pytest.mark.nonzero
+@pytest.mark.parametrize("shape", NONZERO_SHAPES)
+@pytest.mark.parametrize("size_ratio", [0.5, 2.0])
+def test_nonzero_size(shape, size_ratio):
+    inp = torch.randint(-3, 3, shape, device=flag_gems.device)
+    ref_inp = utils.to_reference(inp, False)
+    ref_out = torch.nonzero(ref_inp)
+    size = int(inp.numel() * size_ratio) // 2
+    if size <= ref_out.shape[0]:
+        ref_out = ref_out[:size]
+    else:
+        pad = ref_out.new_full((size - ref_out.shape[0], ref_out.shape[1]), -1)
+        ref_out = torch.cat([ref_out, pad])
+
+    res_out = flag_gems.ops.nonzero(inp, size=size)
+
+    utils.gems_assert_equal(res_out, ref_out)
+
+
+@pytest.mark.nonzero
+@pytest.mark.parametrize("size", [0, 5])
+def test_nonzero_size_empty(size):
+    inp = torch.empty((0, 3), device=flag_gems.device)
+    ref_out = torch.full((size, 2), -1, dtype=torch.int64, device=flag_gems.device)
+
+    res_out = flag_gems.ops.nonzero(inp, size=size)
+
+    utils.gems_assert_equal(res_out, ref_out)
+    assert flag_gems.ops.nonzero(inp).shape == (0, 2)
@@ -659,6 +659,134 @@ def test_dynamic_function_with_different_stride_order(use_block_pointer):
     torch.testing.assert_close(out1, alpha * x - y)
 
 
+def test_dynamic_function_simplifies_task_space():
+    @pointwise_dynamic(
+        num_inputs=3,
+        is_tensor=[True, True, False],
+        promotion_methods=[(0, 1, "DEFAULT"), (0, 1, "DEFAULT")],
+    )
+    @triton.jit
+    def axpyaxmy(x, y, alpha):
+        return alpha * x + y, alpha * x - y
+
+    M, N, K = 4, 6, 8
+    # transposed views of contiguous tensors collapse into a rank-1 task
+    x = torch.randn([K, N, M], device=flag_gems.device).permute(2, 1, 0)
+    y = torch.randn([K, N, M], device=flag_gems.device).permute(2, 1, 0)
+    o = torch.empty([K, N, M], device=flag_gems.device).permute(2, 1, 0)
+    ndim, _, _ = axpyaxmy.prepare_args(x, y, 2.0, out0=o)
+    assert ndim == 1
+    out0, out1 = axpyaxmy(x, y, 2.0, out0=o)
+    assert out0 is o
+    torch.testing.assert_close(out0, 2.0 * x + y)
+    torch.testing.assert_close(out1, 2.0 * x - y)
+
+    # broadcasting over the leading dims keeps the inner dims merged
+    x = torch.randn([M, 1, N, K], device=flag_gems.device)
+    y = torch.randn([N, K], device=flag_gems.device)
+    ndim, _, _ = axpyaxmy.prepare_args(x, y, 2.0)
+    assert ndim == 2
+    out0, out1 = axpyaxmy(x, y, 2.0)
+    assert out0.shape == (M, 1, N, K)
+    torch.testing.assert_close(out0, 2.0 * x + y)
+    torch.testing.assert_close(out1, 2.0 * x - y)
+
+
+def test_dynamic_function_reuses_launch_plan():
+    @pointwise_dynamic(
+        num_inputs=3,
+        is_tensor=[True, True, False],
+        promotion_methods=[(0, 1, "DEFAULT"), (0, 1, "DEFAULT")],
+    )
+    @triton.jit
+    def axpyaxmy(x, y, alpha):
+        return alpha * x + y, alpha * x - y
+
+    M, N = 20, 30
+    x = torch.randn([M, N], device=flag_gems.device)
+    y = torch.randn([N, M], device=flag_gems.device).t()
+    for _ in range(3):
+        out0, out1 = axpyaxmy(x, y, 2.0)
+        torch.testing.assert_close(out0, 2.0 * x + y)
+        torch.testing.assert_close(out1, 2.0 * x - y)
+    info = axpyaxmy.plan_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+    # operands with the same metadata only substitute the pointers
+    z = torch.randn([N, M], device=flag_gems.device).t()
+    out0, _ = axpyaxmy(x, z, 2.0)
+    torch.testing.assert_close(out0, 2.0 * x + z)
+
+    # scalar types, given outputs or dtypes make new plans
+    axpyaxmy(x, y, 2)
+    o = torch.empty([M, N], device=flag_gems.device)
+    out0, out1 = axpyaxmy(x, y, 2.0, out0=o)
+    assert out0 is o
+    torch.testing.assert_close(out0, 2.0 * x + y)
+    torch.testing.assert_close(out1, 2.0 * x - y)
+    x = x.to(torch.float16)
+    out0, _ = axpyaxmy(x, y, 2.0)
+    assert out0.dtype == torch.float32
+    info = axpyaxmy.plan_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (3, 4, 4)
+
+    axpyaxmy.clear_plan_cache()
+    info = axpyaxmy.plan_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+def test_dynamic_function_plan_cache_threads():
+    @pointwise_dynamic(promotion_methods=[(0, 1, "DEFAULT")])
+    @triton.jit
+    def add_func(x, y):
+        return x + y
+
+    # a single entry, so that the threads keep evicting each other's plans
+    add_func._plan_cache_size = 1
+    inputs = [torch.randn(shape, device=flag_gems.device) for shape in [(7,), (3, 5)]]
+
+    def run(x):
+        for _ in range(200):
+            torch.testing.assert_close(add_func(x, x), x + x)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(run, x) for x in inputs * 2]:
+            future.result()
+    assert add_func.plan_cache_info().currsize <= 1
+
+
+@pytest.mark.skipif(
+    flag_gems.vendor_name == "cambricon",
+    reason="warmup only covers functions of flag_gems.utils.pointwise_dynamic",
+)
+def test_dynamic_function_warmup():
+    @pointwise_dynamic(
+        num_inputs=3,
+        is_tensor=[True, True, False],
+        dtypes=[None, None, float],
+        promotion_methods=[(0, 1, "DEFAULT")],
+    )
+    @triton.jit
+    def warmup_axpy(x, y, alpha):
+        return alpha * x + y
+
+    results = flag_gems.warmup(
+        ops=["warmup_axpy"], ranks=[1, 2], dtypes=[torch.float32, "float16"]
+    )
+    assert [(r.rank, r.dtype, r.status) for r in results] == [
+        (1, "float32", "compiled"),
+        (1, "float16", "compiled"),
+        (2, "float32", "compiled"),
+        (2, "float16", "compiled"),
+    ]
+    assert all(r.op.endswith(".warmup_axpy") for r in results)
+    key = f"2_{warmup_axpy.config.prefer_block_pointer}"
+    assert key in warmup_axpy.overloads
+
+    with pytest.raises(ValueError):
+        flag_gems.warmup(ops=["warmup_axpy"], dtypes=["not_a_dtype"])
+
+
 @pytest.mark.parametrize("use_block_pointer", USE_BLOCK_POINTER)
 def test_dynamic_function_manual_instantiation_mixing_strided_buffer_and_tensor(
     use_block_pointer,
@@ -0,0 +1,66 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+import torch
+
+import flag_gems
+from flag_gems.logging_utils import disable_precision_check, enable_precision_check
+from flag_gems.runtime import precision_register
+
+
+def off_by_one_add(x, y, alpha=1):
+    return torch.add(x, y, alpha=alpha) + 1
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_precision_check_logs_failure(tmp_path, mode):
+    path = tmp_path / "precision.log"
+    enable_precision_check(path=path, mode=mode)
+    try:
+        wrapped = precision_register._wrap_op_with_precision_check(
+            "aten::add.Tensor", off_by_one_add
+        )
+        x = torch.randn((16,), device=flag_gems.device)
+        y = torch.randn((16,), device=flag_gems.device)
+        out = wrapped(x, y)
+        # the in-place update must not change the snapshot of the async check
+        x.zero_()
+        precision_register.wait_precision_checks()
+    finally:
+        disable_precision_check()
+
+    assert out.shape == (16,)
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(records) == 1
+    assert records[0]["op"] == "aten::add.Tensor"
+    assert records[0]["max_abs_diff"] == pytest.approx(1.0)
+
+
+def test_precision_check_sample_rate(tmp_path):
+    path = tmp_path / "precision.log"
+    enable_precision_check(path=path, mode="async", sample_rate=0.0)
+    try:
+        wrapped = precision_register._wrap_op_with_precision_check(
+            "aten::add.Tensor", off_by_one_add
+        )
+        x = torch.randn((16,), device=flag_gems.device)
+        for _ in range(4):
+            wrapped(x, x)
+    finally:
+        disable_precision_check()
+
+    assert path.read_text() == ""
@@ -0,0 +1,136 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+
+import pytest
+import torch
+
+import flag_gems
+from flag_gems.utils import prepack_cache
+from flag_gems.utils.prepack_cache import (
+    clear_prepack_cache,
+    invalidate,
+    prepack,
+    prepack_cache_info,
+    set_prepack_cache_max_bytes,
+)
+
+
+@pytest.fixture
+def budget():
+    clear_prepack_cache()
+    max_bytes = prepack_cache_info().max_bytes
+    set_prepack_cache_max_bytes(1 << 20)
+    yield
+    set_prepack_cache_max_bytes(max_bytes)
+    clear_prepack_cache()
+
+
+def _transpose(t):
+    return t.t().contiguous()
+
+
+def test_prepack_reuses_until_update(budget):
+    w = torch.randn(64, 32, device=flag_gems.device)
+    packed = prepack(w, ("t",), _transpose)
+    assert prepack(w, ("t",), _transpose) is packed
+    # views of the weight share its entries
+    assert prepack(w.t(), ("c",), torch.Tensor.contiguous) is not packed
+    info = prepack_cache_info()
+    assert (info.hits, info.misses, info.entries) == (1, 2, 2)
+    assert info.bytes == 2 * w.numel() * w.element_size()
+
+    w.mul_(2)
+    repacked = prepack(w, ("t",), _transpose)
+    assert repacked is not packed
+    torch.testing.assert_close(repacked, _transpose(w))
+    assert prepack_cache_info().invalidations == 1
+
+    invalidate(w.t())
+    info = prepack_cache_info()
+    assert (info.entries, info.bytes, info.invalidations) == (0, 0, 3)
+
+
+def test_prepack_budget(budget):
+    weights = [torch.randn(256, 256, device=flag_gems.device) for _ in range(5)]
+    for w in weights:
+        prepack(w, ("t",), _transpose)
+    # 256 KiB each, the oldest entry is evicted
+    info = prepack_cache_info()
+    assert (info.entries, info.evictions) == (4, 1)
+    assert info.bytes <= info.max_bytes
+
+    big = torch.randn(1024, 512, device=flag_gems.device)
+    prepack(big, ("t",), _transpose)
+    assert prepack_cache_info().entries == 4
+
+
+def test_prepack_drops_freed_weights(budget):
+    w = torch.randn(64, 32, device=flag_gems.device)
+    prepack(w.t(), ("c",), torch.Tensor.contiguous)
+    assert prepack_cache_info().entries == 1
+    del w
+    gc.collect()
+    assert prepack_cache_info().entries == 0
+    assert prepack_cache._state["bytes"] == 0
+
+
+def test_prepack_unbounded_by_default():
+    clear_prepack_cache()
+    max_bytes = prepack_cache_info().max_bytes
+    set_prepack_cache_max_bytes(0)
+    try:
+        # packed weights of many layers all stay cached
+        weights = [torch.randn(256, 256, device=flag_gems.device) for _ in range(8)]
+        packed = [prepack(w, ("t",), _transpose) for w in weights]
+        for w, p in zip(weights, packed):
+            assert prepack(w, ("t",), _transpose) is p
+        info = prepack_cache_info()
+        assert (info.entries, info.evictions, info.hits) == (8, 0, 8)
+
+        set_prepack_cache_max_bytes(-1)
+        assert prepack_cache_info().entries == 0
+        assert prepack(weights[0], ("t",), _transpose) is not packed[0]
+        assert prepack_cache_info().entries == 0
+    finally:
+        set_prepack_cache_max_bytes(max_bytes)
+        clear_prepack_cache()
+
+
+def test_prepack_tag_bounds(budget):
+    weights = [torch.randn(64, 64, device=flag_gems.device) for _ in range(4)]
+    for w in weights:
+        prepack(w, ("t",), _transpose, tag_max_entries=2)
+    # only the entries of the bounded tag are evicted
+    prepack(weights[0], ("c",), torch.Tensor.contiguous)
+    info = prepack_cache_info()
+    assert (info.entries, info.evictions) == (3, 2)
+    prepack(weights[3], ("t",), _transpose, tag_max_entries=2)
+    assert prepack_cache_info().hits == 1
+
+    nbytes = weights[0].numel() * weights[0].element_size()
+    prepack(weights[0], ("t",), _transpose, tag_max_bytes=nbytes)
+    assert prepack_cache_info().entries == 2
+
+
+def test_prepack_checks_storage_owner(budget):
+    w = torch.randn(64, 32, device=flag_gems.device)
+    packed = prepack(w, ("t",), _transpose)
+    # a tensor owning the same storage & version, like a new weight allocated
+    # at the address of a freed one, is not served the layout of w
+    alias = w.detach()
+    assert alias._base is None and alias._version == w._version
+    assert prepack(alias, ("t",), _transpose) is not packed
+    assert prepack_cache_info().invalidations == 1
@@ -0,0 +1,112 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+import flag_gems
+from flag_gems.runtime import torch_device_fn
+from flag_gems.utils import random_utils
+
+
+def test_philox_seed_offset_advances_generator():
+    generator = torch.Generator(device=flag_gems.device)
+    generator.manual_seed(1234)
+    seed, offset = random_utils.philox_backend_seed_offset(10, generator=generator)
+    assert seed == 1234
+    # increments are rounded up to the 4 values drawn per philox call
+    _, next_offset = random_utils.philox_backend_seed_offset(4, generator=generator)
+    assert next_offset == offset + 12
+
+    generator.manual_seed(1234)
+    assert random_utils.philox_backend_seed_offset(4, generator=generator) == (
+        seed,
+        offset,
+    )
+
+
+@pytest.mark.skipif(
+    not hasattr(torch_device_fn, "CUDAGraph"), reason="device graphs are unavailable"
+)
+def test_captured_rand_draws_on_each_replay():
+    shape = (1024,)
+    with flag_gems.use_gems():
+        # the eager call sets up the device state of the captured random ops
+        torch.rand(shape, device=flag_gems.device)
+        graph = torch_device_fn.CUDAGraph()
+        with torch_device_fn.graph(graph):
+            out = torch.rand(shape, device=flag_gems.device)
+
+    draws = []
+    for _ in range(2):
+        graph.replay()
+        draws.append(out.clone())
+    assert not torch.equal(draws[0], draws[1])
+    assert ((draws[1] >= 0.0) & (draws[1] < 1.0)).all()
+
+
+@pytest.mark.skipif(
+    not hasattr(torch_device_fn, "CUDAGraph"), reason="device graphs are unavailable"
+)
+def test_captured_bernoulli_and_multinomial_draw_on_each_replay():
+    p = torch.full((1024,), 0.5, device=flag_gems.device)
+    prob = torch.rand((4, 16), device=flag_gems.device)
+    with flag_gems.use_gems():
+        torch.bernoulli(p)
+        torch.multinomial(prob, 64, replacement=True)
+        graph = torch_device_fn.CUDAGraph()
+        with torch_device_fn.graph(graph):
+            bits = torch.bernoulli(p)
+            samples = torch.multinomial(prob, 64, replacement=True)
+
+    draws = []
+    for _ in range(2):
+        graph.replay()
+        draws.append((bits.clone(), samples.clone()))
+    assert not torch.equal(draws[0][0], draws[1][0])
+    assert not torch.equal(draws[0][1], draws[1][1])
+
+
+@pytest.mark.skipif(
+    not hasattr(torch_device_fn, "CUDAGraph"), reason="device graphs are unavailable"
+)
+def test_capture_without_eager_call_raises(monkeypatch):
+    monkeypatch.setattr(random_utils, "_capture_states", {})
+    with flag_gems.use_gems():
+        graph = torch_device_fn.CUDAGraph()
+        with pytest.raises(RuntimeError, match="eager call"):
+            with torch_device_fn.graph(graph):
+                torch.rand((1024,), device=flag_gems.device)
+
+
+def test_failed_offset_api_probe_is_not_cached(monkeypatch):
+    class FlakyGenerator:
+        device = torch.device("meta")
+        calls = 0
+
+        def get_offset(self):
+            # fails like the generators of a capturing stream
+            self.calls += 1
+            if self.calls == 1:
+                raise RuntimeError("operation not permitted when stream is capturing")
+            return 0
+
+    monkeypatch.setattr(random_utils, "_offset_api", {})
+    generator = FlakyGenerator()
+    if flag_gems.vendor_name in ("kunlunxin", "aipu", "spacemit"):
+        assert not random_utils._has_offset_api(generator)
+        return
+    assert not random_utils._has_offset_api(generator)
+    assert random_utils._has_offset_api(generator)
+    assert random_utils._offset_api == {"meta": True}
@@ -0,0 +1,92 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+import flag_gems
+from flag_gems.runtime import torch_device_fn
+from flag_gems.utils import reduction_utils
+from flag_gems.utils.reduction_utils import FULL_REDUCE_BLOCK_SIZE, full_reduce
+
+from . import accuracy_utils as utils
+
+# one program, several programs & programs striding over several blocks
+NUMELS = [1, 1000, FULL_REDUCE_BLOCK_SIZE * 3 + 5, FULL_REDUCE_BLOCK_SIZE * 2048 + 7]
+REFERENCES = {
+    "sum": torch.sum,
+    "mean": torch.mean,
+    "max": torch.amax,
+    "min": torch.amin,
+}
+
+
+@pytest.mark.parametrize("numel", NUMELS)
+@pytest.mark.parametrize("op", ["sum", "mean", "max", "min"])
+@pytest.mark.parametrize("dtype", utils.FLOAT_DTYPES)
+def test_full_reduce(numel, op, dtype):
+    inp = torch.randn((numel,), dtype=dtype, device=flag_gems.device)
+    ref_out = REFERENCES[op](utils.to_reference(inp, True))
+
+    out = torch.empty([], dtype=dtype, device=flag_gems.device)
+    res_out = full_reduce(inp, out, op)
+    # the counter of the programs is reset by each launch
+    assert torch.equal(full_reduce(inp, torch.empty_like(out), op), res_out)
+
+    utils.gems_assert_close(res_out, ref_out, dtype, reduce_dim=numel)
+
+
+@pytest.mark.parametrize("numel", NUMELS)
+@pytest.mark.parametrize("op", ["all", "any"])
+def test_full_reduce_bool(numel, op):
+    inp = torch.ones((numel,), dtype=torch.bool, device=flag_gems.device)
+    out = torch.empty([], dtype=torch.bool, device=flag_gems.device)
+    inp[numel // 2] = False
+    assert full_reduce(inp, out, op).item() == (op == "any")
+    inp.fill_(op == "all")
+    assert full_reduce(inp, out, op).item() == (op == "all")
+
+
+@pytest.mark.parametrize("numel", NUMELS[2:])
+def test_full_reduce_sum_accumulates_in_result_dtype(numel):
+    inp = torch.ones((numel,), dtype=torch.bool, device=flag_gems.device)
+    with flag_gems.use_gems():
+        res_out = torch.sum(inp, dtype=torch.int64)
+    assert res_out.item() == numel
+
+    # the sum overflows int32
+    inp = torch.full((numel,), 2**30, dtype=torch.int32, device=flag_gems.device)
+    with flag_gems.use_gems():
+        res_out = torch.sum(inp, dtype=torch.int64)
+    assert res_out.dtype == torch.int64
+    assert res_out.item() == numel * 2**30
+
+
+@pytest.mark.skipif(
+    not hasattr(torch_device_fn, "CUDAGraph"), reason="device graphs are unavailable"
+)
+def test_captured_full_reduce_does_not_cache_a_counter():
+    inp = torch.ones((FULL_REDUCE_BLOCK_SIZE * 3 + 5,), device=flag_gems.device)
+    out = torch.empty([], device=flag_gems.device)
+    counters = dict(reduction_utils._counters)
+    graph = torch_device_fn.CUDAGraph()
+    with torch_device_fn.graph(graph):
+        full_reduce(inp, out, "sum")
+    assert reduction_utils._counters == counters
+
+    for _ in range(2):
+        out.zero_()
+        graph.replay()
+        assert out.item() == inp.numel()
+    assert full_reduce(inp, torch.empty_like(out), "sum").item() == inp.numel()
@@ -113,3 +113,20 @@ def test_repeat_interleave_self_tensor(shape, dim, dtype):
         res_out = torch.repeat_interleave(inp, repeats, dim)
 
     utils.gems_assert_equal(res_out, ref_out)
+
+
+@pytest.mark.repeat_interleave_tensor
+@pytest.mark.parametrize("shape", utils.UT_SHAPES_1D)
+@pytest.mark.skipif(
+    flag_gems.vendor_name == "tsingmicro",
+    reason="Issues #3861: some ops hang in op tests",
+)
+def test_repeat_interleave_tensor_output_size(shape):
+    repeats = torch.randint(0, 30, shape, dtype=torch.int32, device=flag_gems.device)
+    ref_repeats = utils.to_reference(repeats)
+    ref_out = torch.repeat_interleave(ref_repeats)
+
+    with flag_gems.use_gems():
+        res_out = torch.repeat_interleave(repeats, output_size=ref_out.numel())
+
+    utils.gems_assert_equal(res_out, ref_out)
@@ -159,3 +159,69 @@ def test_reshape_and_cache_flash(
 
         torch.testing.assert_close(key_cache.cpu(), cloned_key_cache.cpu())
         torch.testing.assert_close(value_cache.cpu(), cloned_value_cache.cpu())
+
+
+@pytest.mark.reshape_and_cache_flash
+@pytest.mark.parametrize("num_tokens", [1, 37, 2048])
+@pytest.mark.parametrize("head_size", [80, 128])
+@pytest.mark.parametrize("kv_cache_dtype", ["auto", "fp8", "fp8_e5m2"])
+@pytest.mark.skipif(
+    flag_gems.vendor_name == "tsingmicro", reason="Issue #4131: not working"
+)
+@torch.inference_mode()
+def test_reshape_and_cache_flash_tiled(num_tokens, head_size, kv_cache_dtype):
+    utils.init_seed(2025)
+    num_heads, block_size, num_blocks = 4, 16, 512
+    dtype = torch.bfloat16
+    fp8_dtype = {"fp8": torch.float8_e4m3fn, "fp8_e5m2": torch.float8_e5m2}.get(
+        kv_cache_dtype
+    )
+    cache_dtype = dtype if fp8_dtype is None else torch.uint8
+
+    slot_mapping = torch.randperm(block_size * num_blocks, device=device)
+    slot_mapping = slot_mapping[:num_tokens].clone()
+    # padded tokens, e.g. of a cuda graph, are not written
+    slot_mapping[num_tokens // 2 :: 3] = -1
+    key = torch.randn(num_tokens, num_heads, head_size, dtype=dtype, device=device)
+    value = torch.randn_like(key)
+    # the caches of vllm are views of a [2, num_blocks, ...] tensor
+    kv_cache = torch.zeros(
+        2,
+        num_blocks,
+        block_size,
+        num_heads,
+        head_size,
+        dtype=cache_dtype,
+        device=device,
+    )
+    key_cache, value_cache = kv_cache.unbind(0)
+    k_scale = torch.tensor(0.05, dtype=torch.float32, device=device)
+    v_scale = torch.tensor(0.02, dtype=torch.float32, device=device)
+
+    ref_key_cache = key_cache.clone()
+    ref_value_cache = value_cache.clone()
+    valid = slot_mapping >= 0
+    slots = slot_mapping[valid]
+    ref_key, ref_value = key[valid], value[valid]
+    if fp8_dtype is not None:
+        fp8_max = torch.finfo(fp8_dtype).max
+        ref_key = (ref_key.float() / k_scale).clamp(-fp8_max, fp8_max)
+        ref_value = (ref_value.float() / v_scale).clamp(-fp8_max, fp8_max)
+        ref_key = ref_key.to(fp8_dtype).view(torch.uint8)
+        ref_value = ref_value.to(fp8_dtype).view(torch.uint8)
+    ref_key_cache[slots // block_size, slots % block_size] = ref_key
+    ref_value_cache[slots // block_size, slots % block_size] = ref_value
+
+    flag_gems.reshape_and_cache_flash(
+        key,
+        value,
+        key_cache,
+        value_cache,
+        slot_mapping,
+        kv_cache_dtype,
+        k_scale,
+        v_scale,
+    )
+
+    utils.gems_assert_equal(key_cache, ref_key_cache)
+    utils.gems_assert_equal(value_cache, ref_value_cache)
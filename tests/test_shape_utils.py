@@ -102,6 +102,57 @@ def test_all_c_contiguous1():
     assert shape_utils.all_c_contiguous(xs)
 
 
+def test_simplify_task_collapses_contiguous_dims():
+    shape, strides = shape_utils.simplify_task((4, 5, 6), [(30, 6, 1), (30, 6, 1)])
+    assert shape == (120,)
+    assert strides == ((1,), (1,))
+
+
+def test_simplify_task_with_broadcast_and_size_one_dims():
+    shape, strides = shape_utils.simplify_task(
+        (4, 1, 5, 6), [(30, 30, 6, 1), (0, 0, 6, 1)]
+    )
+    assert shape == (4, 30)
+    assert strides == ((30, 1), (0, 1))
+
+
+def test_simplify_task_reorders_to_physical_order():
+    # both operands are transposed views of contiguous tensors
+    shape, strides = shape_utils.simplify_task((6, 5, 4), [(1, 6, 30), (1, 6, 30)])
+    assert shape == (120,)
+    assert strides == ((1,), (1,))
+
+    # the output decides the order when operands disagree
+    shape, strides = shape_utils.simplify_task((4, 6), [(6, 1), (1, 4)])
+    assert shape == (4, 6)
+    assert strides == ((6, 1), (1, 4))
+
+
+def test_simplify_task_with_zero_size():
+    shape, strides = shape_utils.simplify_task((0, 3), [(3, 1)])
+    assert shape == (0, 3)
+    assert strides == ((3, 1),)
+
+
+def test_reduction_view_without_copy():
+    x = torch.empty((4, 5, 6), device=device)
+    view, M, N, stride_m, stride_n = shape_utils.reduction_view(x, [0, 1])
+    assert view is x
+    assert (M, N, stride_m, stride_n) == (6, 20, 1, 6)
+
+    view, M, N, stride_m, stride_n = shape_utils.reduction_view(x[:, :, :3], [1, 0])
+    assert view.data_ptr() == x.data_ptr()
+    assert (M, N, stride_m, stride_n) == (3, 20, 1, 6)
+
+
+def test_reduction_view_with_copy():
+    x = torch.randn((4, 5, 6), device=device)
+    view, M, N, stride_m, stride_n = shape_utils.reduction_view(x, [0, 2])
+    assert view.is_contiguous()
+    assert (M, N, stride_m, stride_n) == (5, 24, 24, 1)
+    torch.testing.assert_close(view.sum(dim=(1, 2)), x.sum(dim=(0, 2)))
+
+
 def test_heuristics_for_tile_size():
     shape = (10000, 10000, 10)
     tile_sizes = (1, 256, 16)
@@ -61,3 +61,21 @@ def test_stack(shape, dim, dtype):
         res_out = torch.stack(inp, dim)
 
     utils.gems_assert_equal(res_out, ref_out)
+
+
+@pytest.mark.stack
+@pytest.mark.parametrize("num_inputs", [8, 64])
+@pytest.mark.parametrize("dim", [0, 1, -1])
+def test_stack_many_inputs(num_inputs, dim):
+    dtypes = [torch.float16, torch.float32]
+    inp = [
+        torch.randn((4, 3, 5), device=flag_gems.device).to(dtypes[i % len(dtypes)])
+        for i in range(num_inputs)
+    ]
+    ref_inp = [utils.to_reference(_) for _ in inp]
+    ref_out = torch.stack(ref_inp, dim)
+
+    with flag_gems.use_gems():
+        res_out = torch.stack(inp, dim)
+
+    utils.gems_assert_equal(res_out, ref_out)
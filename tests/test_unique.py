@@ -121,3 +121,25 @@ def test_unique2(shape, dtype, sorted, return_inverse, return_counts):
             assert res_out.numel() == ref_out.numel()
 
     utils.gems_assert_equal(res_out, ref_out)
+
+
+@pytest.mark.unique2
+@pytest.mark.parametrize("shape", [(1024,), (4, 1001)])
+@pytest.mark.parametrize("dtype", utils.INT_DTYPES)
+@pytest.mark.parametrize("size", [8, 32])
+def test_unique2_size(shape, dtype, size):
+    inp = torch.randint(-10, 10, shape, device=flag_gems.device).to(dtype)
+    ref_inp = utils.to_reference(inp, False)
+    ref_out, ref_inverse, ref_counts = torch.unique(
+        ref_inp, sorted=True, return_inverse=True, return_counts=True
+    )
+    num_unique = min(size, ref_out.numel())
+
+    res_out, res_inverse, res_counts = flag_gems.ops._unique2(
+        inp, sorted=True, return_inverse=True, return_counts=True, size=size
+    )
+
+    assert res_out.numel() == size and res_counts.numel() == size
+    utils.gems_assert_equal(res_out[:num_unique], ref_out[:num_unique])
+    utils.gems_assert_equal(res_counts[:num_unique], ref_counts[:num_unique])
+    utils.gems_assert_equal(res_inverse, ref_inverse)
@@ -0,0 +1,100 @@
+# Copyright 2026 FlagOS Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import pytest
+import torch
+
+import flag_gems
+from flag_gems.runtime import torch_device_fn
+from flag_gems.utils import workspace as workspace_utils
+from flag_gems.utils.workspace import clear_workspace, workspace, workspace_info
+
+pytestmark = pytest.mark.skipif(
+    workspace_utils.FLAGGEMS_WORKSPACE_MAX_BYTES <= 0,
+    reason="the scratch workspace is disabled",
+)
+
+
+def test_workspace_reuses_arena():
+    clear_workspace()
+    for _ in range(3):
+        with workspace(flag_gems.device) as ws:
+            a = ws.empty((1000,), torch.float32)
+            with workspace(flag_gems.device) as inner:
+                b = inner.empty((10, 10), torch.float16)
+            c = ws.empty((3,), torch.int64)
+    assert a.shape == (1000,) and b.shape == (10, 10) and c.shape == (3,)
+    # the arena grows after the first call, which falls back to torch.empty
+    info = workspace_info()
+    assert (info.hits, info.misses, info.fallbacks) == (6, 1, 3)
+    assert info.reserved_bytes >= workspace_utils.WORKSPACE_MIN_BYTES
+
+    with workspace(flag_gems.device) as ws:
+        a = ws.empty((1000,), torch.float32)
+        with workspace(flag_gems.device) as inner:
+            b = inner.empty((1000,), torch.float32)
+        # buffers of the outer scope are not reused by nested scopes
+        assert b.data_ptr() >= a.data_ptr() + a.numel() * a.element_size()
+        c = ws.empty((1000,), torch.float32)
+        assert c.data_ptr() == b.data_ptr()
+
+    clear_workspace()
+    assert workspace_info()[:4] == (0, 0, 0, 0)
+
+
+def test_workspace_reductions():
+    clear_workspace()
+    x = torch.randn((1 << 16,), dtype=torch.float32, device=flag_gems.device)
+    results = [flag_gems.sum(x) for _ in range(3)]
+    for result in results:
+        torch.testing.assert_close(result, results[0])
+    assert workspace_info().hits >= 2
+
+
+def test_workspace_releases_arenas_of_exited_threads():
+    clear_workspace()
+
+    def run():
+        for _ in range(2):
+            with workspace(flag_gems.device) as ws:
+                ws.empty((1000,), torch.float32)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    assert workspace_info().misses == 1
+    # the arena of the exited thread is released
+    assert workspace_info().reserved_bytes == 0
+    clear_workspace()
+
+
+@pytest.mark.skipif(
+    not hasattr(torch_device_fn, "CUDAGraph"), reason="device graphs are unavailable"
+)
+def test_workspace_bypassed_while_capturing():
+    clear_workspace()
+    x = torch.randn((1 << 16,), dtype=torch.float32, device=flag_gems.device)
+    expected = flag_gems.sum(x)
+    reserved = workspace_info().reserved_bytes
+    graph = torch_device_fn.CUDAGraph()
+    with torch_device_fn.graph(graph):
+        out = flag_gems.sum(x)
+    # the captured buffers do not alias the arena, which eager calls keep using
+    flag_gems.sum(torch.zeros_like(x))
+    graph.replay()
+    torch.testing.assert_close(out, expected)
+    assert workspace_info().reserved_bytes == reserved
+    clear_workspace()